@@ -5,58 +5,371 @@ GitHub Classroom 自动评分脚本
 
 import os
 import sys
+import csv
 import json
+import time
+import functools
+import multiprocessing
+import argparse
+import hashlib
+import importlib.util
+import importlib.metadata
+import signal
+import tempfile
+import re
 import subprocess
-import pytest
 from pathlib import Path
 
+try:
+    import resource
+except ImportError:  # Windows 没有 resource 模块，此时不限制资源
+    resource = None
+
 # 定义测试文件和分数
 TESTS = [
-    {"name": "实验一: 二次方程求根稳定性", "file": "Exp1_QuadraticRoots/tests/test_quadratic.py", "points": 10},
-    {"name": "实验二: 数值微分误差权衡", "file": "Exp2_NumericalDifferentiation/tests/test_differentiation.py", "points": 10},
-    {"name": "实验三: 数值积分收敛性", "file": "Exp3_NumericalIntegration/tests/test_integration.py", "points": 10},
-    {"name": "实验四: 调和级数求和顺序", "file": "Exp4_HarmonicSum/tests/test_harmonic_sum.py", "points": 10},
-    {"name": "实验五: 不同形式级数比较", "file": "Exp5_SeriesComparison/tests/test_series_sum.py", "points": 10},
-    {"name": "实验六: 贝塞尔函数递推稳定性", "file": "Exp6_BesselRecursion/tests/test_bessel_recursion.py", "points": 10}
+    {"name": "实验一: 二次方程求根稳定性", "file": "Exp1_QuadraticRoots/tests/test_quadratic.py", "points": 10,
+     "perf": "Exp1_QuadraticRoots/tests/test_quadratic_performance.py"},
+    {"name": "实验二: 数值微分误差权衡", "file": "Exp2_NumericalDifferentiation/tests/test_differentiation.py", "points": 10,
+     "perf": "Exp2_NumericalDifferentiation/tests/test_differentiation_performance.py"},
+    {"name": "实验三: 数值积分收敛性", "file": "Exp3_NumericalIntegration/tests/test_integration.py", "points": 10,
+     "perf": "Exp3_NumericalIntegration/tests/test_integration_performance.py"},
+    {"name": "实验四: 调和级数求和顺序", "file": "Exp4_HarmonicSum/tests/test_harmonic_sum.py", "points": 10,
+     "perf": "Exp4_HarmonicSum/tests/test_harmonic_sum_performance.py"},
+    {"name": "实验五: 不同形式级数比较", "file": "Exp5_SeriesComparison/tests/test_series_sum.py", "points": 10,
+     "perf": "Exp5_SeriesComparison/tests/test_series_sum_performance.py"},
+    {"name": "实验六: 贝塞尔函数递推稳定性", "file": "Exp6_BesselRecursion/tests/test_bessel_recursion.py", "points": 10,
+     "perf": "Exp6_BesselRecursion/tests/test_bessel_recursion_performance.py"}
 ]
 
-def run_test(test_file):
-    """运行单个测试文件并返回结果"""
-    result = pytest.main(["-v", test_file])
-    return result == 0  # 0表示测试通过
+# 性能测试的参考耗时（按机器校准），由评分程序而不是学生仓库提供
+PERF_BASELINES = ".perf_baselines.json"
 
-def calculate_score():
-    """计算总分并生成结果报告"""
+# 记录上次依赖检查结果的本地文件
+STAMP_FILE = ".autograding_stamp.json"
+
+
+# 依赖项的包名，其后是可选的 extras、版本约束和环境标记
+REQUIREMENT_NAME = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^\]]*\])?\s*([^;]*)")
+
+
+def parse_requirements(path):
+    """读取 requirements 文件中的依赖项
+
+    评分脚本在安装依赖之前运行，因此不依赖 packaging 等第三方包，
+    只解析出包名和版本约束字符串（如 ">=1.20,<2"）。
+
+    返回:
+        list: (name, specifier) 元组的列表
+    """
+    requirements = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line and not line.startswith("-"):
+                match = REQUIREMENT_NAME.match(line)
+                requirements.append((match.group(1), match.group(3).strip()))
+    return requirements
+
+
+def installed_versions(requirements):
+    """查询已安装的版本，未安装的记为 None"""
+    versions = {}
+    for name, _ in requirements:
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+def specifier_contains(specifier, version):
+    """版本是否满足版本约束
+
+    没有约束时只要已安装即可；有约束时用 packaging 判断，
+    packaging 未安装则视为不满足，交给 pip 检查。
+    """
+    if not specifier:
+        return True
+    try:
+        from packaging.specifiers import SpecifierSet
+    except ImportError:
+        return False
+    return SpecifierSet(specifier).contains(version, prereleases=True)
+
+
+def requirements_satisfied(requirements, versions):
+    """已安装的版本是否满足全部依赖的版本约束"""
+    return all(versions[name] is not None and specifier_contains(specifier, versions[name])
+               for name, specifier in requirements)
+
+
+def install_dependencies(requirements_file="requirements.txt", stamp_file=STAMP_FILE):
+    """仅在依赖缺失或版本不符时才调用 pip 安装
+
+    requirements 文件的哈希与当时的已安装版本记录在 stamp_file 中；
+    两者都未变化时直接跳过，整个检查只读取本地元数据，无需联网。
+
+    返回:
+        bool: 是否实际执行了安装
+    """
+    with open(requirements_file, "rb") as f:
+        req_hash = hashlib.sha256(f.read()).hexdigest()
+    requirements = parse_requirements(requirements_file)
+    versions = installed_versions(requirements)
+    stamp = {"requirements_hash": req_hash, "installed": versions}
+
+    try:
+        with open(stamp_file) as f:
+            if json.load(f) == stamp and requirements_satisfied(requirements, versions):
+                print("依赖未变化，跳过安装")
+                return False
+    except (OSError, ValueError):
+        pass
+
+    installed = False
+    if not requirements_satisfied(requirements, versions):
+        print("安装依赖...")
+        subprocess.run([sys.executable, "-m", "pip", "install", "-r", requirements_file])
+        importlib.invalidate_caches()
+        stamp["installed"] = installed_versions(requirements)
+        installed = True
+    else:
+        print("依赖已满足，跳过安装")
+
+    if requirements_satisfied(requirements, stamp["installed"]):
+        with open(stamp_file, "w") as f:
+            json.dump(stamp, f, indent=2)
+    return installed
+
+
+# 资源限制的默认值
+TEST_TIMEOUT = 60           # 单个测试的墙钟时间（秒）
+EXPERIMENT_TIMEOUT = 300    # 每个实验所有测试的累计时间（秒）
+MEMORY_LIMIT_MB = 2048      # 测试进程的地址空间上限（MB）
+
+# 默认不扣分，只在结果中标注性能不达标
+PERF_PENALTY = 0.0
+
+# 同一测试多个阶段的结果取最严重者
+SEVERITY = {"skipped": 0, "passed": 1, "failed": 2, "timeout": 3}
+
+
+def test_files(perf=False):
+    """需要运行的测试文件；perf 为 True 时包括各实验的性能测试"""
+    files = [test["file"] for test in TESTS]
+    if perf:
+        files += [test["perf"] for test in TESTS]
+    return files
+
+
+def perf_env(perf):
+    """启用性能测试所需的环境变量（由根目录 conftest.py 读取）"""
+    if not perf:
+        return {}
+    return {"GRADING_PERF": "1",
+            "GRADING_PERF_BASELINES": str(Path(__file__).resolve().parent.parent.parent / PERF_BASELINES)}
+
+
+def worker_args(workers):
+    """返回多进程并行所需的 pytest 参数（需要安装 pytest-xdist）"""
+    if workers is None or str(workers) == "1":
+        return []
+    if importlib.util.find_spec("xdist") is None:
+        print("未安装 pytest-xdist，改为单进程运行")
+        return []
+    return ["-n", str(workers)]
+
+
+def limit_resources(memory_mb, cpu_seconds):
+    """返回在子进程中设置资源上限的函数（用于 preexec_fn）"""
+    def apply():
+        if resource is None:
+            return
+        memory = int(memory_mb) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+        cpu = int(cpu_seconds)
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 5))
+    return apply
+
+
+def read_results(path):
+    """读取插件写出的结果文件
+
+    返回:
+        tuple: (collected, outcomes, collect_errors)
+    """
+    collected, outcomes, collect_errors = [], {}, []
+    if not os.path.exists(path):
+        return collected, outcomes, collect_errors
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # 子进程被强制结束时最后一行可能不完整
+            nodeid = record["nodeid"]
+            if record["event"] == "collected":
+                collected.append(nodeid)
+            elif record["event"] == "collect_error":
+                collect_errors.append(nodeid)
+            elif SEVERITY[record["outcome"]] >= SEVERITY.get(outcomes.get(nodeid), -1):
+                outcomes[nodeid] = record["outcome"]
+    return collected, outcomes, collect_errors
+
+
+def run_tests(test_files, workers=None, test_timeout=TEST_TIMEOUT,
+              experiment_timeout=EXPERIMENT_TIMEOUT, memory_mb=MEMORY_LIMIT_MB, perf=False):
+    """在一个受资源限制的子进程中，用同一个 pytest 会话运行全部测试文件
+
+    单个测试和单个实验的时间预算由 grading_plugin 在测试进程内检查；
+    整个会话超过全部实验预算之和时，父进程结束子进程，
+    尚未得到结果的测试记为超时。
+
+    返回:
+        tuple: (collected, outcomes, collect_errors, timed_out)
+            collected: 收集到的测试节点 ID 列表
+            outcomes: 节点 ID -> "passed" / "failed" / "timeout" / "skipped"
+            collect_errors: 收集失败的文件节点 ID 列表
+            timed_out: 整个会话是否因超时被结束
+    """
+    session_timeout = experiment_timeout * len(test_files) + 30
+    fd, results_path = tempfile.mkstemp(suffix=".jsonl", prefix="grading_")
+    os.close(fd)
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(Path(__file__).parent),
+                                                     env.get("PYTHONPATH")]))
+    env["GRADING_RESULTS"] = results_path
+    env["GRADING_TEST_TIMEOUT"] = str(test_timeout)
+    env["GRADING_EXPERIMENT_TIMEOUT"] = str(experiment_timeout)
+    env.update(perf_env(perf))
+    # 多线程 BLAS 会预留大量虚拟内存，在 RLIMIT_AS 下容易误判为内存超限
+    env.setdefault("OPENBLAS_NUM_THREADS", "1")
+    env.setdefault("OMP_NUM_THREADS", "1")
+
+    cmd = [sys.executable, "-m", "pytest", "-q", "-p", "grading_plugin",
+           *worker_args(workers), *test_files]
+    preexec = limit_resources(memory_mb, session_timeout) if resource is not None else None
+    proc = subprocess.Popen(cmd, env=env, preexec_fn=preexec, start_new_session=True)
+    timed_out = False
+    try:
+        proc.wait(timeout=session_timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        os.killpg(proc.pid, signal.SIGKILL)
+        proc.wait()
+
+    collected, outcomes, collect_errors = read_results(results_path)
+    os.remove(results_path)
+    for nodeid in collected:
+        if nodeid not in outcomes:
+            outcomes[nodeid] = "timeout" if timed_out else "failed"
+    return collected, outcomes, collect_errors, timed_out
+
+
+def outcomes_for(test_file, collected, outcomes):
+    """某个测试文件中各测试的结果"""
+    return [outcomes[nodeid] for nodeid in collected if nodeid.split("::")[0] == test_file]
+
+
+def score_file(test, collected, outcomes, collect_errors, timed_out=False,
+               perf_penalty=PERF_PENALTY):
+    """按测试函数给部分分
+
+    若运行了该实验的性能测试且有不达标的，结果中标注 perf_failed_tests，
+    得分乘以 (1 - perf_penalty)。
+
+    返回:
+        dict: 该实验的评分结果
+    """
+    test_file, points = test["file"], test["points"]
+    file_outcomes = outcomes_for(test_file, collected, outcomes)
+    passed = sum(outcome in ("passed", "skipped") for outcome in file_outcomes)
+    timeouts = sum(outcome == "timeout" for outcome in file_outcomes)
+    total = len(file_outcomes)
+
+    if test_file in collect_errors:
+        status, earned = "失败", 0
+    elif total == 0:
+        # 会话超时时，未收集到测试通常是导入学生代码时卡住
+        status, earned = ("超时" if timed_out else "失败"), 0
+    elif timeouts:
+        status, earned = "超时", points * passed / total
+    elif passed == total:
+        status, earned = "通过", points
+    elif passed:
+        status, earned = "部分通过", points * passed / total
+    else:
+        status, earned = "失败", 0
+
+    result = {
+        "status": status,
+        "points": round(earned, 2),
+        "passed_tests": passed,
+        "timeout_tests": timeouts,
+        "total_tests": total,
+    }
+
+    perf_outcomes = outcomes_for(test.get("perf"), collected, outcomes)
+    if perf_outcomes:
+        perf_failed = sum(outcome in ("failed", "timeout") for outcome in perf_outcomes)
+        result["perf_failed_tests"] = perf_failed
+        if perf_failed:
+            result["points"] = round(earned * (1 - perf_penalty), 2)
+    return result
+
+
+def summarize(collected, outcomes, collect_errors, timed_out=False, verbose=True,
+              perf_penalty=PERF_PENALTY):
+    """按 TESTS 汇总各实验的得分
+
+    返回:
+        tuple: (results, total_points, max_points)
+    """
     total_points = 0
     max_points = 0
     results = []
 
     for test in TESTS:
         max_points += test["points"]
-        test_file = test["file"]
         test_name = test["name"]
         points = test["points"]
-        
-        print(f"运行测试: {test_name}")
-        passed = run_test(test_file)
-        
-        if passed:
-            total_points += points
-            status = "通过"
-        else:
-            status = "失败"
-        
-        results.append({
-            "name": test_name,
-            "status": status,
-            "points": points if passed else 0,
-            "max_points": points
-        })
-        
-        print(f"  状态: {status}")
-        print(f"  得分: {points if passed else 0}/{points}")
-        print()
-    
+
+        result = score_file(test, collected, outcomes, collect_errors, timed_out, perf_penalty)
+        total_points += result["points"]
+        results.append({"name": test_name, **result, "max_points": points})
+
+        if verbose:
+            print(f"测试: {test_name}")
+            print(f"  状态: {result['status']} ({result['passed_tests']}/{result['total_tests']} 个测试通过)")
+            if result.get("perf_failed_tests"):
+                print(f"  性能: {result['perf_failed_tests']} 个性能测试不达标")
+            print(f"  得分: {result['points']}/{points}")
+            print()
+
+    return results, round(total_points, 2), max_points
+
+
+def write_score(path, results, total_points, max_points):
+    """写出分数 JSON 文件"""
+    score_data = {
+        "score": total_points,
+        "max_score": max_points,
+        "tests": results
+    }
+
+    with open(path, 'w') as f:
+        json.dump(score_data, f, indent=2)
+
+
+def calculate_score(workers=None, test_timeout=TEST_TIMEOUT,
+                    experiment_timeout=EXPERIMENT_TIMEOUT, memory_mb=MEMORY_LIMIT_MB,
+                    perf=False, perf_penalty=PERF_PENALTY):
+    """计算总分并生成结果报告"""
+    results, total_points, max_points = summarize(
+        *run_tests(test_files(perf), workers, test_timeout, experiment_timeout, memory_mb, perf),
+        perf_penalty=perf_penalty)
+
     # 生成总结
     print(f"总分: {total_points}/{max_points}")
     
@@ -67,33 +380,238 @@ def calculate_score():
         f.write("|------|------|------|\n")
         
         for result in results:
-            f.write(f"| {result['name']} | {result['status']} | {result['points']}/{result['max_points']} |\n")
+            status = result['status']
+            if result.get('perf_failed_tests'):
+                status += "，性能不达标"
+            f.write(f"| {result['name']} | {status} | {result['points']}/{result['max_points']} |\n")
         
         f.write(f"\n## 总分: {total_points}/{max_points}\n")
     
     # 生成分数JSON文件
-    score_data = {
-        "score": total_points,
-        "max_score": max_points,
-        "tests": results
-    }
-    
-    with open('score.json', 'w') as f:
-        json.dump(score_data, f, indent=2)
+    write_score('score.json', results, total_points, max_points)
     
     return total_points, max_points
 
+
+# ---------------------------------------------------------------------------
+# 批量评分：常驻的预热进程池，每个进程依次在进程内为多份作业运行 pytest
+# ---------------------------------------------------------------------------
+
+# 工作进程预先导入的模块
+WARM_MODULES = ["numpy", "scipy", "scipy.special", "scipy.integrate", "pytest"]
+
+# 预热完成时的模块表和搜索路径，每份作业评完后恢复到这个状态
+_baseline_modules = None
+_baseline_path = None
+
+
+def warm_worker(memory_mb=MEMORY_LIMIT_MB):
+    """进程池的初始化函数：设置资源上限并预先导入常用模块"""
+    global _baseline_modules, _baseline_path
+    # 必须在导入 numpy 之前设置，否则 BLAS 线程池已经建好
+    os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    if resource is not None:
+        memory = int(memory_mb) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+    sys.path.insert(0, str(Path(__file__).parent))
+    _baseline_modules = set(sys.modules)
+    _baseline_path = list(sys.path)
+
+
+def reset_worker():
+    """删除上一份作业导入的模块，使下一份作业在全新的命名空间中运行
+
+    各作业的学生模块和测试模块同名（如 harmonic_sum），不清理的话
+    后面的作业会直接用到前一份作业的代码。grading_plugin 也在清理之列，
+    它记录的实验累计时间随之归零。
+    """
+    for name in set(sys.modules) - _baseline_modules:
+        del sys.modules[name]
+    sys.path[:] = _baseline_path
+    importlib.invalidate_caches()
+
+
+def grade_submission(submission, test_timeout=TEST_TIMEOUT,
+                     experiment_timeout=EXPERIMENT_TIMEOUT, perf=False, perf_penalty=PERF_PENALTY):
+    """在当前（已预热的）工作进程内评一份作业
+
+    pytest 的输出写入作业目录下的 grading.log，分数写入作业目录下的 score.json。
+
+    返回:
+        dict: 该作业的评分结果
+    """
+    fd, results_path = tempfile.mkstemp(suffix=".jsonl", prefix="grading_")
+    os.close(fd)
+    os.environ["GRADING_RESULTS"] = results_path
+    os.environ["GRADING_TEST_TIMEOUT"] = str(test_timeout)
+    os.environ["GRADING_EXPERIMENT_TIMEOUT"] = str(experiment_timeout)
+    os.environ.update(perf_env(perf))
+
+    cwd = os.getcwd()
+    saved_fds = (os.dup(1), os.dup(2))
+    try:
+        os.chdir(submission)
+        with open("grading.log", "w") as log:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(log.fileno(), 1)
+            os.dup2(log.fileno(), 2)
+            import pytest
+            pytest.main(["-q", "-p", "grading_plugin", "-p", "no:cacheprovider",
+                         "--rootdir", ".", *test_files(perf)])
+            sys.stdout.flush()
+            sys.stderr.flush()
+    finally:
+        os.dup2(saved_fds[0], 1)
+        os.dup2(saved_fds[1], 2)
+        for saved in saved_fds:
+            os.close(saved)
+        os.chdir(cwd)
+        reset_worker()
+
+    collected, outcomes, collect_errors = read_results(results_path)
+    os.remove(results_path)
+    for nodeid in collected:
+        outcomes.setdefault(nodeid, "failed")
+    results, total_points, max_points = summarize(collected, outcomes, collect_errors,
+                                                  verbose=False, perf_penalty=perf_penalty)
+    write_score(os.path.join(submission, "score.json"), results, total_points, max_points)
+    return {"student": os.path.basename(submission), "score": total_points,
+            "max_score": max_points, "tests": results}
+
+
+def grade_one(submission, test_timeout, experiment_timeout, perf, perf_penalty):
+    """工作进程中评一份作业；评分程序自身出错时记为 0 分而不中断整批"""
+    try:
+        return grade_submission(submission, test_timeout, experiment_timeout, perf, perf_penalty)
+    except Exception as exc:
+        print(f"{os.path.basename(submission)}: 评分出错 {exc!r}", file=sys.stderr)
+        return zero_submission(submission, "失败")
+
+
+def zero_submission(submission, status):
+    """各实验都记为 0 分、状态为 status 的评分结果，同时写入作业目录下的 score.json"""
+    results = [{"name": test["name"], "status": status, "points": 0, "passed_tests": 0,
+                "timeout_tests": 0, "total_tests": 0, "max_points": test["points"]}
+               for test in TESTS]
+    max_points = sum(test["points"] for test in TESTS)
+    write_score(os.path.join(submission, "score.json"), results, 0, max_points)
+    return {"student": os.path.basename(submission), "score": 0,
+            "max_score": max_points, "tests": results}
+
+
+def timed_out_submission(submission):
+    """未能在期限内评完的作业记为全部超时"""
+    return zero_submission(submission, "超时")
+
+
+def write_batch_report(records, output_prefix):
+    """写出所有学生的汇总表（CSV 和 JSON）"""
+    with open(f"{output_prefix}.json", "w") as f:
+        json.dump(records, f, indent=2, ensure_ascii=False)
+
+    with open(f"{output_prefix}.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["student", *[test["name"] for test in TESTS], "score", "max_score"])
+        for record in records:
+            writer.writerow([record["student"],
+                             *[result["points"] for result in record["tests"]],
+                             record["score"], record["max_score"]])
+
+
+def grade_batch(submissions_dir, workers=None, test_timeout=TEST_TIMEOUT,
+                experiment_timeout=EXPERIMENT_TIMEOUT, memory_mb=MEMORY_LIMIT_MB,
+                output_prefix="batch_scores", perf=False, perf_penalty=PERF_PENALTY):
+    """批量评分 submissions_dir 下的每个子目录（每个子目录是一份学生作业）
+
+    作业分发给常驻的预热进程池，省去每份作业的解释器启动、numpy/scipy 导入和
+    pip 检查。单个测试和实验的时间限制与单份评分相同；若整批超过预期时长，
+    未返回结果的作业记为超时，卡住的工作进程在最后被强制结束。
+
+    返回:
+        list: 按学生名排序的评分结果
+    """
+    submissions = sorted(str(path.resolve()) for path in Path(submissions_dir).iterdir()
+                         if path.is_dir() and not path.name.startswith("."))
+    workers = int(workers) if workers not in (None, "auto") else os.cpu_count()
+    workers = max(1, min(workers, len(submissions)))
+    per_submission = experiment_timeout * len(TESTS) + 30
+    deadline = time.monotonic() + per_submission * -(-len(submissions) // workers) + 30
+
+    records = {}
+    pool = multiprocessing.Pool(workers, initializer=warm_worker, initargs=(memory_mb,))
+    try:
+        pending = pool.imap_unordered(
+            functools.partial(grade_one, test_timeout=test_timeout,
+                              experiment_timeout=experiment_timeout,
+                              perf=perf, perf_penalty=perf_penalty), submissions)
+        for _ in submissions:
+            try:
+                record = pending.next(timeout=max(deadline - time.monotonic(), 0))
+            except multiprocessing.TimeoutError:
+                break
+            records[record["student"]] = record
+            print(f"{record['student']}: {record['score']}/{record['max_score']}")
+    finally:
+        pool.terminate()
+        pool.join()
+
+    for submission in submissions:
+        if os.path.basename(submission) not in records:
+            print(f"{os.path.basename(submission)}: 超时")
+            records[os.path.basename(submission)] = timed_out_submission(submission)
+
+    ordered = [records[name] for name in sorted(records)]
+    write_batch_report(ordered, output_prefix)
+    return ordered
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GitHub Classroom 自动评分")
+    parser.add_argument("-n", "--workers", default=None,
+                        help="并行进程数；单份评分时需要 pytest-xdist，可用 auto")
+    parser.add_argument("--test-timeout", type=float, default=TEST_TIMEOUT,
+                        help="单个测试的时间上限（秒）")
+    parser.add_argument("--experiment-timeout", type=float, default=EXPERIMENT_TIMEOUT,
+                        help="每个实验的时间上限（秒）")
+    parser.add_argument("--memory-mb", type=int, default=MEMORY_LIMIT_MB,
+                        help="测试进程的内存上限（MB）")
+    parser.add_argument("--perf", action="store_true",
+                        help="同时运行性能测试，与参考解比较耗时")
+    parser.add_argument("--perf-penalty", type=float, default=PERF_PENALTY,
+                        help="性能测试不达标时扣除该实验得分的比例（默认只标注不扣分）")
+    parser.add_argument("--batch", metavar="DIR", default=None,
+                        help="批量评分：DIR 下每个子目录是一份学生作业")
+    parser.add_argument("--output", default="batch_scores",
+                        help="批量评分汇总表的文件名前缀（生成 .csv 和 .json）")
+    args = parser.parse_args()
+    if args.batch:
+        # 在切换工作目录之前解析为绝对路径
+        args.batch = os.path.abspath(args.batch)
+        args.output = os.path.abspath(args.output)
+
     # 确保工作目录是项目根目录
     os.chdir(Path(__file__).parent.parent.parent)
     
-    # 安装依赖
-    print("安装依赖...")
-    subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+    # 安装依赖（已满足时跳过）
+    install_dependencies()
     
+    if args.batch:
+        print("\n开始批量评分...\n")
+        grade_batch(args.batch, args.workers, args.test_timeout,
+                    args.experiment_timeout, args.memory_mb, args.output,
+                    args.perf, args.perf_penalty)
+        sys.exit(0)
+
     # 运行测试并计算分数
     print("\n开始评分...\n")
-    total, maximum = calculate_score()
+    total, maximum = calculate_score(args.workers, args.test_timeout,
+                                     args.experiment_timeout, args.memory_mb,
+                                     args.perf, args.perf_penalty)
     
     # 设置GitHub Actions输出变量
     if 'GITHUB_OUTPUT' in os.environ:
@@ -0,0 +1,122 @@
+"""
+自动评分用的 pytest 插件
+
+通过 ``-p grading_plugin`` 加载（pytest-xdist 的工作进程也会加载），由环境变量配置:
+
+    GRADING_TEST_TIMEOUT        单个测试的墙钟时间上限（秒）
+    GRADING_EXPERIMENT_TIMEOUT  同一测试文件内所有测试的累计时间上限（秒）
+    GRADING_RESULTS             结果文件路径，每个测试结果写一行 JSON
+"""
+
+import os
+import json
+import time
+import signal
+import pytest
+
+
+class TestTimeout(Exception):
+    """测试超出时间预算"""
+
+    __test__ = False
+
+
+_experiment_elapsed = {}
+_config = None
+
+
+def _limit(name):
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+
+def _experiment(nodeid):
+    return nodeid.split("::")[0]
+
+
+def _on_alarm(signum, frame):
+    raise TestTimeout(f"单个测试运行超过 {os.environ['GRADING_TEST_TIMEOUT']} 秒")
+
+
+def pytest_runtest_setup(item):
+    budget = _limit("GRADING_EXPERIMENT_TIMEOUT")
+    if budget is not None and _experiment_elapsed.get(_experiment(item.nodeid), 0.0) > budget:
+        raise TestTimeout(f"所在实验的测试累计运行超过 {budget} 秒")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    timeout = _limit("GRADING_TEST_TIMEOUT")
+    use_alarm = timeout is not None and hasattr(signal, "setitimer")
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+        key = _experiment(item.nodeid)
+        _experiment_elapsed[key] = _experiment_elapsed.get(key, 0.0) + time.perf_counter() - start
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.excinfo is not None and call.excinfo.errisinstance(TestTimeout):
+        # user_properties 会随报告一起从 xdist 工作进程传回主进程
+        outcome.get_result().user_properties.append(("timeout", True))
+
+
+def _write(config, record):
+    path = os.environ.get("GRADING_RESULTS")
+    # xdist 工作进程的报告会转发给主进程，只在主进程写结果
+    if not path or hasattr(config, "workerinput"):
+        return
+    with open(path, "a") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def pytest_collectreport(report):
+    if report.failed:
+        _write(_config, {"event": "collect_error", "nodeid": report.nodeid})
+
+
+def pytest_collection_finish(session):
+    for item in session.items:
+        _write(session.config, {"event": "collected", "nodeid": item.nodeid})
+
+
+def pytest_runtest_logreport(report):
+    if report.failed:
+        timeout = any(name == "timeout" for name, _ in report.user_properties)
+        outcome = "timeout" if timeout else "failed"
+    elif report.when == "call":
+        outcome = "passed"
+    elif report.skipped:
+        outcome = "skipped"
+    else:
+        return
+    _write(_config, {"event": "report", "nodeid": report.nodeid, "outcome": outcome})
+
+
+class _XdistCollection:
+    """使用 pytest-xdist 时主进程不收集测试，改从工作进程的收集结果记录"""
+
+    def __init__(self):
+        self.seen = set()
+
+    def pytest_xdist_node_collection_finished(self, node, ids):
+        for nodeid in ids:
+            if nodeid not in self.seen:
+                self.seen.add(nodeid)
+                _write(_config, {"event": "collected", "nodeid": nodeid})
+
+
+def pytest_configure(config):
+    global _config
+    _config = config
+    if config.pluginmanager.hasplugin("xdist") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(_XdistCollection())
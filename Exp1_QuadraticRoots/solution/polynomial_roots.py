@@ -0,0 +1,506 @@
+import time
+from decimal import Decimal, localcontext
+import numpy as np
+
+# companion_roots 每次求特征值的最多多项式个数，限制 (批量, n, n) 数组的内存
+DEFAULT_CHUNK_SIZE = 2**16
+# 三、四次闭式公式可接受的相对残差（后向误差），超过时改用伴随矩阵
+CLOSED_FORM_TOLERANCE = 64 * np.finfo(float).eps
+
+
+def _as_batch(*coefficients):
+    """把各系数转换为形状相同的一维复数数组，并检查首项系数非零"""
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(c)) for c in coefficients])
+    arrays = [np.asarray(c, dtype=complex).ravel() for c in arrays]
+    if np.any(arrays[0] == 0):
+        raise ValueError("首项系数不能为 0（次数会降低）")
+    return arrays
+
+
+def _stable_sign(b, sqrt_discriminant):
+    """选择 ±1，使 b ± sqrt_discriminant 的模最大（避免相近数相减）"""
+    return np.where(np.real(np.conj(b) * sqrt_discriminant) >= 0, 1.0, -1.0)
+
+
+def quadratic_roots(a, b, c):
+    """批量求解 ax^2 + bx + c = 0（系数可以为实数或复数）
+
+    与 stable_formula 相同，先用不会发生抵消的一侧算出 q = -(b ± sqrt(Δ))/2，
+    再由 x1 = q/a、x2 = c/q 得到两个根；Δ < 0 时给出共轭复根。
+
+    参数:
+        a, b, c (array_like): 系数，可以广播为相同形状
+
+    返回:
+        numpy.ndarray: 形状为 (批量, 2) 的复数根
+    """
+    a, b, c = _as_batch(a, b, c)
+    sqrt_discriminant = np.sqrt(b * b - 4 * a * c)
+    q = -0.5 * (b + _stable_sign(b, sqrt_discriminant) * sqrt_discriminant)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x2 = np.where(q != 0, c / np.where(q != 0, q, 1), 0)
+    return np.stack([q / a, x2], axis=1)
+
+
+def _vieta_refine(roots, constant):
+    """用根之积（Vieta 定理）重新计算模最小的根
+
+    模最小的根最容易因抵消损失相对精度；与 stable_formula 中 x2 = c/q 的做法
+    相同，由其余根的乘积与常数项相除得到它。
+
+    参数:
+        roots (numpy.ndarray): 形状为 (批量, n) 的根
+        constant (numpy.ndarray): 首一多项式的常数项，即 (-1)^n 乘以根之积
+    """
+    n = roots.shape[1]
+    rows = np.arange(len(roots))
+    smallest = np.argmin(np.abs(roots), axis=1)
+    others = roots.copy()
+    others[rows, smallest] = 1
+    product = np.prod(others, axis=1)
+    refined = (-1) ** n * constant / np.where(product != 0, product, 1)
+    roots[rows, smallest] = np.where(product != 0, refined, roots[rows, smallest])
+    return roots
+
+
+def newton_polish(coeffs, roots, steps=2):
+    """对一批根做若干步 Newton 迭代，只接受使 |p(x)| 减小的步
+
+    闭式公式中的平移 x = y - A/n 会在模较小的根上引入抵消，结果只有部分有效
+    数字；只要根已在正确的吸引域内，几步 Newton 迭代即可恢复。落在错误位置的根
+    无法由此修正，由 _solve_closed_form 的残差检查回退到伴随矩阵。
+
+    参数:
+        coeffs (numpy.ndarray): 形状为 (批量, n+1) 的系数，按降幂排列
+        roots (numpy.ndarray): 形状为 (批量, n) 的根
+        steps (int): 迭代步数
+
+    返回:
+        numpy.ndarray: 修正后的根
+    """
+    coeffs = coeffs[:, None, :]
+    for _ in range(steps):
+        value = np.zeros_like(roots)
+        derivative = np.zeros_like(roots)
+        for k in range(coeffs.shape[2]):
+            derivative = derivative * roots + value
+            value = value * roots + coeffs[:, :, k]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            candidate = roots - value / derivative
+            new_value = np.zeros_like(roots)
+            for k in range(coeffs.shape[2]):
+                new_value = new_value * candidate + coeffs[:, :, k]
+        better = np.isfinite(candidate) & (np.abs(new_value) < np.abs(value))
+        roots = np.where(better, candidate, roots)
+    return roots
+
+
+# Veltkamp 拆分常数 2^27 + 1：把双精度数拆成两个 26 位的部分，乘积没有舍入
+_SPLITTER = 2.0**27 + 1
+# 单位舍入 u = eps / 2
+_UNIT_ROUNDOFF = np.finfo(float).eps / 2
+
+
+def _gamma(k):
+    """舍入误差分析中的 γ_k = k u / (1 - k u)"""
+    return k * _UNIT_ROUNDOFF / (1 - k * _UNIT_ROUNDOFF)
+
+
+def two_sum(a, b):
+    """无误差加法：返回 (s, e)，s = fl(a + b)，a + b = s + e 精确成立"""
+    s = a + b
+    z = s - a
+    return s, (a - (s - z)) + (b - z)
+
+
+def two_product(a, b):
+    """无误差乘法：返回 (p, e)，p = fl(a * b)，a * b = p + e 精确成立（Dekker 算法）"""
+    p = a * b
+    c = _SPLITTER * a
+    a_high = c - (c - a)
+    a_low = a - a_high
+    c = _SPLITTER * b
+    b_high = c - (c - b)
+    b_low = b - b_high
+    return p, a_low * b_low - (((p - a_high * b_high) - a_low * b_high) - a_high * b_low)
+
+
+def compensated_horner(coeffs, x):
+    """补偿 Horner 算法求多项式的值（实系数、实自变量）
+
+    Horner 每一步的乘法和加法误差由 two_product / two_sum 精确得到，再用同样的
+    Horner 递推累加修正项。结果如同以两倍工作精度计算后舍入，误差不超过
+    u|p(x)| + γ_{2n}^2 p̃(|x|)，其中 p̃ 为系数取绝对值的多项式。
+
+    参数:
+        coeffs (numpy.ndarray): 形状为 (批量, n+1) 的系数，按降幂排列
+        x (numpy.ndarray): 形状为 (批量, m) 的自变量
+
+    返回:
+        numpy.ndarray: 形状为 (批量, m) 的多项式值
+    """
+    coeffs = coeffs[:, None, :]
+    s = np.broadcast_to(coeffs[:, :, 0], x.shape)
+    correction = np.zeros_like(x)
+    for k in range(1, coeffs.shape[2]):
+        p, product_error = two_product(s, x)
+        s, sum_error = two_sum(p, coeffs[:, :, k])
+        correction = correction * x + (product_error + sum_error)
+    return s + correction
+
+
+def _horner(coeffs, x):
+    """普通 Horner 算法，同时返回多项式值、导数和 p̃(|x|)"""
+    coeffs = coeffs[:, None, :]
+    value = np.zeros_like(x)
+    derivative = np.zeros_like(x)
+    magnitude = np.zeros(x.shape)
+    for k in range(coeffs.shape[2]):
+        derivative = derivative * x + value
+        value = value * x + coeffs[:, :, k]
+        magnitude = magnitude * np.abs(x) + np.abs(coeffs[:, :, k])
+    return value, derivative, magnitude
+
+
+def polish_roots(coeffs, roots, steps=2):
+    """以补偿 Horner 求残差，对一批根做 Newton 迭代，并给出误差界
+
+    实系数多项式的实根用 compensated_horner 计算 p(x)，Newton 修正量因此几乎
+    不受求值舍入误差影响，一两步即可接近正确舍入；复根用普通的复数 Horner。
+    导数只影响收敛速度，用普通 Horner 计算。
+
+    误差界取 2 (|p(x)| + E) / |p'(x)|，E 为求 p(x) 的舍入误差上界（实根为
+    u|p(x)| + γ_{2n}^2 p̃(|x|)，复根为 γ_{2n} p̃(|x|)）。对单根它是到最近精确根
+    距离的一阶估计的两倍；重根或近重根处 p'(x) ≈ 0，误差界相应变大（或为 inf）。
+
+    参数:
+        coeffs (array_like): 形状为 (批量, n+1) 的实系数，按降幂排列
+        roots (array_like): 形状为 (批量, n) 的根（实数或复数）
+        steps (int): Newton 迭代步数
+
+    返回:
+        tuple: (roots, bound)
+            roots: 修正后的根，实根仍为实数
+            bound: 与 roots 形状相同的误差界
+    """
+    coeffs = np.atleast_2d(np.asarray(coeffs, dtype=float))
+    roots = np.asarray(roots)
+    n = coeffs.shape[1] - 1
+    real = np.imag(roots) == 0
+    x_real = np.where(real, np.real(roots), 0.0)
+    x_complex = np.asarray(roots, dtype=complex)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # 最后一轮只计算残差和误差界，不再修正
+        for step in range(steps + 1):
+            residual_real = compensated_horner(coeffs, x_real)
+            _, derivative_real, magnitude_real = _horner(coeffs, x_real)
+            residual_complex, derivative_complex, magnitude_complex = _horner(coeffs, x_complex)
+            if step == steps:
+                break
+            step_real = residual_real / derivative_real
+            step_complex = residual_complex / derivative_complex
+            x_real = np.where(np.isfinite(step_real), x_real - step_real, x_real)
+            x_complex = np.where(np.isfinite(step_complex), x_complex - step_complex, x_complex)
+
+        error_real = _UNIT_ROUNDOFF * np.abs(residual_real) + _gamma(2 * n)**2 * magnitude_real
+        error_complex = _gamma(2 * n) * magnitude_complex
+        bound_real = 2 * (np.abs(residual_real) + error_real) / np.abs(derivative_real)
+        bound_complex = 2 * (np.abs(residual_complex) + error_complex) / np.abs(derivative_complex)
+
+    polished = np.where(real, x_real, x_complex)
+    if np.all(real):
+        polished = np.real(polished)
+    bound = np.where(real, bound_real, bound_complex)
+    return polished, np.where(np.isnan(bound), np.inf, bound)
+
+
+def refined_quadratic_roots(a, b, c, steps=2):
+    """批量求解实系数二次方程，并用 polish_roots 修正根、给出误差界
+
+    参数:
+        a, b, c (array_like): 实系数，可以广播为相同形状
+        steps (int): Newton 迭代步数
+
+    返回:
+        tuple: (roots, bound)，形状均为 (批量, 2)；实根以实部虚部为 0 的复数给出
+    """
+    a, b, c = [np.ravel(x) for x in np.broadcast_arrays(*map(np.atleast_1d, (a, b, c)))]
+    roots = quadratic_roots(a, b, c)
+    real = np.imag(roots) == 0
+    polished, bound = polish_roots(np.stack([a, b, c], axis=1).astype(float), roots, steps)
+    return np.where(real, polished, roots).astype(complex), bound
+
+
+def reference_quadratic_roots(a, b, c, digits=60):
+    """用 decimal 高精度计算实根并正确舍入为双精度（用于检验，逐个计算）
+
+    参数:
+        a, b, c (float): 实系数，要求判别式非负
+
+    返回:
+        tuple: (x1, x2)，x1 <= x2
+    """
+    with localcontext() as ctx:
+        ctx.prec = digits
+        a, b, c = Decimal(float(a)), Decimal(float(b)), Decimal(float(c))
+        sqrt_discriminant = (b * b - 4 * a * c).sqrt()
+        roots = sorted([(-b - sqrt_discriminant) / (2 * a), (-b + sqrt_discriminant) / (2 * a)])
+    return tuple(float(x) for x in roots)
+
+
+def _balance(coeffs):
+    """令 x = s y 并化为首一多项式，使根的几何平均模接近 1
+
+    s 取 |常数项/首项系数|^(1/n)（根之积的模的 n 次方根）最接近的 2 的幂，缩放
+    没有舍入误差；常数项为 0 时取 s = 1。系数跨越多个数量级时，闭式公式中的
+    A^3、A^4 等项不会溢出或淹没其余系数。
+
+    参数:
+        coeffs (numpy.ndarray): 形状为 (批量, n+1) 的系数，按降幂排列
+
+    返回:
+        tuple: (monic, s)，monic 为 y 的首一多项式系数（按降幂排列），根 x = s y
+    """
+    n = coeffs.shape[1] - 1
+    with np.errstate(divide='ignore'):
+        log_s = np.log2(np.abs(coeffs[:, -1] / coeffs[:, 0])) / n
+    s = np.exp2(np.round(np.where(np.isfinite(log_s), log_s, 0.0)))
+    monic = coeffs / coeffs[:, :1] * s[:, None] ** -np.arange(n + 1)
+    return monic, s
+
+
+def _relative_residuals(coeffs, roots):
+    """每个多项式在各根处 |p(x)| 相对于 sum |a_k||x|^k 的最大值（后向误差）"""
+    n = coeffs.shape[1] - 1
+    with np.errstate(over='ignore', invalid='ignore'):
+        powers = roots[:, :, None] ** np.arange(n, -1, -1)
+        value = np.abs(np.sum(coeffs[:, None, :] * powers, axis=2))
+        scale = np.sum(np.abs(coeffs[:, None, :] * powers), axis=2)
+        residual = np.max(value / scale, axis=1)
+    return np.where(np.isnan(residual), np.inf, residual)
+
+
+def _solve_closed_form(closed_form, coeffs, tol):
+    """闭式公式求根的公共流程：缩放、求根、修正，残差过大的行改用伴随矩阵
+
+    缩放后闭式公式在绝大多数情况下已经后向稳定；但系数相差很多个数量级时，
+    个别多项式的根仍会落到错误的位置，Newton 迭代无法把它们拉回。这些行由
+    _relative_residuals 检出后逐行改用 companion_roots 重新求解。
+
+    参数:
+        closed_form (callable): 由首一多项式除首项外的系数求根的函数
+        coeffs (numpy.ndarray): 形状为 (批量, n+1) 的复数系数
+        tol (float): 可接受的相对残差
+
+    返回:
+        numpy.ndarray: 形状为 (批量, n) 的复数根
+    """
+    monic, s = _balance(coeffs)
+    roots = closed_form(*monic[:, 1:].T) * s[:, None]
+    roots = newton_polish(coeffs, _vieta_refine(roots, coeffs[:, -1] / coeffs[:, 0]))
+    failed = _relative_residuals(coeffs, roots) > tol
+    if np.any(failed):
+        roots[failed] = newton_polish(coeffs[failed], companion_roots(coeffs[failed]))
+    return roots
+
+
+def _cubic_closed_form(A, B, C):
+    """首一三次方程 x^3 + Ax^2 + Bx + C = 0 的 Cardano 公式（见 cubic_roots）"""
+    Q = (A * A - 3 * B) / 9
+    R = (2 * A**3 - 9 * A * B + 27 * C) / 54
+    shift = A / 3
+
+    real_coefficients = (np.imag(A) == 0) & (np.imag(B) == 0) & (np.imag(C) == 0)
+    Qr, Rr = np.real(Q), np.real(R)
+    three_real = real_coefficients & (Rr * Rr < Qr**3)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # 三个实根：三角形式
+        sqrt_Q = np.sqrt(np.where(three_real, Qr, 1.0))
+        theta = np.arccos(np.clip(np.where(three_real, Rr / sqrt_Q**3, 0.0), -1.0, 1.0))
+        k = np.arange(3)
+        trig = (-2 * sqrt_Q[:, None] * np.cos((theta[:, None] + 2 * np.pi * k) / 3)
+                - shift[:, None])
+
+        # 一般情况：Cardano 公式
+        root = np.sqrt(R * R - Q**3)
+        S = -(R + _stable_sign(R, root) * root) ** (1 / 3)
+        T = np.where(S != 0, Q / np.where(S != 0, S, 1), 0)
+        omega = np.exp(2j * np.pi / 3)
+        cardano = np.stack([S + T, omega * S + np.conj(omega) * T,
+                            np.conj(omega) * S + omega * T], axis=1) - shift[:, None]
+
+    return np.where(three_real[:, None], trig, cardano)
+
+
+def _quartic_closed_form(A, B, C, D):
+    """首一四次方程 x^4 + Ax^3 + Bx^2 + Cx + D = 0 的 Ferrari 方法（见 quartic_roots）"""
+    p = B - 3 * A * A / 8
+    q = C - A * B / 2 + A**3 / 8
+    r = D - A * C / 4 + A * A * B / 16 - 3 * A**4 / 256
+
+    # 取模最大的预解根，使 s 尽量远离 0
+    ones = np.ones_like(p)
+    z = cubic_roots(ones, 2 * p, p * p - 4 * r, -q * q)
+    z = z[np.arange(len(z)), np.argmax(np.abs(z), axis=1)]
+    s = np.sqrt(z)
+    general = s != 0
+    s_safe = np.where(general, s, 1)
+    t = (p + z - q / s_safe) / 2
+    u = (p + z + q / s_safe) / 2
+    y = np.concatenate([quadratic_roots(ones, s, t), quadratic_roots(ones, -s, u)], axis=1)
+
+    # 双二次方程 y^4 + p y^2 + r = 0
+    w = quadratic_roots(ones, p, r)
+    biquadratic = np.concatenate([np.sqrt(w), -np.sqrt(w)], axis=1)
+
+    return np.where(general[:, None], y, biquadratic) - A[:, None] / 4
+
+
+def cubic_roots(a, b, c, d, tol=CLOSED_FORM_TOLERANCE):
+    """批量求解 ax^3 + bx^2 + cx + d = 0
+
+    先用 _balance 缩放为根的几何平均模接近 1 的首一多项式，再用 Cardano 公式
+    （三个实根时用三角形式）；一个实根时立方根的符号与 R 相反，使
+    |R| + sqrt(R^2 - Q^3) 为同号相加，避免抵消。然后用根之积重新计算模最小的根，
+    做两步 Newton 迭代（见 newton_polish），相对残差仍超过 tol 的行改用伴随矩阵
+    求解（见 _solve_closed_form）。
+
+    参数:
+        a, b, c, d (array_like): 系数（实数或复数），可以广播为相同形状
+        tol (float): 可接受的相对残差
+
+    返回:
+        numpy.ndarray: 形状为 (批量, 3) 的复数根
+    """
+    return _solve_closed_form(_cubic_closed_form, np.stack(_as_batch(a, b, c, d), axis=1), tol)
+
+
+def quartic_roots(a, b, c, d, e, tol=CLOSED_FORM_TOLERANCE):
+    """批量求解 ax^4 + bx^3 + cx^2 + dx + e = 0
+
+    先用 _balance 缩放为首一多项式 x^4 + Ax^3 + Bx^2 + Cx + D，令 x = y - A/4
+    消去三次项得到 y^4 + p y^2 + q y + r = 0，由预解三次方程
+    z^3 + 2p z^2 + (p^2 - 4r) z - q^2 = 0 的根 z = s^2 把它分解为
+    (y^2 + s y + t)(y^2 - s y + u)，两个二次因子用 quadratic_roots 求解；
+    q = 0 时按双二次方程求解。最后与 cubic_roots 相同，经根之积、Newton 迭代
+    修正，残差过大的行改用伴随矩阵。
+
+    参数:
+        a, b, c, d, e (array_like): 系数（实数或复数），可以广播为相同形状
+        tol (float): 可接受的相对残差
+
+    返回:
+        numpy.ndarray: 形状为 (批量, 4) 的复数根
+    """
+    coeffs = np.stack(_as_batch(a, b, c, d, e), axis=1)
+    return _solve_closed_form(_quartic_closed_form, coeffs, tol)
+
+
+def companion_roots(coeffs, chunk_size=DEFAULT_CHUNK_SIZE):
+    """用伴随矩阵的特征值批量求任意次多项式的根
+
+    与 np.roots 相同的伴随矩阵，但把一批多项式叠成 (批量, n, n) 数组，一次调用
+    np.linalg.eigvals；按 chunk_size 分块以限制内存。
+
+    参数:
+        coeffs (array_like): 形状为 (批量, n+1) 的系数，按降幂排列
+        chunk_size (int): 每块的最多多项式个数
+
+    返回:
+        numpy.ndarray: 形状为 (批量, n) 的复数根
+    """
+    coeffs = np.atleast_2d(np.asarray(coeffs))
+    if np.any(coeffs[:, 0] == 0):
+        raise ValueError("首项系数不能为 0（次数会降低）")
+    batch, n = coeffs.shape[0], coeffs.shape[1] - 1
+    dtype = np.result_type(coeffs.dtype, float)
+    roots = np.empty((batch, n), dtype=complex)
+    for start in range(0, batch, chunk_size):
+        block = coeffs[start:start + chunk_size]
+        companion = np.zeros((len(block), n, n), dtype=dtype)
+        companion[:, 0, :] = -block[:, 1:] / block[:, :1]
+        companion[:, np.arange(1, n), np.arange(n - 1)] = 1
+        roots[start:start + len(block)] = np.linalg.eigvals(companion)
+    return roots
+
+
+def polynomial_roots(coeffs, chunk_size=DEFAULT_CHUNK_SIZE):
+    """批量求多项式的根：二、三、四次用闭式公式，更高次用伴随矩阵
+
+    参数:
+        coeffs (array_like): 形状为 (批量, n+1) 的系数，按降幂排列
+
+    返回:
+        numpy.ndarray: 形状为 (批量, n) 的复数根
+    """
+    coeffs = np.atleast_2d(np.asarray(coeffs))
+    solvers = {3: quadratic_roots, 4: cubic_roots, 5: quartic_roots}
+    solver = solvers.get(coeffs.shape[1])
+    if solver is None:
+        return companion_roots(coeffs, chunk_size)
+    return solver(*coeffs.T)
+
+
+def max_relative_residual(coeffs, roots):
+    """根处多项式值相对于 sum |a_k||x|^k 的最大值（反映求根的后向误差）"""
+    return np.max(_relative_residuals(np.atleast_2d(coeffs), roots))
+
+
+def main():
+    """主函数：比较批量求根与逐个调用 np.roots 的速度和精度"""
+    rng = np.random.default_rng(0)
+    batch = 100000
+    print(f"{batch} 个随机系数多项式的求根")
+    print("次数\t方法\t\t耗时(秒)\t最大相对残差")
+    print("-" * 60)
+    for degree in (2, 3, 4, 6):
+        coeffs = rng.standard_normal((batch, degree + 1))
+
+        start = time.perf_counter()
+        roots = polynomial_roots(coeffs)
+        elapsed = time.perf_counter() - start
+        name = "闭式公式" if degree <= 4 else "伴随矩阵"
+        print(f"{degree}\t{name}\t{elapsed:.4f}\t\t{max_relative_residual(coeffs, roots):.2e}")
+
+        start = time.perf_counter()
+        roots = companion_roots(coeffs)
+        elapsed = time.perf_counter() - start
+        print(f"{degree}\t伴随矩阵(批量)\t{elapsed:.4f}\t\t{max_relative_residual(coeffs, roots):.2e}")
+
+        # 逐个调用 np.roots 只计时一部分，再按比例折算
+        sample = coeffs[:batch // 10]
+        start = time.perf_counter()
+        roots = np.array([np.roots(p) for p in sample])
+        elapsed = (time.perf_counter() - start) * 10
+        print(f"{degree}\tnp.roots(逐个)\t{elapsed:.4f}\t\t{max_relative_residual(sample, roots):.2e}")
+
+    print_polishing_results(rng)
+
+
+def print_polishing_results(rng, batch=10000):
+    """判别式很小（两根接近）的二次方程：Newton 修正前后与正确舍入值的比较"""
+    a = rng.standard_normal(batch)
+    b = rng.standard_normal(batch) * 10 ** rng.uniform(-3, 3, batch)
+    c = b * b / (4 * a) * (1 - 10 ** rng.uniform(-12, 0, batch))
+    reference = np.array([reference_quadratic_roots(*abc) for abc in zip(a, b, c)])
+
+    raw = np.sort(np.real(quadratic_roots(a, b, c)), axis=1)
+    start = time.perf_counter()
+    roots, bound = refined_quadratic_roots(a, b, c)
+    elapsed = time.perf_counter() - start
+    order = np.argsort(np.real(roots), axis=1)
+    polished = np.take_along_axis(np.real(roots), order, axis=1)
+    bound = np.take_along_axis(bound, order, axis=1)
+
+    print(f"\n{batch} 个判别式很小的二次方程（与 60 位十进制计算的正确舍入值比较）:")
+    for name, value in (("stable 公式", raw), ("Newton 修正", polished)):
+        ulps = np.abs(value - reference) / np.spacing(np.abs(reference))
+        print(f"{name}\t正确舍入比例 {np.mean(ulps == 0):.4f}\t最大误差 {ulps.max():.0f} ulp")
+    print(f"误差界成立的比例 {np.mean(np.abs(polished - reference) <= bound):.4f}，"
+          f"修正耗时 {elapsed / batch * 1e9:.0f} ns/方程")
+
+
+if __name__ == "__main__":
+    main()
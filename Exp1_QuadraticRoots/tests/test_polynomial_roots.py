@@ -0,0 +1,123 @@
+import sys
+import os
+from fractions import Fraction
+import numpy as np
+import pytest
+
+# 添加父目录到路径，以便导入参考实现
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution.polynomial_roots import (quadratic_roots, cubic_roots, quartic_roots,
+                                       companion_roots, polynomial_roots, max_relative_residual,
+                                       two_sum, two_product, compensated_horner, polish_roots,
+                                       refined_quadratic_roots, reference_quadratic_roots)
+
+def assert_same_roots(roots, expected, rtol=1e-10):
+    """比较两组根：每个根都与另一组中最近的根相对误差小于 rtol"""
+    roots, expected = np.asarray(roots), np.asarray(expected)
+    distance = np.abs(roots[:, None] - expected[None, :]) / np.abs(expected[None, :])
+    assert len(roots) == len(expected)
+    assert distance.min(axis=0).max() < rtol and distance.min(axis=1).max() < rtol
+
+def test_quadratic_avoids_cancellation():
+    """测试批量二次求根与 stable_formula 一样避免抵消，并给出复根"""
+    roots = quadratic_roots([1.0, 1.0, 1.0], [1e8, -3.0, 0.0], [1.0, 2.0, 4.0])
+    assert roots[0, 1] == pytest.approx(-1e-8, rel=1e-15)
+    assert roots[0, 0] == pytest.approx(-1e8, rel=1e-15)
+    assert_same_roots(roots[1], [1.0, 2.0])
+    assert_same_roots(roots[2], [2j, -2j])
+
+@pytest.mark.parametrize("degree", [2, 3, 4])
+def test_closed_forms_match_np_roots(degree):
+    """测试随机多项式的闭式解与 np.roots 一致，后向误差在舍入水平"""
+    coeffs = np.random.default_rng(degree).standard_normal((2000, degree + 1))
+    roots = polynomial_roots(coeffs)
+    assert roots.shape == (2000, degree)
+    assert max_relative_residual(coeffs, roots) < 1e-12
+    for p, r in zip(coeffs[:50], roots[:50]):
+        assert_same_roots(r, np.roots(p), rtol=1e-7)
+
+def test_special_cubics_and_quartics():
+    """测试三重根、已知实根、双二次方程和小根的相对精度"""
+    assert_same_roots(cubic_roots(1, -6, 11, -6)[0], [1, 2, 3])
+    assert np.allclose(cubic_roots(1, -3, 3, -1)[0], 1, atol=1e-5)
+    assert_same_roots(quartic_roots(1, 0, -5, 0, 4)[0], [-2, -1, 1, 2])
+    assert_same_roots(quartic_roots(1, -10, 35, -50, 24)[0], [1, 2, 3, 4])
+    # (x - 1e-9)(x - 1)(x - 2)(x - 3)：小根也要有完整的相对精度
+    coeffs = np.poly([1e-9, 1.0, 2.0, 3.0])
+    roots = quartic_roots(*coeffs)[0]
+    assert np.min(np.abs(roots)) == pytest.approx(1e-9, rel=1e-12)
+
+@pytest.mark.parametrize("degree", [3, 4])
+def test_badly_scaled_coefficients(degree):
+    """测试系数跨越多个数量级时闭式解仍与 np.roots 一致（缩放并回退到伴随矩阵）"""
+    rng = np.random.default_rng(10 + degree)
+    coeffs = rng.choice([-1.0, 1.0], (5000, degree + 1)) * 10 ** rng.uniform(-3, 3, (5000, degree + 1))
+    roots = polynomial_roots(coeffs)
+    assert max_relative_residual(coeffs, roots) < 1e-13
+    for p, r in zip(coeffs[:200], roots[:200]):
+        assert_same_roots(r, np.roots(p), rtol=1e-6)
+
+def test_badly_scaled_examples():
+    """测试首项系数很小、根的模相差很多个数量级的例子"""
+    assert_same_roots(cubic_roots(-0.001, -1700.244, 0.003, 0.002)[0],
+                      np.roots([-0.001, -1700.244, 0.003, 0.002]))
+    coeffs = [0.01, 230.09, -6.18, -0.45, -0.02]
+    roots = quartic_roots(*coeffs)
+    assert max_relative_residual([coeffs], roots) < 1e-14
+    assert_same_roots(roots[0], np.roots(coeffs))
+
+def test_companion_chunks():
+    """测试伴随矩阵批量求根与 np.roots 一致，且结果与分块大小无关"""
+    coeffs = np.random.default_rng(7).standard_normal((300, 7))
+    roots = companion_roots(coeffs, chunk_size=64)
+    assert np.array_equal(roots, companion_roots(coeffs))
+    for p, r in zip(coeffs[:20], roots[:20]):
+        assert_same_roots(r, np.roots(p), rtol=1e-8)
+
+def test_leading_zero_rejected():
+    """测试首项系数为 0 时报错"""
+    with pytest.raises(ValueError):
+        cubic_roots([1.0, 0.0], 1.0, 1.0, 1.0)
+    with pytest.raises(ValueError):
+        companion_roots([[0.0, 1.0, 2.0]])
+
+def test_error_free_transformations():
+    """测试 two_sum、two_product 的结果之和精确等于真实的和与积"""
+    rng = np.random.default_rng(3)
+    x, y = rng.standard_normal(100) * 1e5, rng.standard_normal(100) * 1e-3
+    for (s, e), exact in ((two_sum(x, y), lambda u, v: Fraction(u) + Fraction(v)),
+                          (two_product(x, y), lambda u, v: Fraction(u) * Fraction(v))):
+        for i in range(100):
+            assert Fraction(s[i]) + Fraction(e[i]) == exact(x[i], y[i])
+
+def test_compensated_horner_accuracy():
+    """测试在病态的 (x - 1)^5 展开式上补偿 Horner 远比普通 Horner 准确"""
+    coeffs = np.poly([1.0] * 5)[None, :]
+    x = np.array([[1.0 + 1e-3, 1.0 - 2e-3]])
+    exact = (x - 1.0) ** 5
+    plain = np.polyval(coeffs[0], x)
+    compensated = compensated_horner(coeffs, x)
+    assert np.all(np.abs(compensated / exact - 1) < 1e-6)
+    assert np.all(np.abs(plain / exact - 1) > 1e-3)
+
+def test_polished_quadratic_roots_correctly_rounded():
+    """测试两根接近时修正后的根为正确舍入值，且误差界成立"""
+    rng = np.random.default_rng(5)
+    a = rng.standard_normal(500)
+    b = rng.standard_normal(500) * 10 ** rng.uniform(-3, 3, 500)
+    c = b * b / (4 * a) * (1 - 10 ** rng.uniform(-12, 0, 500))
+    reference = np.array([reference_quadratic_roots(*abc) for abc in zip(a, b, c)])
+    roots, bound = refined_quadratic_roots(a, b, c)
+    assert np.all(np.imag(roots) == 0)
+    order = np.argsort(np.real(roots), axis=1)
+    polished = np.take_along_axis(np.real(roots), order, axis=1)
+    assert np.mean(polished == reference) > 0.99
+    assert np.all(np.abs(polished - reference) <= np.take_along_axis(bound, order, axis=1))
+
+def test_polish_complex_and_double_roots():
+    """测试复根也能修正并给出有限误差界，重根处误差界不会错误地很小"""
+    roots, bound = refined_quadratic_roots(1.0, 2.0, 5.0)
+    assert_same_roots(roots[0], [-1 + 2j, -1 - 2j], rtol=1e-15)
+    assert np.all(bound < 1e-14)
+    roots, bound = polish_roots([[1.0, -2.0, 1.0]], [[1.0 + 1e-9, 1.0 - 1e-9]])
+    assert np.all(np.abs(roots - 1.0) <= bound)
@@ -0,0 +1,24 @@
+import sys
+import os
+import pytest
+
+# 添加父目录到路径，以便导入学生代码和参考解
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from quadratic_solver import standard_formula, alternative_formula, stable_formula
+from solution import quadratic_solver_solution as ref
+
+pytestmark = pytest.mark.perf
+
+# 每次计时连续求解的方程个数
+CALLS = 2000
+
+@pytest.mark.parametrize("name", ["standard_formula", "alternative_formula", "stable_formula"])
+def test_solver_speed(perf, name):
+    """测试求根函数的耗时与参考解相当"""
+    solver = {"standard_formula": standard_formula,
+              "alternative_formula": alternative_formula,
+              "stable_formula": stable_formula}[name]
+    perf.check(solver, getattr(ref, name), 1.0, 1e8, 1.0, number=CALLS)
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--perf", __file__])
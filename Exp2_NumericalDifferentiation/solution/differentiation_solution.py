@@ -1,22 +1,54 @@
+import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
+
+# 绘图经由根目录的 plotting 模块，用到时才导入 matplotlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from plotting import plt
+from result_cache import cached, default_cache
+from instrumentation import instrumented, measure
 
 def f(x):
     """定义测试函数 f(x) = x(x-1)"""
     return x * (x - 1)
 
+@instrumented
 def forward_diff(f, x, delta):
     """前向差分法计算导数"""
     return (f(x + delta) - f(x)) / delta
 
+@instrumented
 def central_diff(f, x, delta):
     """中心差分法计算导数"""
     return (f(x + delta) - f(x - delta)) / (2 * delta)
 
+@instrumented
+def second_diff(f, x, delta):
+    """中心差分法计算二阶导数 (f(x+δ) - 2f(x) + f(x-δ)) / δ^2"""
+    return (f(x + delta) - 2 * f(x) + f(x - delta)) / delta**2
+
+def optimal_steps(x, typical=None, order=2):
+    """差分的经验最优步长（x 为数组时逐坐标给出）
+
+    一阶中心差分的截断误差 ~ δ^2，舍入误差 ~ eps/δ，最优步长 ~ eps^(1/3)；二阶
+    差分的舍入误差 ~ eps/δ^2，最优步长 ~ eps^(1/4)。再乘以 max(|x|, typical) 使
+    步长与自变量的量级一致，并取 (x + δ) - x 使 x ± δ 恰好可以表示。
+
+    Args:
+        x: float 或 array_like, 求导点
+        typical: float 或 array_like, 自变量的典型量级（默认为 1）
+        order: int, 导数阶数（1 或 2）
+    """
+    x = np.asarray(x, dtype=float)
+    typical = np.ones_like(x) if typical is None else np.asarray(typical, dtype=float)
+    delta = np.finfo(float).eps ** (1 / (order + 2)) * np.maximum(np.abs(x), typical)
+    return (x + delta) - x
+
 def analytical_derivative(x):
     """解析导数 f'(x) = 2x - 1"""
     return 2 * x - 1
 
+@cached
 def calculate_errors(x_point=1.0):
     """计算不同步长下的误差"""
     # 步长序列
@@ -68,13 +100,29 @@ def plot_errors(deltas, forward_errors, central_errors):
     plt.savefig('error_vs_stepsize.png', dpi=300)
     plt.show()
 
-def print_results(deltas, forward_errors, central_errors):
-    """打印计算结果表格"""
-    print("步长(δ)\t前向差分误差\t中心差分误差")
-    print("-" * 50)
+def evaluation_counts(x_point, delta):
+    """每种差分格式计算一次导数所需的函数求值次数"""
+    _, forward_stats = measure(forward_diff, f, x_point, delta)
+    _, central_stats = measure(central_diff, f, x_point, delta)
+    return forward_stats.points, central_stats.points
+
+def print_results(deltas, forward_errors, central_errors, evaluations=None):
+    """打印计算结果表格，给出 evaluations=(前向求值次数, 中心求值次数) 时附加每次求值的误差"""
+    if evaluations is None:
+        print("步长(δ)\t前向差分误差\t中心差分误差")
+        print("-" * 50)
+        
+        for i in range(len(deltas)):
+            print(f"{deltas[i]:.2e}\t{forward_errors[i]:.6e}\t{central_errors[i]:.6e}")
+        return
+    
+    forward_evals, central_evals = evaluations
+    print(f"步长(δ)\t前向差分误差\t中心差分误差\t前向误差/求值({forward_evals}次)\t中心误差/求值({central_evals}次)")
+    print("-" * 90)
     
     for i in range(len(deltas)):
-        print(f"{deltas[i]:.2e}\t{forward_errors[i]:.6e}\t{central_errors[i]:.6e}")
+        print(f"{deltas[i]:.2e}\t{forward_errors[i]:.6e}\t{central_errors[i]:.6e}\t"
+              f"{forward_errors[i] / forward_evals:.6e}\t\t{central_errors[i] / central_evals:.6e}")
 
 def main():
     """主函数"""
@@ -85,7 +133,8 @@ def main():
     
     # 打印结果
     print(f"函数 f(x) = x(x-1) 在 x = {x_point} 处的解析导数值: {analytical_derivative(x_point)}")
-    print_results(deltas, forward_errors, central_errors)
+    evaluations = evaluation_counts(x_point, deltas[0])
+    print_results(deltas, forward_errors, central_errors, evaluations)
     
     # 绘制误差图
     plot_errors(deltas, forward_errors, central_errors)
@@ -108,5 +157,15 @@ def main():
     print(f"前向差分收敛阶数约为: {forward_slope:.2f}")
     print(f"中心差分收敛阶数约为: {central_slope:.2f}")
 
+    # 二阶导数 f''(x) = 2：截断误差为零，误差完全来自舍入，约为 eps/δ^2
+    print("\n二阶导数的中心差分误差:")
+    print("步长(δ)\t相对误差")
+    print("-" * 30)
+    for delta in deltas[::3]:
+        print(f"{delta:.2e}\t{abs(second_diff(f, x_point, delta) / 2 - 1):.6e}")
+    delta = optimal_steps(x_point)
+    print(f"经验最优步长 {delta:.2e}: 相对误差 {abs(second_diff(f, x_point, delta) / 2 - 1):.6e}")
+    print(f"\n{default_cache().summary()}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,173 @@
+import os
+import sys
+import functools
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from differentiation_solution import central_diff, optimal_steps
+from instrumentation import instrumented, measure
+
+
+@functools.lru_cache(maxsize=None)
+def hessian_stencil(d):
+    """d 维 Hessian 中心差分模板的格点及各差分公式用到的格点编号（按维数缓存）
+
+    格点（以步长为单位的整数偏移）为：中心点；±e_i（2d 个）；±e_i ± e_j，i < j
+    （每对 4 个），共 2d^2 + 1 个。梯度、对角元和混合偏导都由这同一组函数值
+    组合得到，不重复求值。
+
+    Returns:
+        tuple: (offsets, plus, minus, pairs)
+            offsets: 形状为 (2d^2+1, d) 的只读整数数组
+            plus, minus: 长度为 d 的数组，x ± h_i e_i 的编号
+            pairs: 形状为 (d(d-1)/2, 6) 的数组，每行为 (i, j, ++, +-, -+, --) 的编号
+    """
+    identity = np.eye(d, dtype=int)
+    offsets = [np.zeros(d, dtype=int)]
+    offsets += [identity[i] for i in range(d)] + [-identity[i] for i in range(d)]
+    pairs = []
+    for i in range(d):
+        for j in range(i + 1, d):
+            start = len(offsets)
+            for si, sj in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+                offsets.append(si * identity[i] + sj * identity[j])
+            pairs.append((i, j, start, start + 1, start + 2, start + 3))
+    offsets = np.array(offsets)
+    offsets.flags.writeable = False
+    plus = np.arange(1, d + 1)
+    minus = np.arange(d + 1, 2 * d + 1)
+    return offsets, plus, minus, np.array(pairs, dtype=int).reshape(-1, 6)
+
+
+@instrumented(point_dim=1)
+def hessian(f, x, h=None, gradient_h=None):
+    """中心差分计算梯度和 Hessian 矩阵
+
+    Hessian 由 2d^2 + 1 个格点上的函数值得到：
+    对角元 H_ii = (f(+i) - 2 f(0) + f(-i)) / h_i^2，
+    混合偏导 H_ij = (f(+i+j) - f(+i-j) - f(-i+j) + f(-i-j)) / (4 h_i h_j)。
+    梯度 g_i = (f(+i) - f(-i)) / (2 h_i) 的最优步长 ~ eps^(1/3) 比二阶差分的
+    ~ eps^(1/4) 小，默认另取 2d 个点 x ± gradient_h_i e_i，与格点一起由一次数组
+    调用 f(X) 求值；gradient_h 与 h 相同时直接用格点上的 f(±i)，不增加求值。
+
+    Args:
+        f: callable, 多元函数，f(X) 中 X 的形状为 (点数, d)，返回形状为 (点数,) 的数组
+        x: array_like, 长度为 d 的求导点
+        h: float 或 array_like, Hessian 的步长（默认为 optimal_steps(x, order=2)）
+        gradient_h: float 或 array_like, 梯度的步长；默认在 h 未给出时为
+            optimal_steps(x, order=1)，否则与 h 相同
+
+    Returns:
+        tuple: (gradient, hessian)，形状分别为 (d,) 和 (d, d)
+    """
+    x = np.asarray(x, dtype=float)
+    d = len(x)
+    if h is None:
+        h = optimal_steps(x, order=2)
+        if gradient_h is None:
+            gradient_h = optimal_steps(x, order=1)
+    h = np.broadcast_to(np.asarray(h, dtype=float), d)
+    offsets, plus, minus, pairs = hessian_stencil(d)
+    points = x + offsets * h
+    separate = gradient_h is not None and not np.array_equal(gradient_h, h)
+    if separate:
+        gradient_h = np.broadcast_to(np.asarray(gradient_h, dtype=float), d)
+        steps = np.diag(gradient_h)
+        points = np.concatenate([points, x + steps, x - steps])
+    values = np.asarray(f(points), dtype=float)
+
+    if separate:
+        n = len(offsets)
+        gradient = (values[n:n + d] - values[n + d:]) / (2 * gradient_h)
+    else:
+        gradient = (values[plus] - values[minus]) / (2 * h)
+    H = np.diag((values[plus] - 2 * values[0] + values[minus]) / h**2)
+    i, j = pairs[:, 0], pairs[:, 1]
+    mixed = (values[pairs[:, 2]] - values[pairs[:, 3]] - values[pairs[:, 4]]
+             + values[pairs[:, 5]]) / (4 * h[i] * h[j])
+    H[i, j] = mixed
+    H[j, i] = mixed
+    return gradient, H
+
+
+def nested_hessian(f, x, h=None):
+    """对 central_diff 嵌套调用 central_diff 计算 Hessian（逐元素、逐点求值，用于对比）
+
+    h 默认与 hessian 相同，为 optimal_steps(x, order=2)；H_ij 的外层差分取 h_i，
+    内层取 h_j。
+    """
+    x = np.asarray(x, dtype=float)
+    d = len(x)
+    h = np.broadcast_to(optimal_steps(x, order=2) if h is None else np.asarray(h, dtype=float), d)
+    H = np.empty((d, d))
+
+    def scalar_f(point):
+        return f(point[None, :])[0]
+
+    for i in range(d):
+        e_i = np.eye(d)[i]
+        for j in range(d):
+            e_j = np.eye(d)[j]
+            partial_j = lambda t: central_diff(lambda s: scalar_f(x + t * e_i + s * e_j), 0.0, h[j])
+            H[i, j] = central_diff(partial_j, 0.0, h[i])
+    return H
+
+
+def sample_function(X):
+    """测试函数 f(x) = exp(x_0 x_1) + x_0 sin(x_2)"""
+    return np.exp(X[:, 0] * X[:, 1]) + X[:, 0] * np.sin(X[:, 2])
+
+
+def sample_gradient(x):
+    """测试函数的解析梯度"""
+    x0, x1, x2 = x
+    e = np.exp(x0 * x1)
+    return np.array([x1 * e + np.sin(x2), x0 * e, x0 * np.cos(x2)])
+
+
+def sample_hessian(x):
+    """测试函数的解析 Hessian"""
+    x0, x1, x2 = x
+    e = np.exp(x0 * x1)
+    return np.array([
+        [x1 * x1 * e, (1 + x0 * x1) * e, np.cos(x2)],
+        [(1 + x0 * x1) * e, x0 * x0 * e, 0.0],
+        [np.cos(x2), 0.0, -x0 * np.sin(x2)],
+    ])
+
+
+def main():
+    """主函数：比较共用格点的 Hessian 与嵌套 central_diff 的求值次数和误差"""
+    x = np.array([0.5, -1.2, 2.0])
+    exact = sample_hessian(x)
+    scale = np.max(np.abs(exact))
+    exact_gradient = sample_gradient(x)
+    gradient_scale = np.max(np.abs(exact_gradient))
+
+    print("经验最优步长下的梯度和 Hessian（相对误差）:")
+    print("方法\t\t\t\t求值次数\tf调用\t梯度误差\tHessian误差")
+    print("-" * 80)
+    (g, H), stats = measure(hessian, sample_function, x)
+    print(f"共用格点 + 梯度单独步长\t\t{stats.points}\t\t{stats.calls}\t"
+          f"{np.max(np.abs(g - exact_gradient)) / gradient_scale:.2e}\t"
+          f"{np.max(np.abs(H - exact)) / scale:.2e}")
+    h = optimal_steps(x, order=2)
+    (g, H), stats = measure(hessian, sample_function, x, h, h)
+    print(f"共用格点（梯度与 Hessian 同步长）\t{stats.points}\t\t{stats.calls}\t"
+          f"{np.max(np.abs(g - exact_gradient)) / gradient_scale:.2e}\t"
+          f"{np.max(np.abs(H - exact)) / scale:.2e}")
+    H, stats = measure(nested_hessian, sample_function, x)
+    print(f"嵌套 central_diff\t\t\t{stats.points}\t\t{stats.calls}\t-\t\t"
+          f"{np.max(np.abs(H - exact)) / scale:.2e}")
+
+    print("\n步长\t\t共用格点误差\t嵌套 central_diff 误差")
+    print("-" * 60)
+    for h in (1e-2, 1e-3, 1e-4, 1e-5, 1e-6):
+        _, H = hessian(sample_function, x, h)
+        H_nested = nested_hessian(sample_function, x, h)
+        print(f"{h:.0e}\t\t{np.max(np.abs(H - exact)) / scale:.2e}\t"
+              f"{np.max(np.abs(H_nested - exact)) / scale:.2e}")
+
+
+if __name__ == "__main__":
+    main()
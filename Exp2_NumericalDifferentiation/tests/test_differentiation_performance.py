@@ -0,0 +1,26 @@
+import sys
+import os
+import pytest
+
+# 添加父目录到路径，以便导入学生代码和参考解
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from differentiation import f, forward_diff, central_diff, analytical_derivative
+from solution import differentiation_solution as ref
+
+pytestmark = pytest.mark.perf
+
+# 每次计时连续调用的次数
+CALLS = 2000
+
+def test_function_speed(perf):
+    """测试f(x)和解析导数的耗时与参考解相当"""
+    perf.check(f, ref.f, 1.0, number=CALLS)
+    perf.check(analytical_derivative, ref.analytical_derivative, 1.0, number=CALLS)
+
+def test_difference_speed(perf):
+    """测试差分公式的耗时与参考解相当（使用相同的被求导函数）"""
+    perf.check(forward_diff, ref.forward_diff, ref.f, 1.0, 1e-6, number=CALLS)
+    perf.check(central_diff, ref.central_diff, ref.f, 1.0, 1e-6, number=CALLS)
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--perf", __file__])
@@ -0,0 +1,92 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# 添加父目录到路径，以便导入参考实现
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution.hessian import (hessian_stencil, hessian, nested_hessian, sample_function,
+                              sample_gradient, sample_hessian)
+from solution.differentiation_solution import f, second_diff, optimal_steps
+from instrumentation import measure
+
+# 测试求导点
+X0 = np.array([0.5, -1.2, 2.0])
+
+# 测试差分模板
+def test_stencil_points():
+    """测试模板共有2d^2+1个互不相同的格点"""
+    for d in range(1, 6):
+        offsets, plus, minus, pairs = hessian_stencil(d)
+        assert offsets.shape == (2 * d * d + 1, d), f"d={d} 时模板应有 {2 * d * d + 1} 个格点"
+        assert len(np.unique(offsets, axis=0)) == len(offsets), f"d={d} 时模板格点应互不相同"
+        assert len(pairs) == d * (d - 1) // 2, f"d={d} 时应有 {d * (d - 1) // 2} 对混合偏导"
+        assert np.array_equal(offsets[plus], np.eye(d, dtype=int)), "plus 应指向 +e_i 格点"
+        assert np.array_equal(offsets[minus], -np.eye(d, dtype=int)), "minus 应指向 -e_i 格点"
+
+# 测试二次函数
+def test_quadratic_form_exact():
+    """测试二次函数的梯度和Hessian没有截断误差"""
+    A = np.array([[2.0, 0.5, -1.0], [0.5, 3.0, 0.25], [-1.0, 0.25, 1.5]])
+    b = np.array([1.0, -2.0, 0.5])
+    x = np.array([0.3, -0.7, 1.1])
+    quadratic = lambda X: 0.5 * np.einsum("ni,ij,nj->n", X, A, X) + X @ b
+    gradient, H = hessian(quadratic, x, 1e-3)
+    assert np.allclose(H, A, atol=1e-8), f"二次函数的 Hessian 应为 {A}，但返回了 {H}"
+    assert np.allclose(gradient, A @ x + b, atol=1e-10), f"二次函数的梯度应为 {A @ x + b}，但返回了 {gradient}"
+
+# 测试默认步长下的精度
+def test_default_steps_accuracy():
+    """测试默认步长下梯度和Hessian与解析值一致，Hessian为对称矩阵"""
+    gradient, H = hessian(sample_function, X0)
+    assert np.array_equal(H, H.T), "Hessian 应为对称矩阵"
+    assert np.allclose(H, sample_hessian(X0), rtol=0, atol=1e-7), "Hessian 应与解析值一致"
+    # 梯度使用一阶差分的最优步长，比与 Hessian 共用步长准确得多
+    h = optimal_steps(X0, order=2)
+    shared_gradient, _ = hessian(sample_function, X0, h, h)
+    error = np.max(np.abs(gradient - sample_gradient(X0)))
+    shared_error = np.max(np.abs(shared_gradient - sample_gradient(X0)))
+    assert error < 1e-9, f"默认步长下梯度误差应小于 1e-9，但为 {error}"
+    assert error < shared_error, "梯度单独取步长时应比与 Hessian 共用步长更准确"
+
+# 测试求值次数
+def test_single_batched_call():
+    """测试全部格点由一次f调用求值"""
+    d = len(X0)
+    _, stats = measure(hessian, sample_function, X0)
+    assert stats.calls == 1, f"f 应只被调用 1 次，但调用了 {stats.calls} 次"
+    assert stats.points == 2 * d * d + 1 + 2 * d, f"默认应求值 {2 * d * d + 3 * d + 1} 个点"
+    _, stats = measure(hessian, sample_function, X0, 1e-4)
+    assert stats.points == 2 * d * d + 1, "梯度与 Hessian 同步长时不应增加求值"
+
+# 测试与嵌套中心差分的比较
+def test_compared_with_nested():
+    """测试两种方法在各自默认步长下都准确，且共用格点的求值次数更少"""
+    exact = sample_hessian(X0)
+    (_, H), stats = measure(hessian, sample_function, X0)
+    H_nested, nested_stats = measure(nested_hessian, sample_function, X0)
+    assert stats.points < nested_stats.points, "共用格点的求值次数应少于嵌套中心差分"
+    assert np.allclose(H, exact, rtol=0, atol=1e-7), "共用格点的 Hessian 应与解析值一致"
+    assert np.allclose(H_nested, exact, rtol=0, atol=1e-7), "嵌套中心差分的 Hessian 应与解析值一致"
+
+# 测试经验最优步长
+def test_optimal_steps():
+    """测试步长使x+h恰好可以表示，且随阶数和坐标量级变化"""
+    x = np.array([1e-3, 0.1, 3.0, -250.0])
+    h1, h2 = optimal_steps(x, order=1), optimal_steps(x, order=2)
+    assert np.all(h1 > 0) and np.all(h2 > 0), "步长应为正数"
+    assert np.array_equal((x + h2) - x, h2), "x + h 应恰好可以表示"
+    assert np.all(h1 < h2), "一阶导数的最优步长应小于二阶导数的"
+    assert h2[-1] > h2[0], "步长应随坐标的量级增大"
+
+# 测试二阶中心差分
+def test_second_diff():
+    """测试二阶中心差分在经验最优步长下的精度"""
+    x = np.array([0.5, 1.0, 2.0])
+    result = second_diff(np.exp, x, optimal_steps(x))
+    assert np.allclose(result, np.exp(x), rtol=1e-7), f"exp 的二阶导数应为 {np.exp(x)}，但返回了 {result}"
+    result = second_diff(f, 1.0, optimal_steps(1.0))
+    assert result == pytest.approx(2.0, abs=1e-7), f"f 的二阶导数应为 2，但返回了 {result}"
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -1,7 +1,12 @@
+import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
 import time
 
+# 绘图经由根目录的 plotting 模块，用到时才导入 matplotlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from plotting import plt
+
 def f(x):
     """被积函数 f(x) = sqrt(1-x^2)
     
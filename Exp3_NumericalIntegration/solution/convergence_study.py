@@ -0,0 +1,146 @@
+import os
+import sys
+import numpy as np
+from scipy import stats
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from integration_solution import f, rectangle_method, trapezoid_method, calculate_convergence_rate
+from instrumentation import measure
+
+
+def local_orders(N_values, errors):
+    """相邻两次加密之间的局部收敛阶 p = log(e_{i-1}/e_i) / log(N_i/N_{i-1})"""
+    N_values = np.asarray(N_values, dtype=float)
+    errors = np.asarray(errors, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.log(errors[:-1] / errors[1:]) / np.log(N_values[1:] / N_values[:-1])
+
+
+def fit_order(N_values, errors, confidence=0.95):
+    """对 log(误差) - log(h) 做最小二乘拟合，给出收敛阶及其置信区间
+
+    Args:
+        N_values: array_like, 区间数
+        errors: array_like, 对应的误差
+        confidence: float, 置信水平
+
+    Returns:
+        tuple: (order, (low, high))，点数不足 3 个时区间为 (nan, nan)
+    """
+    log_h = -np.log(np.asarray(N_values, dtype=float))
+    log_e = np.log(np.asarray(errors, dtype=float))
+    fit = stats.linregress(log_h, log_e)
+    dof = len(log_h) - 2
+    if dof < 1:
+        return fit.slope, (np.nan, np.nan)
+    half = stats.t.ppf(0.5 + confidence / 2, dof) * fit.stderr
+    return fit.slope, (fit.slope - half, fit.slope + half)
+
+
+def convergence_study(method, func, a, b, exact_value, N0=10, ratio=2, window=3, tol=0.05,
+                      max_N=2**20, confidence=0.95, rounding_factor=10.0):
+    """自适应的收敛阶研究
+
+    从 N0 开始按 ratio 倍几何加密，每次加密后计算局部收敛阶。最近 window 个局部阶
+    的极差不超过 tol 时认为已进入渐近区，停止加密；误差不再下降、局部阶骤降到
+    之前的一半以下，或误差降到 rounding_factor * eps * sqrt(N) 的舍入水平时，认为
+    舍入误差开始主导，丢弃该点并停止。最后用渐近区（最近 window+1 个点）拟合收敛阶。
+
+    Args:
+        method: callable, 数值积分方法 method(func, a, b, N)
+        func: callable, 被积函数
+        a, b: float, 积分区间
+        exact_value: float, 积分精确值
+        N0: int, 初始区间数
+        ratio: int, 每次加密的倍数
+        window: int, 判断稳定所用的局部阶个数
+        tol: float, 局部阶极差的容许值
+        max_N: int, 区间数上限
+        confidence: float, 置信水平
+        rounding_factor: float, 舍入水平的系数
+
+    Returns:
+        dict: order（收敛阶估计）, interval（置信区间）, reason（停止原因：
+            'stable'、'rounding' 或 'max_N'）, N, errors, local_orders（全部有效加密
+            的结果）, fit_N（用于拟合的区间数）, evaluations（函数求值总点数）
+    """
+    eps = np.finfo(float).eps
+    N_values, errors = [], []
+    evaluations = 0
+    reason = 'max_N'
+    N = N0
+    while N <= max_N:
+        result, cost = measure(method, func, a, b, N)
+        evaluations += cost.points
+        error = abs((result - exact_value) / exact_value)
+        if N_values:
+            orders = local_orders(N_values + [N], errors + [error])
+            previous = orders[:-1][-window:]
+            if (error == 0 or error >= errors[-1]
+                    or error <= rounding_factor * eps * np.sqrt(N)
+                    or (len(previous) and orders[-1] < 0.5 * np.median(previous))):
+                reason = 'rounding'
+                break
+        N_values.append(N)
+        errors.append(error)
+        orders = local_orders(N_values, errors)
+        if len(orders) >= window and np.ptp(orders[-window:]) <= tol:
+            reason = 'stable'
+            break
+        N *= ratio
+
+    fit_N = N_values[-(window + 1):]
+    fit_errors = errors[-(window + 1):]
+    if len(fit_N) >= 2:
+        order, interval = fit_order(fit_N, fit_errors, confidence)
+    else:
+        order, interval = np.nan, (np.nan, np.nan)
+    return {
+        "order": order,
+        "interval": interval,
+        "reason": reason,
+        "N": N_values,
+        "errors": errors,
+        "local_orders": local_orders(N_values, errors).tolist(),
+        "fit_N": fit_N,
+        "evaluations": evaluations,
+    }
+
+
+def print_study(name, study):
+    """打印一次收敛阶研究的结果"""
+    low, high = study["interval"]
+    print(f"\n{name}:")
+    print("N\t相对误差\t局部收敛阶")
+    print("-" * 40)
+    orders = [np.nan] + study["local_orders"]
+    for N, error, order in zip(study["N"], study["errors"], orders):
+        print(f"{N}\t{error:.6e}\t{order:.4f}")
+    print(f"停止原因: {study['reason']}，函数求值 {study['evaluations']} 次")
+    print(f"渐近区 N = {study['fit_N']}")
+    print(f"收敛阶: {study['order']:.4f}，95% 置信区间 [{low:.4f}, {high:.4f}]")
+
+
+def main():
+    """主函数：比较固定 N 列表的拟合与自适应研究"""
+    a, b = -1.0, 1.0
+    exact_value = 0.5 * np.pi
+    fixed_N = [10, 100, 1000, 10000]
+
+    for name, method in [("矩形法", rectangle_method), ("梯形法", trapezoid_method)]:
+        fixed_errors = []
+        fixed_evaluations = 0
+        for N in fixed_N:
+            result, cost = measure(method, f, a, b, N)
+            fixed_errors.append(abs((result - exact_value) / exact_value))
+            fixed_evaluations += cost.points
+        h_values = [(b - a) / N for N in fixed_N]
+        rate = calculate_convergence_rate(h_values, fixed_errors)
+
+        study = convergence_study(method, f, a, b, exact_value)
+        print_study(name, study)
+        print(f"固定 N = {fixed_N}: 收敛阶 {rate:.4f}，函数求值 {fixed_evaluations} 次")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,20 @@
+import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
 import time
+import functools
+
+# 绘图经由根目录的 plotting 模块，用到时才导入 matplotlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from plotting import plt
+from result_cache import cached, default_cache
+from instrumentation import instrumented, measure
 
 def f(x):
     """被积函数 f(x) = sqrt(1-x^2)"""
     return np.sqrt(1 - x**2)
 
+@instrumented
 def rectangle_method(f, a, b, N):
     """矩形法（左矩形法）计算积分"""
     h = (b - a) / N
@@ -18,6 +27,7 @@ def rectangle_method(f, a, b, N):
     
     return result
 
+@instrumented
 def trapezoid_method(f, a, b, N):
     """梯形法计算积分"""
     h = (b - a) / N
@@ -30,6 +40,149 @@ def trapezoid_method(f, a, b, N):
     
     return result
 
+# 复合 Newton-Cotes 公式: 名称 -> (每个子区间组包含的区间数, 单组的权重, 系数)
+# 单组 [x_0, x_m] 上的积分 ≈ 系数 * h * sum(权重 * f(x_i))
+NEWTON_COTES = {
+    "simpson": (2, [1, 4, 1], 1 / 3),
+    "simpson38": (3, [1, 3, 3, 1], 3 / 8),
+    "boole": (4, [7, 32, 12, 32, 7], 2 / 45),
+}
+
+# 只缓存 N 不超过此值的权重向量；更大的 N 构造权重的耗时与函数求值相当，不必缓存
+MAX_CACHED_N = 2**16
+
+def newton_cotes_weights(rule, N):
+    """复合公式在 N 个区间（N+1 个节点）上的权重向量（h = 1）
+
+    相邻两组共用的节点权重相加。N 不超过 MAX_CACHED_N 时按 (rule, N) 缓存，
+    返回只读数组，供多次调用共用。
+    """
+    if N <= MAX_CACHED_N:
+        return _cached_weights(rule, N)
+    return _build_weights(rule, N)
+
+@functools.lru_cache(maxsize=64)
+def _cached_weights(rule, N):
+    return _build_weights(rule, N)
+
+def _build_weights(rule, N):
+    if rule == "clenshaw_curtis":
+        weights = _clenshaw_curtis_weights(N)
+    else:
+        weights = _newton_cotes_weights(rule, N)
+    weights.flags.writeable = False
+    return weights
+
+def _newton_cotes_weights(rule, N):
+    m, panel, scale = NEWTON_COTES[rule]
+    if N <= 0 or N % m != 0:
+        raise ValueError(f"{rule} 公式要求 N 为 {m} 的正整数倍，实际 N = {N}")
+    weights = np.zeros(N + 1)
+    for i, w in enumerate(panel):
+        weights[i:N + i - m + 1:m] += w
+    weights *= scale
+    return weights
+
+def _clenshaw_curtis_weights(N):
+    """Waldvogel (2006) 的算法：由 Chebyshev 矩的序列做一次长度为 N 的 FFT 得到权重"""
+    if N < 1:
+        raise ValueError(f"Clenshaw-Curtis 公式要求 N >= 1，实际 N = {N}")
+    if N == 1:
+        return np.array([1.0, 1.0])
+    odd = np.arange(1, N, 2)
+    l = len(odd)
+    m = N - l
+    v0 = np.concatenate([2.0 / odd / (odd - 2), [1.0 / odd[-1]], np.zeros(m)])
+    v2 = -v0[:-1] - v0[:0:-1]
+    g0 = -np.ones(N)
+    g0[l] += N
+    g0[m] += N
+    g = g0 / (N**2 - 1 + N % 2)
+    weights = np.fft.ifft(v2 + g).real
+    return np.append(weights, weights[0])
+
+def clenshaw_curtis_weights(N):
+    """Clenshaw-Curtis 公式在 [-1, 1] 上 N+1 个 Chebyshev 点 cos(kπ/N) 处的权重
+
+    用 FFT 在 O(N log N) 时间内计算，缓存方式与 newton_cotes_weights 相同。
+    """
+    if N <= MAX_CACHED_N:
+        return _cached_weights("clenshaw_curtis", N)
+    return _build_weights("clenshaw_curtis", N)
+
+def chebyshev_nodes(N):
+    """N+1 个 Chebyshev 极值点 cos(kπ/N)，k = 0..N"""
+    return np.cos(np.pi * np.arange(N + 1) / N)
+
+def composite_rule(rule, f, a, b, N):
+    """用缓存的权重向量与一次数组求值的函数值做点积，计算复合公式的积分"""
+    weights = newton_cotes_weights(rule, N)
+    h = (b - a) / N
+    return h * np.dot(weights, f(np.linspace(a, b, N + 1)))
+
+@instrumented
+def simpson_method(f, a, b, N):
+    """复合 Simpson 公式计算积分（N 为偶数）"""
+    return composite_rule("simpson", f, a, b, N)
+
+@instrumented
+def simpson38_method(f, a, b, N):
+    """复合 Simpson 3/8 公式计算积分（N 为 3 的倍数）"""
+    return composite_rule("simpson38", f, a, b, N)
+
+@instrumented
+def boole_method(f, a, b, N):
+    """复合 Boole 公式计算积分（N 为 4 的倍数）"""
+    return composite_rule("boole", f, a, b, N)
+
+@instrumented
+def clenshaw_curtis_method(f, a, b, N):
+    """Clenshaw-Curtis 公式计算积分（N+1 个 Chebyshev 点）"""
+    mid, half = 0.5 * (a + b), 0.5 * (b - a)
+    return half * np.dot(clenshaw_curtis_weights(N), f(mid + half * chebyshev_nodes(N)))
+
+@instrumented
+def clenshaw_curtis_adaptive(f, a, b, tol=1e-12, N0=8, max_N=2**16):
+    """逐次把 N 加倍的 Clenshaw-Curtis 积分，直到相邻两次结果的相对差不超过 tol
+
+    N 个区间的 Chebyshev 点是 2N 个区间的点中的偶数号点，加倍时只需在新增的
+    奇数号点上求值，此前的函数值全部复用，总求值次数为最终的 N+1。
+
+    Returns:
+        tuple: (积分值, 最终的 N, 误差估计（最后两次结果之差）)
+    """
+    mid, half = 0.5 * (a + b), 0.5 * (b - a)
+    N = N0
+    values = f(mid + half * chebyshev_nodes(N))
+    estimate = half * np.dot(clenshaw_curtis_weights(N), values)
+    error = np.inf
+    while N < max_N:
+        new_values = f(mid + half * np.cos(np.pi * np.arange(1, 2 * N, 2) / (2 * N)))
+        merged = np.empty(2 * N + 1)
+        merged[0::2] = values
+        merged[1::2] = new_values
+        values, N = merged, 2 * N
+        previous, estimate = estimate, half * np.dot(clenshaw_curtis_weights(N), values)
+        error = abs(estimate - previous)
+        if error <= tol * abs(estimate):
+            break
+    return estimate, N, error
+
+# 各方法及其要求 N 为其倍数的区间数
+METHODS = {
+    "rectangle": (rectangle_method, 1),
+    "trapezoid": (trapezoid_method, 1),
+    "simpson": (simpson_method, 2),
+    "simpson38": (simpson38_method, 3),
+    "boole": (boole_method, 4),
+    "clenshaw_curtis": (clenshaw_curtis_method, 1),
+}
+
+def admissible_N(N, multiple):
+    """不小于 N 的最小的 multiple 的倍数"""
+    return -(-N // multiple) * multiple
+
+@cached
 def calculate_errors(a, b, exact_value):
     """计算不同N值下各方法的误差"""
     N_values = [10, 100, 1000, 10000]
@@ -51,6 +204,22 @@ def calculate_errors(a, b, exact_value):
     
     return N_values, h_values, rect_errors, trap_errors
 
+@cached
+def calculate_method_errors(a, b, exact_value, N_values=(10, 100, 1000, 10000)):
+    """计算各方法（含 Newton-Cotes 公式）在不同 N 下的相对误差
+
+    N 不满足公式要求时取不小于它的最小合法值。
+
+    Returns:
+        dict: 方法名 -> (实际使用的 N 列表, h 列表, 相对误差列表)
+    """
+    results = {}
+    for name, (method, multiple) in METHODS.items():
+        used_N = [admissible_N(N, multiple) for N in N_values]
+        errors = [abs((method(f, a, b, N) - exact_value) / exact_value) for N in used_N]
+        results[name] = (used_N, [(b - a) / N for N in used_N], errors)
+    return results
+
 def plot_errors(h_values, rect_errors, trap_errors):
     """绘制误差-步长关系图"""
     plt.figure(figsize=(10, 6))
@@ -73,8 +242,11 @@ def plot_errors(h_values, rect_errors, trap_errors):
     plt.savefig('error_vs_stepsize_integration.png', dpi=300)
     plt.show()
 
-def print_results(N_values, rect_results, trap_results, exact_value):
-    """打印计算结果表格"""
+def print_results(N_values, rect_results, trap_results, exact_value, evaluations=None):
+    """打印计算结果表格
+
+    给出 evaluations=(矩形法求值次数列表, 梯形法求值次数列表) 时附加求值次数和每次求值的误差
+    """
     print("N\t矩形法\t\t梯形法\t\t精确值")
     print("-" * 60)
     
@@ -89,22 +261,51 @@ def print_results(N_values, rect_results, trap_results, exact_value):
         rect_error = abs((rect_results[i] - exact_value) / exact_value)
         trap_error = abs((trap_results[i] - exact_value) / exact_value)
         print(f"{N_values[i]}\t{rect_error:.8e}\t{trap_error:.8e}")
+    
+    if evaluations is None:
+        return
+    
+    rect_evals, trap_evals = evaluations
+    print("\n函数求值次数与每次求值的误差:")
+    print("N\t矩形法求值\t梯形法求值\t矩形法误差/求值\t梯形法误差/求值")
+    print("-" * 80)
+    
+    for i in range(len(N_values)):
+        rect_error = abs((rect_results[i] - exact_value) / exact_value)
+        trap_error = abs((trap_results[i] - exact_value) / exact_value)
+        print(f"{N_values[i]}\t{rect_evals[i]}\t\t{trap_evals[i]}\t\t"
+              f"{rect_error / rect_evals[i]:.8e}\t{trap_error / trap_evals[i]:.8e}")
+
+def print_method_errors(method_errors):
+    """打印各方法的相对误差与收敛阶"""
+    print("\n各方法的相对误差:")
+    print("方法\t\t" + "\t\t".join(f"N≈{N}" for N in next(iter(method_errors.values()))[0]) + "\t\t收敛阶")
+    print("-" * 100)
+    
+    for name, (N_values, h_values, errors) in method_errors.items():
+        rate = calculate_convergence_rate(h_values, errors)
+        print(f"{name:<16}\t" + "\t".join(f"{error:.8e}" for error in errors) + f"\t{rate:.2f}")
 
 def time_performance_test(a, b, max_time=1.0):
     """测试在限定时间内各方法能达到的最高精度"""
     exact_value = 0.5 * np.pi
     
     methods = [
-        ("Rectangle Method", rectangle_method),
-        ("Trapezoid Method", trapezoid_method)
+        ("Rectangle Method", "rectangle"),
+        ("Trapezoid Method", "trapezoid"),
+        ("Simpson Method", "simpson"),
+        ("Simpson 3/8 Method", "simpson38"),
+        ("Boole Method", "boole"),
+        ("Clenshaw-Curtis", "clenshaw_curtis")
     ]
     
     print(f"\n在{max_time}秒内各方法能达到的最高精度:")
     print("方法\t\tN\t\t结果\t\t相对误差\t运行时间(秒)")
     print("-" * 80)
     
-    for name, method in methods:
-        N = 10
+    for name, key in methods:
+        method, multiple = METHODS[key]
+        N = admissible_N(10, multiple)
         while True:
             start_time = time.time()
             result = method(f, a, b, N)
@@ -118,6 +319,25 @@ def time_performance_test(a, b, max_time=1.0):
                 break
             
             N *= 2
+    
+    # 光滑被积函数上 Clenshaw-Curtis 公式指数收敛，与梯形法比较达到同一精度的代价
+    target = 1e-10
+    smooth_exact = np.exp(b) - np.exp(a)
+    print(f"\n光滑被积函数 e^x 上达到相对误差 {target:g} 所需的 N 与时间:")
+    print("方法\t\tN\t\t相对误差\t运行时间(秒)")
+    print("-" * 60)
+    
+    for name, method in [("Trapezoid Method", trapezoid_method), ("Clenshaw-Curtis", clenshaw_curtis_method)]:
+        N = 2
+        while True:
+            start_time = time.time()
+            result = method(np.exp, a, b, N)
+            elapsed = time.time() - start_time
+            error = abs((result - smooth_exact) / smooth_exact)
+            if error < target or elapsed > max_time:
+                print(f"{name}\t{N}\t\t{error:.8e}\t{elapsed:.6f}")
+                break
+            N *= 2
 
 def calculate_convergence_rate(h_values, errors):
     """计算收敛阶数"""
@@ -142,13 +362,23 @@ def main():
     N_values = [10, 100, 1000, 10000]
     rect_results = []
     trap_results = []
+    rect_evals = []
+    trap_evals = []
     
     for N in N_values:
-        rect_results.append(rectangle_method(f, a, b, N))
-        trap_results.append(trapezoid_method(f, a, b, N))
+        # 同时记录每种方法的函数求值次数
+        result, stats = measure(rectangle_method, f, a, b, N)
+        rect_results.append(result)
+        rect_evals.append(stats.points)
+        result, stats = measure(trapezoid_method, f, a, b, N)
+        trap_results.append(result)
+        trap_evals.append(stats.points)
     
     # 打印结果
-    print_results(N_values, rect_results, trap_results, exact_value)
+    print_results(N_values, rect_results, trap_results, exact_value, (rect_evals, trap_evals))
+    
+    # 各方法（含 Newton-Cotes 公式）的误差与收敛阶
+    print_method_errors(calculate_method_errors(a, b, exact_value))
     
     # 计算误差
     _, h_values, rect_errors, trap_errors = calculate_errors(a, b, exact_value)
@@ -166,6 +396,7 @@ def main():
     
     # 时间性能测试
     time_performance_test(a, b)
+    print(f"\n{default_cache().summary()}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,171 @@
+import os
+import sys
+import time
+import numpy as np
+from scipy import stats
+from scipy.stats import qmc
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from integration_solution import (NEWTON_COTES, newton_cotes_weights, clenshaw_curtis_weights,
+                                  chebyshev_nodes, admissible_N)
+from instrumentation import instrumented
+
+# 每次传给被积函数的最多点数，限制 (点数, 维数) 坐标数组的内存
+DEFAULT_CHUNK_SIZE = 2**18
+
+
+def rule_nodes_weights(rule, a, b, N):
+    """一维求积公式在 [a, b] 上的节点和权重
+
+    Args:
+        rule: str, 'rectangle'、'trapezoid'、'simpson'、'simpson38'、'boole'
+            或 'clenshaw_curtis'
+        a, b: float, 积分区间
+        N: int, 区间数（不满足公式要求时取不小于它的最小合法值）
+
+    Returns:
+        tuple: (nodes, weights)，积分 ≈ sum(weights * f(nodes))
+    """
+    if rule == "clenshaw_curtis":
+        half = 0.5 * (b - a)
+        return 0.5 * (a + b) + half * chebyshev_nodes(N), half * clenshaw_curtis_weights(N)
+    h = (b - a) / N
+    if rule == "rectangle":
+        return a + h * np.arange(N), np.full(N, h)
+    if rule == "trapezoid":
+        weights = np.full(N + 1, h)
+        weights[[0, -1]] = 0.5 * h
+        return np.linspace(a, b, N + 1), weights
+    if rule in NEWTON_COTES:
+        N = admissible_N(N, NEWTON_COTES[rule][0])
+        return np.linspace(a, b, N + 1), (b - a) / N * newton_cotes_weights(rule, N)
+    raise ValueError(f"未知的求积公式: {rule}")
+
+
+@instrumented(point_dim=1)
+def tensor_product_integrate(f, bounds, N, rule="simpson", chunk_size=DEFAULT_CHUNK_SIZE):
+    """张量积求积公式计算多重积分
+
+    各维取一维公式的节点和权重，网格点按扁平编号分块生成：每块用 np.unravel_index
+    得到各维下标，一次数组求值，不逐点调用被积函数，也不一次性构造整个网格。
+
+    Args:
+        f: callable, 被积函数，f(x) 中 x 的形状为 (点数, 维数)，返回形状为 (点数,) 的数组
+        bounds: sequence, 各维的积分区间 [(a_1, b_1), ..., (a_d, b_d)]
+        N: int 或 sequence, 各维的区间数
+        rule: str, 一维求积公式（见 rule_nodes_weights）
+        chunk_size: int, 每块的最多点数
+
+    Returns:
+        float: 积分值
+    """
+    d = len(bounds)
+    N_values = np.broadcast_to(N, d)
+    grids = [rule_nodes_weights(rule, a, b, int(n)) for (a, b), n in zip(bounds, N_values)]
+    shape = tuple(len(nodes) for nodes, _ in grids)
+    total = int(np.prod(shape))
+    result = 0.0
+    for start in range(0, total, chunk_size):
+        index = np.unravel_index(np.arange(start, min(start + chunk_size, total)), shape)
+        x = np.column_stack([nodes[i] for (nodes, _), i in zip(grids, index)])
+        w = np.prod([weights[i] for (_, weights), i in zip(grids, index)], axis=0)
+        result += np.dot(w, f(x))
+    return result
+
+
+def qmc_sampler(method, d, seed=None):
+    """随机化（scrambled）的 Sobol 或 Halton 序列生成器"""
+    if method == "sobol":
+        return qmc.Sobol(d, scramble=True, seed=seed)
+    if method == "halton":
+        return qmc.Halton(d, scramble=True, seed=seed)
+    raise ValueError(f"未知的准蒙特卡罗序列: {method}")
+
+
+@instrumented(point_dim=1)
+def qmc_integrate(f, bounds, method="sobol", tol=1e-6, replicates=8, batch_size=2**12,
+                  max_points=2**22, confidence=0.95, seed=None):
+    """随机化准蒙特卡罗方法计算多重积分，边计算边估计误差
+
+    用 replicates 个独立随机化的序列同时采样，每批每个序列取 batch_size 个点
+    （Sobol 序列取 2 的幂以保持均衡性），累加各序列的样本均值；各序列的估计相互
+    独立，由它们的标准差得到 t 分布置信区间的半宽作为误差估计。误差估计不超过
+    tol * |积分值| 或总点数达到 max_points 时停止。
+
+    Args:
+        f: callable, 被积函数，f(x) 中 x 的形状为 (点数, 维数)
+        bounds: sequence, 各维的积分区间
+        method: str, 'sobol' 或 'halton'
+        tol: float, 相对误差要求
+        replicates: int, 独立随机化的序列数（至少 2）
+        batch_size: int, 每批每个序列的点数，同时限制单次求值的内存
+        max_points: int, 总点数上限
+        confidence: float, 误差估计的置信水平
+        seed: int, 随机种子
+
+    Returns:
+        tuple: (estimate, error, n_points, history)
+            estimate: 积分值
+            error: 误差估计（置信区间半宽）
+            n_points: 总求值点数
+            history: list, 每批之后的 (总点数, 积分值, 误差估计)
+    """
+    if replicates < 2:
+        raise ValueError("误差估计至少需要 2 个独立随机化的序列")
+    if method == "sobol" and batch_size & (batch_size - 1):
+        raise ValueError(f"Sobol 序列的 batch_size 须为 2 的幂，实际为 {batch_size}")
+    lower, upper = np.asarray(bounds, dtype=float).T
+    volume = np.prod(upper - lower)
+    seeds = np.random.SeedSequence(seed).spawn(replicates)
+    samplers = [qmc_sampler(method, len(bounds), np.random.default_rng(s)) for s in seeds]
+    t_factor = stats.t.ppf(0.5 + confidence / 2, replicates - 1)
+
+    sums = np.zeros(replicates)
+    n_per_replicate = 0
+    history = []
+    while True:
+        for r, sampler in enumerate(samplers):
+            x = qmc.scale(sampler.random(batch_size), lower, upper)
+            sums[r] += np.sum(f(x))
+        n_per_replicate += batch_size
+        means = volume * sums / n_per_replicate
+        estimate = np.mean(means)
+        error = t_factor * np.std(means, ddof=1) / np.sqrt(replicates)
+        n_points = n_per_replicate * replicates
+        history.append((n_points, estimate, error))
+        if error <= tol * abs(estimate) or n_points + batch_size * replicates > max_points:
+            return estimate, error, n_points, history
+
+
+def exp_sum(x):
+    """测试函数 exp(x_1 + ... + x_d)，在 [0, 1]^d 上的积分为 (e - 1)^d"""
+    return np.exp(np.sum(x, axis=1))
+
+
+def main():
+    """主函数：比较张量积 Simpson 公式与准蒙特卡罗方法在不同维数下的精度和代价"""
+    print("被积函数 exp(x_1 + ... + x_d)，积分区域 [0, 1]^d")
+    print("维数\t方法\t\t求值点数\t相对误差\t误差估计\t耗时(秒)")
+    print("-" * 80)
+    for d in range(2, 7):
+        bounds = [(0.0, 1.0)] * d
+        exact = (np.e - 1) ** d
+        # 每维取偶数个区间，网格总点数约为 2e5
+        N = max(2, (int(2e5 ** (1 / d)) - 1) // 2 * 2)
+        points = (N + 1) ** d
+
+        start = time.perf_counter()
+        value = tensor_product_integrate(exp_sum, bounds, N)
+        elapsed = time.perf_counter() - start
+        print(f"{d}\tSimpson\t\t{points}\t\t{abs(value / exact - 1):.2e}\t-\t\t{elapsed:.4f}")
+
+        for method in ("sobol", "halton"):
+            start = time.perf_counter()
+            value, error, n_points, _ = qmc_integrate(exp_sum, bounds, method, tol=1e-5, seed=0)
+            elapsed = time.perf_counter() - start
+            print(f"{d}\t{method}\t\t{n_points}\t\t{abs(value / exact - 1):.2e}\t"
+                  f"{error / exact:.2e}\t{elapsed:.4f}")
+
+
+if __name__ == "__main__":
+    main()
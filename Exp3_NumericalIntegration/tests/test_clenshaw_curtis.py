@@ -0,0 +1,48 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# 添加父目录到路径，以便导入参考实现
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution.integration_solution import (clenshaw_curtis_weights, chebyshev_nodes,
+                                           clenshaw_curtis_method, clenshaw_curtis_adaptive,
+                                           trapezoid_method)
+from instrumentation import measure
+
+def direct_weights(N):
+    """按定义直接计算 Clenshaw-Curtis 权重（O(N^2)），用于对照"""
+    theta = np.pi * np.arange(N + 1) / N
+    j = np.arange(1, N // 2 + 1)
+    b = np.where(j == N / 2, 1.0, 2.0)
+    w = np.array([1 - np.sum(b / (4 * j**2 - 1) * np.cos(2 * j * t)) for t in theta]) * 2 / N
+    w[0] /= 2
+    w[-1] /= 2
+    return w
+
+@pytest.mark.parametrize("N", [2, 3, 8, 17, 64])
+def test_weights_match_direct_formula(N):
+    """测试 FFT 计算的权重与直接公式一致，且对 N 次多项式精确"""
+    w = clenshaw_curtis_weights(N)
+    assert np.allclose(w, direct_weights(N), atol=1e-14), f"N={N} 时 FFT 权重应与直接公式一致，但为 {w}"
+    t = chebyshev_nodes(N)
+    for k in range(N + 1):
+        expected = 2 / (k + 1) if k % 2 == 0 else 0.0
+        assert np.dot(w, t**k) == pytest.approx(expected, abs=1e-13), \
+            f"N={N} 时 t^{k} 在 [-1, 1] 上的积分应为 {expected}，但返回了 {np.dot(w, t**k)}"
+    assert clenshaw_curtis_weights(N) is w, f"N={N} 时应返回缓存的同一个权重数组"
+
+def test_spectral_convergence():
+    """测试光滑被积函数上很小的 N 即达到机器精度，远少于梯形法所需的点数"""
+    exact = np.exp(2.0) - np.exp(-1.0)
+    result = clenshaw_curtis_method(np.exp, -1.0, 2.0, 16)
+    assert result == pytest.approx(exact, rel=1e-14), f"N=16 时应达到机器精度 {exact}，但返回了 {result}"
+    error = abs(trapezoid_method(np.exp, -1.0, 2.0, 16) / exact - 1)
+    assert error > 1e-4, f"N=16 时梯形法的相对误差应远大于机器精度，但为 {error}"
+
+def test_adaptive_reuses_nested_values():
+    """测试 N 加倍时复用之前的函数值，总求值点数为最终的 N+1"""
+    (value, N, error), stats = measure(clenshaw_curtis_adaptive, np.cos, 0.0, 3.0)
+    assert value == pytest.approx(np.sin(3.0), rel=1e-13), f"cos 在 [0, 3] 上的积分应为 {np.sin(3.0)}，但返回了 {value}"
+    assert error < 1e-12, f"误差估计应小于 1e-12，但为 {error}"
+    assert stats.points == N + 1, f"应复用嵌套节点只求值 {N + 1} 个点，但求值了 {stats.points} 个"
@@ -0,0 +1,43 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# 添加父目录到路径，以便导入参考实现
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution.convergence_study import local_orders, fit_order, convergence_study
+from solution.integration_solution import rectangle_method, trapezoid_method
+
+E_MINUS_1 = np.e - 1.0
+
+def test_local_orders_and_fit():
+    """测试精确的幂律误差给出常数局部阶，拟合区间包含该阶"""
+    N = np.array([10, 20, 40, 80])
+    errors = 3.0 * N**-2.0
+    orders = local_orders(N, errors)
+    assert np.allclose(orders, 2.0), f"误差 3/N^2 的局部阶应都为 2，但得到 {orders}"
+    order, (low, high) = fit_order(N, errors * (1 + 1e-3 * np.array([1, -1, 1, -1])))
+    assert low <= 2.0 <= high, f"拟合的置信区间 [{low}, {high}] 应包含真实的阶 2"
+    assert order == pytest.approx(2.0, abs=1e-2), f"拟合的收敛阶应接近 2，但得到 {order}"
+
+@pytest.mark.parametrize("method,expected", [(rectangle_method, 1.0), (trapezoid_method, 2.0)])
+def test_smooth_integrand_orders(method, expected):
+    """测试光滑被积函数上矩形法为一阶、梯形法为二阶，并在稳定后停止"""
+    study = convergence_study(method, np.exp, 0.0, 1.0, E_MINUS_1)
+    name = method.__name__
+    assert study["reason"] == "stable", f"{name} 应因收敛阶稳定而停止，但停止原因为 {study['reason']}"
+    low, high = study["interval"]
+    assert abs(study["order"] - expected) < 0.05, f"{name} 的收敛阶应接近 {expected}，但得到 {study['order']}"
+    assert low - 0.05 <= expected <= high + 0.05, f"{name} 的置信区间 [{low}, {high}] 应包含 {expected}"
+    assert study["N"][-1] < 10000, f"{name} 稳定后应尽早停止，但加密到了 N={study['N'][-1]}"
+
+def test_stops_when_rounding_dominates():
+    """测试误差不再下降时停止，并只用之前的点估计收敛阶"""
+    def noisy(func, a, b, N):
+        # 二阶截断误差加上 1e-9 的误差下限
+        return 1.0 + 5.0 / N**2 + 1e-9
+
+    study = convergence_study(noisy, None, 0.0, 1.0, 1.0, window=50, max_N=2**30)
+    assert study["reason"] == "rounding", f"误差到达下限后应因舍入误差停止，但停止原因为 {study['reason']}"
+    assert study["errors"][-1] > 1e-9, f"最后一个误差应仍高于下限 1e-9，但为 {study['errors'][-1]}"
+    assert study["order"] == pytest.approx(2.0, abs=0.1), f"只用下限之前的点估计的阶应接近 2，但得到 {study['order']}"
@@ -0,0 +1,27 @@
+import sys
+import os
+import pytest
+
+# 添加父目录到路径，以便导入学生代码和参考解
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from integration import f, rectangle_method, trapezoid_method
+from solution import integration_solution as ref
+
+pytestmark = pytest.mark.perf
+
+N = 100000
+
+def test_function_speed(perf):
+    """测试被积函数的耗时与参考解相当"""
+    perf.check(f, ref.f, 0.5, number=2000)
+
+def test_rectangle_method_speed(perf):
+    """测试矩形法的耗时与参考解相当（使用相同的被积函数）"""
+    perf.check(rectangle_method, ref.rectangle_method, ref.f, 0.0, 1.0, N)
+
+def test_trapezoid_method_speed(perf):
+    """测试梯形法的耗时与参考解相当（使用相同的被积函数）"""
+    perf.check(trapezoid_method, ref.trapezoid_method, ref.f, 0.0, 1.0, N)
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--perf", __file__])
@@ -0,0 +1,58 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# 添加父目录到路径，以便导入参考实现
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution.multidim_integration import (rule_nodes_weights, tensor_product_integrate,
+                                           qmc_integrate, exp_sum)
+from solution.integration_solution import trapezoid_method, simpson_method
+from instrumentation import measure
+
+@pytest.mark.parametrize("rule", ["trapezoid", "simpson", "boole", "clenshaw_curtis"])
+def test_nodes_weights_match_1d_rules(rule):
+    """测试一维节点和权重与一维求积结果一致"""
+    x, w = rule_nodes_weights(rule, 0.0, 2.0, 64)
+    result = np.dot(w, np.exp(x))
+    assert result == pytest.approx(np.exp(2.0) - 1, rel=1e-3), f"{rule} 节点上 exp 的积分应为 {np.exp(2.0) - 1}，但为 {result}"
+    x, w = rule_nodes_weights("simpson", 0.0, 2.0, 8)
+    result, expected = np.dot(w, np.exp(x)), simpson_method(np.exp, 0.0, 2.0, 8)
+    assert result == pytest.approx(expected, rel=1e-14), f"Simpson 节点权重应与一维 Simpson 法的 {expected} 一致，但为 {result}"
+
+def test_tensor_product_chunks():
+    """测试分块求值的结果与块大小无关，每块只调用一次被积函数"""
+    bounds = [(0.0, 1.0), (-1.0, 2.0), (0.0, 0.5)]
+    exact = (np.e - 1) * (np.e**2 - np.e**-1) * (np.e**0.5 - 1)
+    whole = tensor_product_integrate(exp_sum, bounds, 10)
+    assert whole == pytest.approx(exact, rel=1e-4), f"三维积分应为 {exact}，但返回了 {whole}"
+    value, stats = measure(tensor_product_integrate, exp_sum, bounds, 10, chunk_size=100)
+    assert value == pytest.approx(whole, rel=1e-13), f"分块求值应与整体求值的 {whole} 一致，但返回了 {value}"
+    assert stats.points == 11**3, f"应求值 {11**3} 个点，但求值了 {stats.points} 个"
+    assert stats.calls == -(-11**3 // 100), f"每块应只调用一次，共 {-(-11**3 // 100)} 次，但调用了 {stats.calls} 次"
+
+def test_tensor_product_matches_nested_1d():
+    """测试二维张量积梯形公式与嵌套调用一维梯形法一致"""
+    g = lambda x: np.cos(x[:, 0]) * x[:, 1]**2
+    nested = trapezoid_method(lambda x: np.cos(x), 0.0, 1.0, 6) * trapezoid_method(lambda y: y**2, 0.0, 1.0, 4)
+    result = tensor_product_integrate(g, [(0.0, 1.0), (0.0, 1.0)], [6, 4], rule="trapezoid")
+    assert result == pytest.approx(nested, rel=1e-13), f"张量积梯形公式应与嵌套一维结果 {nested} 一致，但返回了 {result}"
+
+@pytest.mark.parametrize("method", ["sobol", "halton"])
+def test_qmc_error_estimate(method):
+    """测试准蒙特卡罗积分达到要求的精度，误差估计与真实误差相符，并按批记录"""
+    bounds = [(0.0, 1.0)] * 4
+    exact = (np.e - 1) ** 4
+    estimate, error, n_points, history = qmc_integrate(exp_sum, bounds, method, tol=1e-4,
+                                                       replicates=8, batch_size=256, seed=1)
+    assert error <= 1e-4 * abs(estimate), f"{method} 的误差估计应不超过 1e-4 的相对精度，但为 {error}"
+    assert abs(estimate - exact) < 5 * error, \
+        f"{method} 的真实误差 {abs(estimate - exact)} 应与误差估计 {error} 相符"
+    assert history[-1] == (n_points, estimate, error), f"{method} 的最后一条记录应为最终结果，但为 {history[-1]}"
+    counts = [h[0] for h in history]
+    assert counts == [2048 * (k + 1) for k in range(len(history))], f"{method} 应每批增加 2048 个点，但记录为 {counts}"
+
+def test_qmc_rejects_unbalanced_sobol_batches():
+    """测试 Sobol 序列的批大小必须为 2 的幂"""
+    with pytest.raises(ValueError):
+        qmc_integrate(exp_sum, [(0.0, 1.0)] * 2, batch_size=1000)
@@ -0,0 +1,51 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# 添加父目录到路径，以便导入参考实现
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution.integration_solution import (newton_cotes_weights, simpson_method, simpson38_method,
+                                           boole_method, calculate_convergence_rate)
+from instrumentation import measure
+
+RULES = [(simpson_method, 2, 3, 4), (simpson38_method, 3, 3, 4), (boole_method, 4, 5, 6)]
+
+def test_weights_cached_and_normalized():
+    """测试权重之和等于区间数，同一 (rule, N) 返回同一个只读数组"""
+    for rule, N in [("simpson", 10), ("simpson38", 9), ("boole", 12)]:
+        w = newton_cotes_weights(rule, N)
+        assert w.shape == (N + 1,), f"{rule} 在 N={N} 时应有 {N + 1} 个权重，但形状为 {w.shape}"
+        assert w.sum() == pytest.approx(N), f"{rule} 在 N={N} 时权重之和应为 {N}，但为 {w.sum()}"
+        assert newton_cotes_weights(rule, N) is w, f"{rule} 在 N={N} 时应返回缓存的同一个权重数组"
+        assert not w.flags.writeable, f"{rule} 在 N={N} 时的缓存权重应为只读"
+    w = newton_cotes_weights("simpson", 4)
+    assert np.allclose(w, np.array([1, 4, 2, 4, 1]) / 3), f"simpson 在 N=4 时权重应为 [1, 4, 2, 4, 1]/3，但返回了 {w}"
+
+@pytest.mark.parametrize("method,multiple,degree,order", RULES)
+def test_exact_for_polynomials(method, multiple, degree, order):
+    """测试公式对不超过其代数精度的多项式精确"""
+    poly = np.polynomial.Polynomial(np.arange(1.0, degree + 2))
+    exact = poly.integ()(2.0) - poly.integ()(-1.0)
+    result = method(poly, -1.0, 2.0, 2 * multiple)
+    assert result == pytest.approx(exact, rel=1e-13), \
+        f"{method.__name__} 对 {degree} 次多项式应精确得到 {exact}，但返回了 {result}"
+
+@pytest.mark.parametrize("method,multiple,degree,order", RULES)
+def test_convergence_order(method, multiple, degree, order):
+    """测试光滑被积函数上的收敛阶，且每次计算只对数组求值一次"""
+    N_values = [multiple * 2, multiple * 4, multiple * 8]
+    errors = [abs(method(np.exp, 0.0, 1.0, N) - (np.e - 1)) for N in N_values]
+    rate = calculate_convergence_rate([1.0 / N for N in N_values], errors)
+    assert abs(rate - order) < 0.3, f"{method.__name__} 的收敛阶应接近 {order}，但为 {rate}"
+
+    _, stats = measure(method, np.exp, 0.0, 1.0, N_values[0])
+    assert (stats.calls, stats.array_calls, stats.points) == (1, 1, N_values[0] + 1), \
+        f"{method.__name__} 应一次数组调用求值 {N_values[0] + 1} 个点，但为 {stats}"
+
+def test_invalid_N():
+    """测试 N 不是公式要求的倍数时报错"""
+    with pytest.raises(ValueError):
+        simpson_method(np.exp, 0.0, 1.0, 5)
+    with pytest.raises(ValueError):
+        boole_method(np.exp, 0.0, 1.0, 6)
@@ -1,5 +1,10 @@
+import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
+
+# 绘图经由根目录的 plotting 模块，用到时才导入 matplotlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from plotting import plt
 
 def sum_up(N):
     """从小到大计算调和级数和
@@ -1,5 +1,12 @@
+import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
+
+# 绘图经由根目录的 plotting 模块，用到时才导入 matplotlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from plotting import plt
+from result_cache import default_cache
+from exact_sums import harmonic_reference, true_relative_error
 
 def sum_up(N):
     """从小到大计算调和级数和"""
@@ -21,6 +28,12 @@ def calculate_relative_difference(N):
     s_down = sum_down(N)
     return abs(s_up - s_down) / abs((s_up + s_down) / 2.0)
 
+def calculate_true_errors(N):
+    """计算两种方法相对于精确值（二分拆分求得的有理数）的真实相对误差"""
+    reference = harmonic_reference(N)
+    return (true_relative_error(sum_up(N), reference),
+            true_relative_error(sum_down(N), reference))
+
 def plot_differences():
     """绘制相对差异随N的变化"""
     N_values = np.logspace(1, 4, 50, dtype=int)
@@ -51,13 +64,27 @@ def print_results():
         diff = calculate_relative_difference(N)
         print(f"{N}\t{s_up:.8f}\t{s_down:.8f}\t{diff:.8e}")
 
+def print_true_errors():
+    """打印两种方法相对于精确值的误差"""
+    N_values = [10, 100, 1000, 10000, 10**6]
+    
+    print("\n与精确值比较:")
+    print("N\t精确值\t\t\t正向误差\t反向误差")
+    print("-" * 60)
+    
+    for N in N_values:
+        err_up, err_down = calculate_true_errors(N)
+        print(f"{N}\t{harmonic_reference(N)[0]:.16f}\t{err_up:.2e}\t{err_down:.2e}")
+
 def main():
     """主函数"""
     # 打印计算结果
     print_results()
+    print_true_errors()
     
     # 绘制误差图
     plot_differences()
+    print(f"\n{default_cache().summary()}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,23 @@
+import sys
+import os
+import pytest
+
+# 添加父目录到路径，以便导入学生代码和参考解
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from harmonic_sum import sum_up, sum_down
+from solution import harmonic_sum_solution as ref
+
+pytestmark = pytest.mark.perf
+
+N = 1000000
+
+def test_sum_up_speed(perf):
+    """测试sum_up的耗时与参考解相当"""
+    perf.check(sum_up, ref.sum_up, N)
+
+def test_sum_down_speed(perf):
+    """测试sum_down的耗时与参考解相当"""
+    perf.check(sum_down, ref.sum_down, N)
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--perf", __file__])
@@ -0,0 +1,201 @@
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from series_sum_solution import sum_S1
+
+# S1 的极限值: S_N^(1) = sum_{m=2}^{2N+1} (-1)^m / m  ->  1 - ln 2
+S1_LIMIT = 1.0 - np.log(2.0)
+
+
+def s1_terms(K):
+    """S1 改写为交错级数后的前 K 项 a_k
+
+    把 (-1)^n * n/(n+1) 拆成 (-1)^n - (-1)^n/(n+1)，前 2N 项中 (-1)^n 两两抵消，
+    因此 S_N^(1) = sum_{k=0}^{2N-1} (-1)^k a_k，其中 a_k = 1/(k+2)。
+
+    参数:
+        K (int): 项数
+
+    返回:
+        numpy.ndarray: a_0, ..., a_{K-1}
+    """
+    return 1.0 / np.arange(2, K + 2, dtype=float)
+
+
+def s1_partial_sums(K):
+    """交错级数 sum (-1)^k a_k 的前 K 个部分和
+
+    第 2N-1 个元素（从 0 计）即 S_N^(1)。
+
+    参数:
+        K (int): 部分和个数
+
+    返回:
+        numpy.ndarray: 部分和序列
+    """
+    a = s1_terms(K)
+    signs = np.where(np.arange(K) % 2 == 0, 1.0, -1.0)
+    return np.cumsum(signs * a)
+
+
+def aitken_delta2(s):
+    """迭代 Aitken Δ² 加速
+
+    每一轮用 t_n = s_{n+2} - (Δs_{n+1})^2 / Δ²s_n 生成新序列，直到只剩一个元素。
+
+    参数:
+        s (array_like): 部分和序列
+
+    返回:
+        tuple: (estimate, error)
+            estimate: 加速后的极限估计
+            error: 误差估计（最后两轮估计之差，不低于舍入误差 eps * |estimate|）
+    """
+    s = np.asarray(s, dtype=float)
+    prev_estimate = s[-1]
+    estimate = s[-1]
+    while len(s) >= 3:
+        d1 = s[1:-1] - s[:-2]
+        d2 = s[2:] - s[1:-1]
+        denom = d2 - d1
+        if np.any(denom == 0):
+            break
+        s = s[2:] - d2**2 / denom
+        prev_estimate, estimate = estimate, s[-1]
+    return estimate, max(abs(estimate - prev_estimate), np.finfo(float).eps * abs(estimate))
+
+
+def wynn_epsilon(s):
+    """Wynn ε 算法（等价于 Shanks 变换）
+
+    eps_{k+1}^{(n)} = eps_{k-1}^{(n+1)} + 1 / (eps_k^{(n+1)} - eps_k^{(n)})，
+    偶数列给出 Shanks 变换的结果。
+
+    参数:
+        s (array_like): 部分和序列
+
+    返回:
+        tuple: (estimate, error)
+            estimate: 最深偶数列的最后一个元素
+            error: 误差估计（相邻两个偶数列估计之差，不低于舍入误差 eps * |estimate|）
+    """
+    prev = np.zeros(len(s) + 1)
+    cur = np.asarray(s, dtype=float)
+    estimates = [cur[-1]]
+    k = 0
+    while len(cur) >= 2:
+        diff = cur[1:] - cur[:-1]
+        if np.any(diff == 0):
+            break
+        prev, cur = cur, prev[1:len(cur)] + 1.0 / diff
+        k += 1
+        if k % 2 == 0:
+            estimates.append(cur[-1])
+    if len(estimates) < 2:
+        return estimates[-1], np.inf
+    error = abs(estimates[-1] - estimates[-2])
+    return estimates[-1], max(error, np.finfo(float).eps * abs(estimates[-1]))
+
+
+def euler_transform(a):
+    """Euler 变换求交错级数 sum (-1)^k a_k 的和
+
+    Euler 变换等价于对部分和序列反复取相邻平均，这里采用平均的形式，
+    避免直接计算高阶差分 Δ^n a_0 时的严重抵消。
+
+    参数:
+        a (array_like): 非负项 a_k
+
+    返回:
+        tuple: (estimate, error)
+            estimate: 级数和的估计
+            error: 误差估计（最后两层平均结果之差，不低于舍入误差 eps * |estimate|）
+    """
+    a = np.asarray(a, dtype=float)
+    signs = np.where(np.arange(len(a)) % 2 == 0, 1.0, -1.0)
+    s = np.cumsum(signs * a)
+    prev_estimate = s[-1]
+    while len(s) > 1:
+        prev_estimate = s[-1]
+        s = 0.5 * (s[1:] + s[:-1])
+    return s[0], max(abs(s[0] - prev_estimate), np.finfo(float).eps * abs(s[0]))
+
+
+def cvz_sum(a):
+    """Cohen–Villegas–Zagier 算法求交错级数 sum (-1)^k a_k 的和
+
+    对完全单调的 a_k，用 n 项时相对误差不超过 2 / (3 + sqrt(8))^n，
+    即每多一项约多 0.77 位有效数字。
+
+    参数:
+        a (array_like): 非负项 a_0, ..., a_{n-1}
+
+    返回:
+        tuple: (estimate, error)
+            estimate: 级数和的估计
+            error: 理论误差上界（不低于舍入误差 eps * |estimate|）
+    """
+    a = np.asarray(a, dtype=float)
+    n = len(a)
+    d = (3.0 + np.sqrt(8.0))**n
+    d = (d + 1.0 / d) / 2.0
+    b = -1.0
+    c = -d
+    s = 0.0
+    for k in range(n):
+        c = b - c
+        s += c * a[k]
+        b = (k + n) * (k - n) * b / ((k + 0.5) * (k + 1))
+    estimate = s / d
+    bound = 2.0 * abs(estimate) / (3.0 + np.sqrt(8.0))**n
+    return estimate, max(bound, np.finfo(float).eps * abs(estimate))
+
+
+def accelerate_S1(n_terms=20, method='cvz'):
+    """用 n_terms 项加速计算 S1 的极限 1 - ln 2
+
+    参数:
+        n_terms (int): 使用的交错级数项数
+        method (str): 'euler', 'aitken', 'wynn' 或 'cvz'
+
+    返回:
+        tuple: (estimate, error)
+    """
+    if method == 'euler':
+        return euler_transform(s1_terms(n_terms))
+    if method == 'aitken':
+        return aitken_delta2(s1_partial_sums(n_terms))
+    if method == 'wynn':
+        return wynn_epsilon(s1_partial_sums(n_terms))
+    if method == 'cvz':
+        return cvz_sum(s1_terms(n_terms))
+    raise ValueError(f"未知的加速方法: {method}")
+
+
+def print_results():
+    """比较直接求和与各种加速方法的精度"""
+    print(f"S1 极限值 1 - ln2 = {S1_LIMIT:.16f}")
+    print("\n直接求和:")
+    print("N\t\tS1\t\t\t真实误差")
+    print("-" * 60)
+    for N in [10, 1000, 100000]:
+        s1 = sum_S1(N)
+        print(f"{N}\t\t{s1:.16f}\t{abs(s1 - S1_LIMIT):.2e}")
+
+    print("\n加速方法:")
+    print("方法\t项数\t估计值\t\t\t估计误差\t真实误差")
+    print("-" * 80)
+    for method, n_terms in [('euler', 50), ('aitken', 25), ('wynn', 25), ('cvz', 25)]:
+        estimate, error = accelerate_S1(n_terms, method)
+        print(f"{method}\t{n_terms}\t{estimate:.16f}\t{error:.2e}\t{abs(estimate - S1_LIMIT):.2e}")
+
+
+def main():
+    """主函数"""
+    print_results()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,12 @@
+import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
+
+# 绘图经由根目录的 plotting 模块，用到时才导入 matplotlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from plotting import plt
+from result_cache import cached, default_cache
+from exact_sums import series_reference, true_relative_error
 
 def sum_S1(N):
     """计算第一种形式的级数和：交错级数
@@ -29,6 +36,7 @@ def sum_S3(N):
         result += 1.0 / (2*n * (2*n + 1))
     return result
 
+@cached
 def calculate_relative_errors(N_values):
     """计算相对误差"""
     err1 = []
@@ -44,6 +52,11 @@ def calculate_relative_errors(N_values):
     
     return err1, err2
 
+def calculate_true_errors(N):
+    """计算三种形式相对于精确值（二分拆分求得的有理数）的真实相对误差"""
+    reference = series_reference(N)
+    return tuple(true_relative_error(s(N), reference) for s in (sum_S1, sum_S2, sum_S3))
+
 def plot_errors(N_values, err1, err2):
     """绘制误差分析图"""
     plt.figure(figsize=(10, 6))
@@ -75,6 +88,18 @@ def print_results():
         err2 = abs((s2 - s3) / s3)
         print(f"{N}\t{s1:.8f}\t{s2:.8f}\t{s3:.8f}\t{err1:.2e}\t{err2:.2e}")
 
+def print_true_errors():
+    """打印三种形式相对于精确值的误差"""
+    N_values = [10, 100, 1000, 10000, 10**6]
+    
+    print("\n与精确值比较:")
+    print("N\t精确值\t\t\tS1误差\t\tS2误差\t\tS3误差")
+    print("-" * 80)
+    
+    for N in N_values:
+        err1, err2, err3 = calculate_true_errors(N)
+        print(f"{N}\t{series_reference(N)[0]:.16f}\t{err1:.2e}\t{err2:.2e}\t{err3:.2e}")
+
 def main():
     """主函数"""
     # 生成N值序列
@@ -85,9 +110,11 @@ def main():
     
     # 打印结果
     print_results()
+    print_true_errors()
     
     # 绘制误差图
     plot_errors(N_values, err1, err2)
+    print(f"\n{default_cache().summary()}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,51 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# 添加父目录到路径，以便导入参考实现
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution.series_acceleration import (S1_LIMIT, s1_partial_sums, aitken_delta2,
+                                          wynn_epsilon, euler_transform, cvz_sum,
+                                          accelerate_S1)
+from solution.series_sum_solution import sum_S1
+
+def test_partial_sums_match_S1():
+    """测试改写后的交错级数部分和与S1一致"""
+    s = s1_partial_sums(20)
+    for N in [1, 2, 5, 10]:
+        assert abs(s[2*N - 1] - sum_S1(N)) < 1e-14, f"N={N}时部分和与sum_S1不一致"
+
+@pytest.mark.parametrize("method,n_terms", [("euler", 50), ("aitken", 25), ("wynn", 25), ("cvz", 25)])
+def test_acceleration_accuracy(method, n_terms):
+    """测试各加速方法用几十项即可达到1e-14精度"""
+    estimate, error = accelerate_S1(n_terms, method)
+    assert abs(estimate - S1_LIMIT) < 1e-14, f"{method}方法精度不足"
+    assert error < 1e-13, f"{method}方法的误差估计过大"
+
+def test_error_estimate_is_realistic():
+    """测试误差估计与真实误差同量级"""
+    for transform, seq in [(aitken_delta2, s1_partial_sums(10)),
+                           (wynn_epsilon, s1_partial_sums(10)),
+                           (euler_transform, 1.0 / np.arange(2, 22)),
+                           (cvz_sum, 1.0 / np.arange(2, 12))]:
+        estimate, error = transform(seq)
+        assert abs(estimate - S1_LIMIT) <= 10 * error, f"{transform.__name__}低估了误差"
+
+def test_error_estimate_not_below_rounding():
+    """测试最后两次估计恰好相同时，误差估计仍不低于舍入误差"""
+    eps = np.finfo(float).eps
+    for transform, seq in [(aitken_delta2, np.full(6, 0.5)),
+                           (wynn_epsilon, np.cumsum(0.5**np.arange(8))),
+                           (euler_transform, np.array([0.5, 0.0, 0.0, 0.0]))]:
+        estimate, error = transform(seq)
+        assert error >= eps * abs(estimate) > 0, \
+            f"{transform.__name__}的误差估计 {error} 低于舍入误差 {eps * abs(estimate)}"
+
+def test_unknown_method():
+    """测试未知方法名"""
+    with pytest.raises(ValueError):
+        accelerate_S1(10, "richardson")
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,21 @@
+import sys
+import os
+import pytest
+
+# 添加父目录到路径，以便导入学生代码和参考解
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from series_sum import sum_S1, sum_S2, sum_S3
+from solution import series_sum_solution as ref
+
+pytestmark = pytest.mark.perf
+
+N = 100000
+
+@pytest.mark.parametrize("name", ["sum_S1", "sum_S2", "sum_S3"])
+def test_series_speed(perf, name):
+    """测试三种级数求和的耗时与参考解相当"""
+    func = {"sum_S1": sum_S1, "sum_S2": sum_S2, "sum_S3": sum_S3}[name]
+    perf.check(func, getattr(ref, name), N)
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--perf", __file__])
@@ -1,7 +1,12 @@
+import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
 from scipy.special import spherical_jn
 
+# 绘图经由根目录的 plotting 模块，用到时才导入 matplotlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from plotting import plt
+
 def bessel_up(x, lmax):
     """向上递推计算球贝塞尔函数
     
@@ -0,0 +1,156 @@
+import os
+import sys
+import time
+import hashlib
+import numpy as np
+from scipy.special import spherical_jn
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from bessel_vectorized import bessel_up_array, bessel_down_array, bessel_hybrid
+from plotting import plt
+
+# 参考值缓存目录（相对于当前工作目录）
+DEFAULT_REFERENCE_DIR = 'bessel_reference'
+
+METHODS = {
+    'up': bessel_up_array,
+    'down': bessel_down_array,
+    'hybrid': bessel_hybrid,
+}
+
+
+def reference_grid(x, lmax, cache_dir=DEFAULT_REFERENCE_DIR):
+    """计算（或从磁盘读取）scipy 的参考值网格
+
+    以 x 网格和 lmax 的哈希作为文件名缓存在 cache_dir 中，
+    重复运行时只需读取文件，不再调用 spherical_jn。
+
+    Args:
+        x: array_like, 自变量网格
+        lmax: int, 最大阶数
+        cache_dir: str, 缓存目录
+
+    Returns:
+        numpy.ndarray, 形状为 (n_x, lmax+1) 的参考值
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    key = hashlib.sha256(x.tobytes() + f"{lmax}".encode()).hexdigest()[:24]
+    path = os.path.join(cache_dir, f"spherical_jn_l{lmax}_{key}.npy")
+    if os.path.exists(path):
+        return np.load(path)
+
+    l = np.arange(lmax + 1)
+    ref = spherical_jn(l[None, :], x[:, None])
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+    np.save(tmp_path, ref)
+    os.replace(tmp_path, path)
+    return ref
+
+
+def time_method(method, x, lmax, repeat=3):
+    """测量一种方法的耗时
+
+    Args:
+        method: callable, 形如 f(x, lmax) 的函数
+        x: numpy.ndarray, 自变量网格
+        lmax: int, 最大阶数
+        repeat: int, 重复次数（取最短时间）
+
+    Returns:
+        tuple: (result, seconds_per_value)
+            result: 计算结果
+            seconds_per_value: 每个 j_l(x) 值的平均耗时（秒）
+    """
+    best = np.inf
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with np.errstate(all='ignore'):
+            result = method(x, lmax)
+        best = min(best, time.perf_counter() - start)
+    return result, best / (len(x) * (lmax + 1))
+
+
+def accuracy_map(x, lmax, methods=None, cache_dir=DEFAULT_REFERENCE_DIR, repeat=3):
+    """在 (x, l) 网格上计算各方法的相对误差和耗时
+
+    参考值为 0 或下溢的点相对误差记为 nan。
+
+    Args:
+        x: array_like, 自变量网格
+        lmax: int, 最大阶数
+        methods: list, 方法名列表，默认为 METHODS 中的全部方法
+        cache_dir: str, 参考值缓存目录
+        repeat: int, 计时重复次数
+
+    Returns:
+        tuple: (errors, timings)
+            errors: dict, 方法名 -> 形状为 (n_x, lmax+1) 的相对误差
+            timings: dict, 方法名 -> 每个值的平均耗时（秒）
+    """
+    x = np.asarray(x, dtype=np.float64)
+    ref = reference_grid(x, lmax, cache_dir)
+    valid = np.abs(ref) > np.finfo(float).tiny
+
+    errors = {}
+    timings = {}
+    for name in methods or METHODS:
+        result, timings[name] = time_method(METHODS[name], x, lmax, repeat)
+        with np.errstate(all='ignore'):
+            err = np.abs(result - ref) / np.abs(ref)
+        errors[name] = np.where(valid, err, np.nan)
+    return errors, timings
+
+
+def plot_accuracy_map(x, lmax, errors, filename='bessel_accuracy_map.png'):
+    """绘制各方法相对误差的热图
+
+    Args:
+        x: array_like, 自变量网格
+        lmax: int, 最大阶数
+        errors: dict, accuracy_map 返回的误差
+        filename: str, 图片文件名
+    """
+    fig, axes = plt.subplots(1, len(errors), figsize=(5 * len(errors), 4), squeeze=False)
+    extent = [x[0], x[-1], 0, lmax]
+    for ax, (name, err) in zip(axes[0], errors.items()):
+        with np.errstate(all='ignore'):
+            log_err = np.log10(np.clip(np.nan_to_num(err, nan=np.inf), 1e-17, 1e2))
+        im = ax.imshow(log_err.T, origin='lower', aspect='auto', extent=extent,
+                       vmin=-17, vmax=2, cmap='viridis')
+        ax.plot(x, x, 'w--', lw=1, label='l = x')
+        ax.set_xlim(x[0], x[-1])
+        ax.set_ylim(0, lmax)
+        ax.set_xlabel('x')
+        ax.set_ylabel('l')
+        ax.set_title(name)
+        ax.legend(loc='upper left')
+        fig.colorbar(im, ax=ax, label='log10(Relative Error)')
+    fig.tight_layout()
+    fig.savefig(filename, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+
+
+def print_results(errors, timings):
+    """打印各方法的误差统计和耗时"""
+    print("方法\t中位相对误差\t最大相对误差\t每个值耗时(ns)")
+    print("-" * 60)
+    for name, err in errors.items():
+        median = np.nanmedian(err)
+        worst = np.nanmax(err)
+        print(f"{name}\t{median:.2e}\t{worst:.2e}\t{timings[name] * 1e9:.2f}")
+
+
+def main():
+    """主函数"""
+    lmax = 50
+    x = np.linspace(0.1, 60.0, 600)
+    errors, timings = accuracy_map(x, lmax)
+    print_results(errors, timings)
+    plot_accuracy_map(x, lmax, errors)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,17 @@
+import os
+import sys
+import math
 import numpy as np
-import matplotlib.pyplot as plt
 from scipy.special import spherical_jn
 
+# 绘图经由根目录的 plotting 模块，用到时才导入 matplotlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from plotting import plt
+from result_cache import cached, default_cache
+
+# 向下递推时的动态缩放阈值（与 bessel_vectorized 相同）
+RESCALE_THRESHOLD = 2.0**500
+
 def bessel_up(x, lmax):
     """向上递推计算球贝塞尔函数
     
@@ -47,19 +57,41 @@ def bessel_down(x, lmax, m_start=None):
     j_temp[m_start+1] = 0.0
     j_temp[m_start] = 1.0
     
-    # 向下递推
+    # 向下递推。小 x、高阶时递推值一路增长会溢出：|j| 超过 RESCALE_THRESHOLD 时
+    # 把当前两项同乘 2^(-e)（没有舍入误差），exponent 记录每一项的指数，
+    # 真实（未归一化）值为 j_temp[l] * 2**exponent[l]
+    exponent = np.zeros(m_start + 2, dtype=int)
     for l in range(m_start, 0, -1):
         j_temp[l-1] = (2*l + 1) / x * j_temp[l] - j_temp[l+1]
+        exponent[l-1] = exponent[l]
+        if abs(j_temp[l-1]) > RESCALE_THRESHOLD:
+            shift = math.frexp(j_temp[l-1])[1]
+            j_temp[l-1:l+1] = np.ldexp(j_temp[l-1:l+1], -shift)
+            exponent[l-1:l+1] += shift
     
     # 计算解析的j_0(x)用于归一化
     j0_analytic = np.sin(x) / x if x != 0 else 1.0
     
-    # 归一化
+    # 归一化（真实值低于 float64 下限的高阶项为 0）
     scale = j0_analytic / j_temp[0]
-    j = j_temp[:lmax+1] * scale
+    j = np.ldexp(j_temp[:lmax+1] * scale, exponent[:lmax+1] - exponent[0])
     
     return j
 
+@cached
+def compare_methods(x, lmax):
+    """计算向上递推、向下递推和scipy的结果
+    
+    Args:
+        x: float, 自变量
+        lmax: int, 最大阶数
+        
+    Returns:
+        tuple: (j_up, j_down, j_scipy)
+    """
+    l = np.arange(lmax + 1)
+    return bessel_up(x, lmax), bessel_down(x, lmax), spherical_jn(l, x)
+
 def plot_comparison(x, lmax):
     """绘制不同方法计算结果的比较图
     
@@ -70,9 +102,7 @@ def plot_comparison(x, lmax):
     l = np.arange(lmax + 1)
     
     # 计算三种方法的结果
-    j_up = bessel_up(x, lmax)
-    j_down = bessel_down(x, lmax)
-    j_scipy = spherical_jn(l, x)
+    j_up, j_down, j_scipy = compare_methods(x, lmax)
     
     # 绘制函数值的半对数图
     plt.figure(figsize=(10, 5))
@@ -122,6 +152,7 @@ def main():
             j_down = bessel_down(x, l)[l]
             j_scipy = spherical_jn(l, x)
             print(f"{l}\t{j_up:.6e}\t{j_down:.6e}\t{j_scipy:.6e}")
+    print(f"\n{default_cache().summary()}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
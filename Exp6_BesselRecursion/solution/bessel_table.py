@@ -0,0 +1,185 @@
+import os
+import sys
+import hashlib
+import numpy as np
+from scipy.special import spherical_jn
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import bessel_vectorized
+from bessel_vectorized import bessel_hybrid
+
+# 默认的表格缓存目录（在本模块所在目录下，与运行时的工作目录无关），
+# 可用环境变量 BESSEL_TABLE_DIR 指定其他目录
+DEFAULT_TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bessel_tables')
+
+
+def _generator_hash():
+    """建表代码（本模块和 bessel_vectorized）源码的哈希，改动后旧表格自动失效"""
+    h = hashlib.sha256()
+    for path in (os.path.abspath(__file__), bessel_vectorized.__file__):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+GENERATOR_HASH = _generator_hash()
+
+
+def table_dir():
+    """表格缓存目录：环境变量 BESSEL_TABLE_DIR，未设置时为 DEFAULT_TABLE_DIR"""
+    return os.environ.get('BESSEL_TABLE_DIR', DEFAULT_TABLE_DIR)
+
+
+def table_key(x_grid, lmax, dtype=np.float64):
+    """由 (x 网格, lmax, dtype, 建表代码) 生成表格的唯一键
+
+    Args:
+        x_grid: array_like, 递增的 x 网格
+        lmax: int, 最大阶数
+        dtype: numpy dtype, 表格的数据类型
+
+    Returns:
+        str, 十六进制哈希值
+    """
+    h = hashlib.sha256()
+    h.update(np.ascontiguousarray(x_grid, dtype=np.float64).tobytes())
+    h.update(f"{lmax}:{np.dtype(dtype).str}:{GENERATOR_HASH}".encode())
+    return h.hexdigest()[:24]
+
+
+def table_path(x_grid, lmax, dtype=np.float64, cache_dir=None):
+    """表格文件的路径（cache_dir 默认为 table_dir()）"""
+    if cache_dir is None:
+        cache_dir = table_dir()
+    name = f"bessel_j_l{lmax}_{np.dtype(dtype).name}_{table_key(x_grid, lmax, dtype)}.npy"
+    return os.path.join(cache_dir, name)
+
+
+def load_bessel_table(x_grid, lmax, dtype=np.float64, cache_dir=None):
+    """以内存映射方式加载已有的表格
+
+    Args:
+        x_grid: array_like, 建表时使用的 x 网格
+        lmax: int, 最大阶数
+        dtype: numpy dtype, 表格的数据类型
+        cache_dir: str, 缓存目录（默认为 table_dir()）
+
+    Returns:
+        numpy.memmap 或 None, 形状为 (n_x, lmax+2) 的只读表格；不存在时返回 None
+    """
+    path = table_path(x_grid, lmax, dtype, cache_dir)
+    if not os.path.exists(path):
+        return None
+    return np.load(path, mmap_mode='r')
+
+
+def build_bessel_table(x_grid, lmax, dtype=np.float64, cache_dir=None,
+                       chunk_size=65536):
+    """预计算 j_l(x) 表格并保存为内存映射的 .npy 文件
+
+    表格多存一阶 j_{lmax+1}，插值时用 j_l' = (l j_{l-1} - (l+1) j_{l+1}) / (2l+1)
+    得到导数，无需另存导数表。按 x 分块计算后直接写入映射文件，内存占用与
+    chunk_size 成正比。若相同键的表格已存在则直接加载。
+
+    Args:
+        x_grid: array_like, 递增的 x 网格
+        lmax: int, 最大阶数
+        dtype: numpy dtype, 表格的数据类型
+        cache_dir: str, 缓存目录（默认为 table_dir()）
+        chunk_size: int, 每块计算的 x 点数
+
+    Returns:
+        numpy.memmap, 形状为 (n_x, lmax+2) 的只读表格
+    """
+    x_grid = np.ascontiguousarray(x_grid, dtype=np.float64)
+    if x_grid.ndim != 1 or len(x_grid) < 2 or np.any(np.diff(x_grid) <= 0):
+        raise ValueError("x_grid 必须是至少含两个点的严格递增一维数组")
+
+    table = load_bessel_table(x_grid, lmax, dtype, cache_dir)
+    if table is not None:
+        return table
+
+    path = table_path(x_grid, lmax, dtype, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=dtype,
+                                    shape=(len(x_grid), lmax + 2))
+    for start in range(0, len(x_grid), chunk_size):
+        stop = min(start + chunk_size, len(x_grid))
+        out[start:stop] = bessel_hybrid(x_grid[start:stop], lmax + 1)
+    out.flush()
+    del out
+    # 先写临时文件再改名，其他进程不会读到写了一半的表格
+    os.replace(tmp_path, path)
+    return np.load(path, mmap_mode='r')
+
+
+def interpolate_bessel(table, x_grid, x, l):
+    """在表格上用三次 Hermite 插值计算网格外的 j_l(x)
+
+    插值节点处的函数值和导数均取自表格。由积分表示
+    j_l(x) = (-i)^l / 2 * ∫_{-1}^{1} e^{ixt} P_l(t) dt 及 |P_l| <= 1 可知
+    |j_l''''(x)| <= 1/5，区间长度为 h 时截断误差不超过 h^4 / 1920，
+    再加上表格本身的舍入误差。
+
+    Args:
+        table: numpy.ndarray, build_bessel_table 返回的表格
+        x_grid: array_like, 建表时使用的 x 网格
+        x: array_like, 查询点，须位于网格范围内
+        l: int 或 array_like, 阶数，可与 x 广播
+
+    Returns:
+        tuple: (values, error_bound)，形状为 x 与 l 广播后的形状
+    """
+    x_grid = np.asarray(x_grid, dtype=np.float64)
+    x, l = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(l, dtype=int))
+    lmax = table.shape[1] - 2
+    if np.any(l < 0) or np.any(l > lmax):
+        raise ValueError(f"阶数 l 必须在 0 到 {lmax} 之间")
+    if np.any(x < x_grid[0]) or np.any(x > x_grid[-1]):
+        raise ValueError("查询点超出了表格的 x 范围")
+
+    i = np.clip(np.searchsorted(x_grid, x, side='right') - 1, 0, len(x_grid) - 2)
+    x0, x1 = x_grid[i], x_grid[i + 1]
+    h = x1 - x0
+    t = (x - x0) / h
+
+    def value_and_derivative(row):
+        f = table[row, l].astype(np.float64)
+        upper = table[row, l + 1].astype(np.float64)
+        lower = table[row, np.maximum(l - 1, 0)].astype(np.float64)
+        df = np.where(l == 0, -upper, (l * lower - (l + 1) * upper) / (2 * l + 1))
+        return f, df
+
+    f0, d0 = value_and_derivative(i)
+    f1, d1 = value_and_derivative(i + 1)
+
+    t2 = t * t
+    t3 = t2 * t
+    h00 = 2 * t3 - 3 * t2 + 1
+    h10 = t3 - 2 * t2 + t
+    h01 = -2 * t3 + 3 * t2
+    h11 = t3 - t2
+    values = h00 * f0 + h10 * h * d0 + h01 * f1 + h11 * h * d1
+
+    eps = np.finfo(table.dtype).eps
+    error_bound = h**4 / 1920 + 4 * eps * np.maximum(np.abs(f0), np.abs(f1))
+    return values, error_bound
+
+
+def main():
+    """主函数：建表、重新加载并检查插值误差"""
+    lmax = 25
+    x_grid = np.linspace(0.0, 50.0, 20001)
+    table = build_bessel_table(x_grid, lmax)
+    print(f"表格文件: {table.filename}, 形状: {table.shape}")
+
+    x = np.random.default_rng(0).uniform(0.0, 50.0, 10000)
+    l = np.arange(lmax + 1)
+    values, bound = interpolate_bessel(table, x_grid, x[:, None], l[None, :])
+    err = np.abs(values - spherical_jn(l[None, :], x[:, None]))
+    print(f"最大插值误差: {err.max():.2e}, 误差上界: {bound.max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# 添加父目录到路径，以便导入参考实现
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution import bessel_benchmark
+from solution.bessel_benchmark import reference_grid, accuracy_map, plot_accuracy_map
+
+def test_reference_grid_is_cached(tmp_path, monkeypatch):
+    """测试参考值只计算一次，之后从磁盘读取"""
+    x = np.linspace(0.5, 10.0, 20)
+    first = reference_grid(x, 8, cache_dir=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 1, "参考值应保存到缓存目录"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("命中缓存时不应再调用spherical_jn")
+    monkeypatch.setattr(bessel_benchmark, "spherical_jn", fail)
+    second = reference_grid(x, 8, cache_dir=tmp_path)
+    assert np.array_equal(first, second), "缓存的参考值应与首次计算一致"
+
+def test_accuracy_map(tmp_path):
+    """测试误差图：向上递推在l > x区域失效，混合方法处处准确"""
+    x = np.linspace(0.5, 30.0, 60)
+    lmax = 25
+    errors, timings = accuracy_map(x, lmax, cache_dir=tmp_path, repeat=1)
+    assert set(errors) == {"up", "down", "hybrid"}, "应包含三种方法"
+    for name, err in errors.items():
+        assert err.shape == (len(x), lmax + 1), f"{name}误差数组形状错误"
+        assert timings[name] > 0, f"{name}耗时应为正数"
+    assert np.nanmax(errors["up"]) > 1.0, "向上递推在l > x区域应失效"
+    assert np.nanmax(errors["hybrid"]) < 1e-10, "混合方法应处处准确"
+
+    filename = tmp_path / "map.png"
+    plot_accuracy_map(x, lmax, errors, filename=str(filename))
+    assert filename.exists(), "应生成热图文件"
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,25 @@
+import sys
+import os
+import pytest
+
+# 添加父目录到路径，以便导入学生代码和参考解
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bessel_recursion import bessel_up, bessel_down
+from solution import bessel_recursion_solution as ref
+
+pytestmark = pytest.mark.perf
+
+# x > lmax 时两种递推都不溢出；逐阶重新递推等 O(lmax^2) 的实现会明显变慢
+X = 2000.0
+LMAX = 1000
+
+def test_bessel_up_speed(perf):
+    """测试向上递推的耗时与参考解相当"""
+    perf.check(bessel_up, ref.bessel_up, X, LMAX, number=10)
+
+def test_bessel_down_speed(perf):
+    """测试向下递推的耗时与参考解相当"""
+    perf.check(bessel_down, ref.bessel_down, X, LMAX, number=10)
+
+if __name__ == "__main__":
+    pytest.main(["-v", "--perf", __file__])
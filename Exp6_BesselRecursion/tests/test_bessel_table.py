@@ -0,0 +1,78 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# 添加父目录到路径，以便导入参考实现
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import solution.bessel_table as bessel_table
+from solution.bessel_table import (build_bessel_table, load_bessel_table, table_path,
+                                   interpolate_bessel)
+
+from scipy.special import spherical_jn
+
+def test_build_and_reload(tmp_path):
+    """测试建表后以内存映射方式重新加载"""
+    x_grid = np.linspace(0.0, 20.0, 2001)
+    lmax = 10
+    assert load_bessel_table(x_grid, lmax, cache_dir=tmp_path) is None, "未建表时应返回None"
+
+    table = build_bessel_table(x_grid, lmax, cache_dir=tmp_path)
+    assert table.shape == (len(x_grid), lmax + 2), "表格应多存一阶用于求导"
+    assert isinstance(table, np.memmap), "表格应以内存映射方式加载"
+
+    l = np.arange(lmax + 2)
+    expected = spherical_jn(l[None, :], x_grid[:, None])
+    assert np.allclose(table, expected, rtol=0, atol=1e-14), "表格中的值应与scipy一致"
+
+    reloaded = load_bessel_table(x_grid, lmax, cache_dir=tmp_path)
+    assert reloaded is not None and np.array_equal(reloaded, table), "重新加载的表格应相同"
+
+def test_key_depends_on_grid_lmax_dtype(tmp_path):
+    """测试不同的网格、阶数和数据类型对应不同的文件"""
+    x_grid = np.linspace(0.0, 1.0, 11)
+    paths = {table_path(x_grid, 5, np.float64, tmp_path),
+             table_path(x_grid + 1e-12, 5, np.float64, tmp_path),
+             table_path(x_grid, 6, np.float64, tmp_path),
+             table_path(x_grid, 5, np.float32, tmp_path)}
+    assert len(paths) == 4, "表格的键应区分网格、lmax和dtype"
+
+def test_key_and_directory(tmp_path, monkeypatch):
+    """测试建表代码改动后键随之改变，默认目录与工作目录无关且可由环境变量指定"""
+    x_grid = np.linspace(0.0, 1.0, 11)
+    before = table_path(x_grid, 5, cache_dir=tmp_path)
+    monkeypatch.setattr(bessel_table, "GENERATOR_HASH", "changed")
+    assert table_path(x_grid, 5, cache_dir=tmp_path) != before, "建表代码改动后旧表格应失效"
+
+    monkeypatch.delenv("BESSEL_TABLE_DIR", raising=False)
+    monkeypatch.chdir(tmp_path)
+    path = table_path(x_grid, 5)
+    assert os.path.isabs(path) and os.path.dirname(path) == bessel_table.DEFAULT_TABLE_DIR, \
+        f"默认目录应在模块所在目录下，但为 {path}"
+    monkeypatch.setenv("BESSEL_TABLE_DIR", str(tmp_path / "tables"))
+    assert os.path.dirname(table_path(x_grid, 5)) == str(tmp_path / "tables"), "应使用 BESSEL_TABLE_DIR"
+
+def test_interpolation_within_bound(tmp_path):
+    """测试网格外插值的误差在给出的上界之内"""
+    x_grid = np.linspace(0.0, 30.0, 601)
+    lmax = 15
+    table = build_bessel_table(x_grid, lmax, cache_dir=tmp_path)
+
+    x = np.random.default_rng(1).uniform(0.0, 30.0, 500)
+    l = np.arange(lmax + 1)
+    values, bound = interpolate_bessel(table, x_grid, x[:, None], l[None, :])
+    err = np.abs(values - spherical_jn(l[None, :], x[:, None]))
+    assert np.all(err <= bound), "插值误差应不超过误差上界"
+    assert bound.max() < 1e-8, "网格间距0.05时误差上界应很小"
+
+def test_interpolation_out_of_range(tmp_path):
+    """测试超出表格范围的查询"""
+    x_grid = np.linspace(1.0, 2.0, 11)
+    table = build_bessel_table(x_grid, 3, cache_dir=tmp_path)
+    with pytest.raises(ValueError):
+        interpolate_bessel(table, x_grid, 2.5, 1)
+    with pytest.raises(ValueError):
+        interpolate_bessel(table, x_grid, 1.5, 4)
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
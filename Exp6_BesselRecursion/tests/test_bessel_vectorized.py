@@ -0,0 +1,189 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# 添加父目录到路径，以便导入参考实现
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution.bessel_vectorized import (bessel_up_array, bessel_down_array, bessel_series,
+                                        bessel_hybrid, miller_start_order, spherical_jy,
+                                        spherical_hankel)
+from solution.bessel_recursion_solution import bessel_up, bessel_down
+
+from scipy.special import spherical_jn, spherical_yn
+
+def test_array_shape():
+    """测试返回数组的形状"""
+    x = np.linspace(0.5, 5.0, 7)
+    lmax = 6
+    assert bessel_up_array(x, lmax).shape == (7, lmax + 1), "返回数组形状应为(n_x, lmax+1)"
+    assert bessel_down_array(x, lmax).shape == (7, lmax + 1), "返回数组形状应为(n_x, lmax+1)"
+    assert bessel_down_array(1.0, lmax).shape == (1, lmax + 1), "标量x应视为长度为1的数组"
+
+def test_matches_scalar_versions():
+    """测试数组版本与逐点调用标量版本的结果一致"""
+    x = np.array([0.3, 1.0, 2.5, 10.0])
+    lmax = 15
+    j_up = bessel_up_array(x, lmax)
+    j_down = bessel_down_array(x, lmax)
+    for i, xi in enumerate(x):
+        assert np.allclose(j_up[i], bessel_up(xi, lmax), rtol=1e-12, atol=0), "向上递推结果应与标量版本一致"
+        assert np.allclose(j_down[i], bessel_down(xi, lmax), rtol=1e-12, atol=1e-300), "向下递推结果应与标量版本一致"
+
+def test_down_accuracy():
+    """测试向下递推的精度，包括 sin(x) 的零点附近"""
+    x = np.array([0.1, 1.0, np.pi, 2 * np.pi, 10.0])
+    lmax = 20
+    l = np.arange(lmax + 1)
+    expected = spherical_jn(l[None, :], x[:, None])
+    assert np.allclose(bessel_down_array(x, lmax), expected, rtol=1e-10, atol=1e-15), "向下递推结果应与scipy结果一致"
+
+def test_zero_and_small_x():
+    """测试x=0和x接近0时不再除零"""
+    x = np.array([0.0, 1e-8, 1e-4, -1e-4])
+    lmax = 10
+    l = np.arange(lmax + 1)
+    expected = spherical_jn(l[None, :], x[:, None])
+    for result in (bessel_up_array(x, lmax), bessel_down_array(x, lmax), bessel_series(x, lmax)):
+        assert np.all(np.isfinite(result)), "小x时结果应为有限值"
+        assert np.allclose(result, expected, rtol=1e-12, atol=0), "小x时级数展开结果应准确"
+
+def test_hybrid_full_plane():
+    """测试混合方法在l < x和l > x两个区域都准确"""
+    x = np.linspace(0.0, 40.0, 401)
+    lmax = 30
+    l = np.arange(lmax + 1)
+    expected = spherical_jn(l[None, :], x[:, None])
+    result = bessel_hybrid(x, lmax)
+    assert result.shape == (len(x), lmax + 1), "返回数组形状应为(n_x, lmax+1)"
+    assert np.max(np.abs(result - expected)) < 1e-14, "混合方法的绝对误差应接近机器精度"
+    significant = np.abs(expected) > 1e-250
+    rel_err = np.abs(result - expected)[significant] / np.abs(expected)[significant]
+    assert np.median(rel_err) < 1e-14, "混合方法的相对误差应接近机器精度"
+
+def test_hybrid_beats_single_direction():
+    """测试混合方法在两种单向递推各自失效的区域都不失效"""
+    x = np.array([1.0, 35.0])
+    lmax = 25
+    l = np.arange(lmax + 1)
+    expected = spherical_jn(l[None, :], x[:, None])
+    up_err = np.abs(bessel_up_array(x, lmax) - expected) / np.abs(expected)
+    down_err = np.abs(bessel_down_array(x, lmax, m_start=lmax + 15) - expected) / np.abs(expected)
+    hybrid_err = np.abs(bessel_hybrid(x, lmax) - expected) / np.abs(expected)
+    assert up_err[0].max() > 1.0, "x=1时向上递推应失效"
+    assert down_err[1].max() > 1e-3, "x > lmax时起始阶过低的向下递推应失效"
+    assert hybrid_err.max() < 1e-12, "混合方法在两种情况下都应准确"
+
+def test_miller_start_order():
+    """测试自动起始阶数：足够精确且随x增大而增大"""
+    lmax = 20
+    x = np.array([0.01, 1.0, 10.0, 30.0, 60.0])
+    m = miller_start_order(x, lmax)
+    assert np.all(m > lmax), "起始阶数应大于lmax"
+    assert np.all(np.diff(m) >= 0), "起始阶数应随x增大而增大"
+    assert m[0] < lmax + 15, "小x时起始阶数不应过大"
+    assert m[-1] > 60, "x > lmax时起始阶数应超过x"
+
+    l = np.arange(lmax + 1)
+    expected = spherical_jn(l[None, :], x[:, None])
+    result = bessel_down_array(x, lmax)
+    rel_err = np.abs(result - expected) / np.abs(expected)
+    assert rel_err.max() < 1e-12, "自动起始阶数下向下递推应准确"
+
+def test_miller_start_order_warns_when_not_converged():
+    """测试连分式在 max_iter 层内未收敛时发出警告"""
+    with pytest.warns(RuntimeWarning, match="未收敛"):
+        m = miller_start_order(np.array([1.0, 60.0]), 20, max_iter=5)
+    assert np.all(m > 20), f"未收敛时仍应返回大于 lmax 的起始阶数，但为 {m}"
+
+def test_large_lmax_no_overflow():
+    """测试lmax上千时向下递推不溢出"""
+    lmax = 2000
+    x = np.array([0.01, 0.5, 5.0, 50.0])
+    l = np.arange(lmax + 1)
+    expected = spherical_jn(l[None, :], x[:, None])
+    significant = np.abs(expected) > 1e-280
+    for result in (bessel_down_array(x, lmax), bessel_hybrid(x, lmax)):
+        assert np.all(np.isfinite(result)), "lmax上千时结果应为有限值"
+        rel_err = np.abs(result - expected)[significant] / np.abs(expected)[significant]
+        assert rel_err.max() < 1e-11, "lmax上千时结果应与scipy一致"
+
+def test_scalar_down_no_overflow():
+    """测试标量版本向下递推在小x、高阶时不再溢出为nan"""
+    for x, lmax in ((0.5, 300), (0.01, 1000)):
+        result = bessel_down(x, lmax)
+        expected = spherical_jn(np.arange(lmax + 1), x)
+        assert np.all(np.isfinite(result)), "小x、高阶时结果应为有限值"
+        significant = np.abs(expected) > 1e-280
+        rel_err = np.abs(result - expected)[significant] / np.abs(expected)[significant]
+        assert rel_err.max() < 1e-11, "小x、高阶时结果应与scipy一致"
+
+def test_log_scale_output():
+    """测试对数输出：与线性输出一致，且在下溢区与级数展开一致"""
+    lmax = 1500
+    x = np.array([5e-4, 0.05, 0.5])
+    sign_ref, log_ref = bessel_series(x, lmax, n_terms=12, log_scale=True)
+    for f in (bessel_down_array, bessel_hybrid):
+        linear = f(x, lmax)
+        sign, log_abs = f(x, lmax, log_scale=True)
+        assert np.all(np.isfinite(log_abs)), "对数输出应为有限值"
+        assert np.all(sign == sign_ref), "对数输出的符号应正确"
+        assert np.allclose(log_abs[:, 1:], log_ref[:, 1:], rtol=1e-13, atol=0), "对数输出应与级数展开一致"
+        nonzero = linear != 0
+        assert np.allclose(sign[nonzero] * np.exp(log_abs[nonzero]), linear[nonzero], rtol=1e-12, atol=0), \
+            "对数输出应与线性输出一致"
+
+def test_spherical_jy_values_and_derivatives():
+    """测试j_l、y_l及其导数与scipy一致"""
+    x = np.array([5e-4, 0.1, 1.0, np.pi, 10.0, 45.0])
+    lmax = 30
+    l = np.arange(lmax + 1)[None, :]
+    xc = x[:, None]
+    results = spherical_jy(x, lmax, derivatives=True)
+    expected = (spherical_jn(l, xc), spherical_yn(l, xc),
+                spherical_jn(l, xc, derivative=True), spherical_yn(l, xc, derivative=True))
+    for name, result, ref in zip(("j", "y", "dj", "dy"), results, expected):
+        assert result.shape == (len(x), lmax + 1), f"{name}的形状应为(n_x, lmax+1)"
+        finite = np.isfinite(ref)
+        assert np.all(np.isfinite(result[finite])), f"{name}在有限处应为有限值"
+        scale = np.maximum(np.abs(ref[finite]), 1e-15)
+        assert np.max(np.abs(result[finite] - ref[finite]) / scale) < 1e-10, f"{name}应与scipy一致"
+
+    j, y = spherical_jy(x, lmax)
+    assert np.allclose(j, results[0], rtol=1e-13, atol=1e-300), "是否求导不应影响j_l的值"
+    assert np.array_equal(y, results[1]), "是否求导不应影响y_l的值"
+
+def test_spherical_jy_lmax_zero_derivatives():
+    """测试lmax=0时的导数（不经过递推的分支）"""
+    x = np.array([0.5, 1.0, 2.0, 30.0])
+    j, y, dj, dy = spherical_jy(x, 0, derivatives=True)
+    assert np.allclose(dj[:, 0], spherical_jn(0, x, derivative=True), rtol=1e-12), "j_0'计算错误"
+    assert np.allclose(dy[:, 0], spherical_yn(0, x, derivative=True), rtol=1e-12), "y_0'计算错误"
+    _, dh1 = spherical_hankel(x, 0, derivatives=True)
+    assert np.allclose(dh1[:, 0], spherical_jn(0, x, derivative=True)
+                       + 1j * spherical_yn(0, x, derivative=True), rtol=1e-12), "h_0^(1)的导数计算错误"
+
+def test_spherical_jy_at_zero():
+    """测试x=0处的极限值"""
+    j, y, dj, dy = spherical_jy(0.0, 3, derivatives=True)
+    assert np.array_equal(j[0], [1.0, 0.0, 0.0, 0.0]), "j_l(0)应为δ_l0"
+    assert np.all(y[0] == -np.inf), "y_l(0)应为-inf"
+    assert np.allclose(dj[0], [0.0, 1.0 / 3.0, 0.0, 0.0]), "j_l'(0)只有l=1时为1/3"
+
+def test_spherical_hankel():
+    """测试球汉克尔函数"""
+    x = np.array([0.5, 2.0, 20.0])
+    lmax = 8
+    l = np.arange(lmax + 1)[None, :]
+    xc = x[:, None]
+    h1, dh1 = spherical_hankel(x, lmax, kind=1, derivatives=True)
+    h2 = spherical_hankel(x, lmax, kind=2)
+    assert np.allclose(h1, spherical_jn(l, xc) + 1j * spherical_yn(l, xc), rtol=1e-12), "h^(1)计算错误"
+    assert np.allclose(h2, np.conj(h1)), "实数x时h^(2)应为h^(1)的共轭"
+    assert np.allclose(dh1, spherical_jn(l, xc, derivative=True) + 1j * spherical_yn(l, xc, derivative=True),
+                       rtol=1e-12), "h^(1)的导数计算错误"
+    with pytest.raises(ValueError):
+        spherical_hankel(x, lmax, kind=3)
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
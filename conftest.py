@@ -0,0 +1,147 @@
+"""
+测试的公共配置：可选的性能测试
+
+标记为 perf 的测试默认跳过，用 ``pytest --perf`` 或环境变量 GRADING_PERF=1 启用。
+性能测试把被测函数的耗时与参考解（各实验 solution/ 目录中的同名函数）在同一台
+机器上的耗时相比较，超过规定倍数即失败。参考解的耗时按机器校准一次后缓存在
+.perf_baselines.json 中（可用环境变量 GRADING_PERF_BASELINES 指定其他路径）。
+"""
+
+import os
+import json
+import time
+import hashlib
+import inspect
+import platform
+import numpy as np
+import pytest
+
+BASELINE_FILE = ".perf_baselines.json"
+DEFAULT_MAX_RATIO = 10.0
+# 允许的耗时低于此值（秒）时按此值计，避免极短的计时受噪声影响
+MIN_LIMIT = 1e-3
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "性能测试")
+    group.addoption("--perf", action="store_true", help="运行性能测试（默认跳过）")
+    group.addoption("--perf-ratio", type=float, default=None,
+                    help=f"允许的最大耗时倍数（相对参考解，默认 {DEFAULT_MAX_RATIO:g}）")
+    group.addoption("--perf-recalibrate", action="store_true",
+                    help="忽略已缓存的参考耗时，重新测量")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: 性能测试，与参考解比较耗时（默认跳过）")
+
+
+def perf_enabled(config):
+    return config.getoption("--perf") or os.environ.get("GRADING_PERF") == "1"
+
+
+def pytest_collection_modifyitems(config, items):
+    if perf_enabled(config):
+        return
+    skip = pytest.mark.skip(reason="性能测试默认跳过，使用 --perf 启用")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip)
+
+
+def machine_key():
+    """标识当前机器和运行环境，参考耗时只在相同环境下复用"""
+    return "|".join([platform.node(), platform.machine(), platform.processor(),
+                     platform.python_version(), f"numpy-{np.__version__}"])
+
+
+def best_time(func, args, number=1, repeat=3, limit=None):
+    """重复计时取最短时间
+
+    Args:
+        func: callable, 被计时的函数
+        args: tuple, 调用参数
+        number: int, 每次计时连续调用的次数
+        repeat: int, 最多计时的次数
+        limit: float, 达到此耗时以内即提前结束（避免反复运行很慢的实现）
+
+    Returns:
+        float, 最短的一次计时（秒）
+    """
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        best = min(best, time.perf_counter() - start)
+        if limit is not None and best <= limit:
+            break
+    return best
+
+
+def _describe(arg):
+    if callable(arg):
+        return getattr(arg, "__qualname__", type(arg).__name__)
+    return repr(arg)
+
+
+class PerfChecker:
+    """比较被测函数与参考解的耗时"""
+
+    def __init__(self, path, max_ratio=DEFAULT_MAX_RATIO, recalibrate=False):
+        self.path = path
+        self.max_ratio = max_ratio
+        self.machine = machine_key()
+        self.all_baselines = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.all_baselines = json.load(f)
+            except ValueError:
+                pass
+        if recalibrate:
+            self.all_baselines.pop(self.machine, None)
+        self.baselines = self.all_baselines.setdefault(self.machine, {})
+
+    def _save(self):
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.all_baselines, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def baseline(self, reference, args, number=1):
+        """参考解的耗时（秒），首次使用时测量并缓存
+
+        键中包含参考解源码的哈希，参考解被修改后会重新校准。
+        """
+        source = inspect.getsource(reference)
+        key = (f"{reference.__module__}.{reference.__qualname__}"
+               f"({', '.join(_describe(arg) for arg in args)})x{number}"
+               f":{hashlib.sha256(source.encode()).hexdigest()[:12]}")
+        if key not in self.baselines:
+            self.baselines[key] = best_time(reference, args, number, repeat=5)
+            self._save()
+        return self.baselines[key]
+
+    def check(self, func, reference, *args, number=1, max_ratio=None):
+        """断言 func(*args) 的耗时不超过参考解的 max_ratio 倍
+
+        Returns:
+            float, 耗时与参考解之比
+        """
+        ratio = max_ratio or self.max_ratio
+        base = self.baseline(reference, args, number)
+        limit = max(ratio * base, MIN_LIMIT)
+        elapsed = best_time(func, args, number, limit=limit)
+        assert elapsed <= limit, (
+            f"{func.__name__} 耗时 {elapsed:.3g} 秒，超过参考解 ({base:.3g} 秒) 的 {ratio:g} 倍")
+        return elapsed / base
+
+
+@pytest.fixture(scope="session")
+def perf(request):
+    """性能检查工具，用法: perf.check(被测函数, 参考函数, *参数)"""
+    config = request.config
+    ratio = config.getoption("--perf-ratio") or float(
+        os.environ.get("GRADING_PERF_RATIO", DEFAULT_MAX_RATIO))
+    path = os.environ.get("GRADING_PERF_BASELINES") or str(config.rootpath / BASELINE_FILE)
+    return PerfChecker(path, ratio, config.getoption("--perf-recalibrate"))
@@ -0,0 +1,152 @@
+"""
+调和级数与实验五级数部分和的精确有理值
+
+用二分拆分（binary splitting）计算 sum_{n=a}^{b-1} p(n)/q(n) 的精确分子分母：
+区间对半分开递归求和，再用 P = P1*Q2 + P2*Q1, Q = Q1*Q2 合并，两侧的整数
+位数始终相当。逐项累加 fractions.Fraction 时每一步都要把一个越来越大的数
+与小数相乘（还要约分），总代价是 O(N^2) 的位运算；二分拆分的代价只比最后
+一次大数乘法多一个 log N 因子。
+
+区间较短时用 Python 整数；较长时转为 decimal 模块的整数运算（libmpdec 对
+超大整数使用数论变换乘法，比 Python 的 Karatsuba 乘法快得多）。整个过程
+没有舍入，最后再把 P/Q 正确舍入（round-half-even）为 float64。
+
+N = 10^6 时首次计算调和级数约需 10 秒，实验五的级数约需 20～25 秒；
+harmonic_reference / series_reference 的结果通过 result_cache 保存在磁盘上，
+之后直接读取。
+"""
+
+import math
+import struct
+from decimal import Decimal, Context, MAX_PREC, MAX_EMAX, MIN_EMIN, Inexact
+
+from result_cache import cached
+
+# 精确整数运算的上下文：任何舍入都会触发 Inexact 异常
+EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN, traps=[Inexact])
+
+# 区间长度不超过此值时直接逐项合并
+LEAF_SIZE = 16
+# 区间长度不超过此值时使用 Python 整数，更长的区间使用 Decimal
+INT_SIZE = 256
+
+
+def _split_int(term, a, b):
+    if b - a <= LEAF_SIZE:
+        P, Q = 0, 1
+        for n in range(a, b):
+            p, q = term(n)
+            P, Q = P * q + p * Q, Q * q
+        return P, Q
+    m = (a + b) // 2
+    P1, Q1 = _split_int(term, a, m)
+    P2, Q2 = _split_int(term, m, b)
+    return P1 * Q2 + P2 * Q1, Q1 * Q2
+
+
+def split_sum(term, a, b):
+    """二分拆分计算 sum_{n=a}^{b-1} p(n)/q(n) 的精确值
+
+    Args:
+        term: callable, term(n) 返回整数对 (p, q)，q > 0
+        a, b: int, 求和范围 [a, b)
+
+    Returns:
+        tuple: (P, Q)，整数值的 Decimal，和为 P/Q（未约分），Q > 0
+    """
+    if b - a <= INT_SIZE:
+        P, Q = _split_int(term, a, b)
+        return Decimal(P), Decimal(Q)
+    m = (a + b) // 2
+    P1, Q1 = split_sum(term, a, m)
+    P2, Q2 = split_sum(term, m, b)
+    return (EXACT.add(EXACT.multiply(P1, Q2), EXACT.multiply(P2, Q1)),
+            EXACT.multiply(Q1, Q2))
+
+
+def harmonic_term(n):
+    return 1, n
+
+
+def s1_term(n):
+    """S1 的第 n 项 (-1)^n n/(n+1)，n = 1..2N"""
+    return (-n if n % 2 else n), n + 1
+
+
+def s3_term(n):
+    """S3 的第 n 项 1/(2n(2n+1))，也是 S2 第 n 对项合并后的结果"""
+    return 1, 2 * n * (2 * n + 1)
+
+
+def harmonic_exact(N):
+    """调和级数部分和 H_N = sum_{n=1}^N 1/n 的精确值 (P, Q)"""
+    return split_sum(harmonic_term, 1, N + 1)
+
+
+def series_exact(N):
+    """实验五级数部分和的精确值 (P, Q)
+
+    S2 的第 n 对项 -(2n-1)/(2n) + 2n/(2n+1) 恰好等于 S3 的第 n 项 1/(2n(2n+1))，
+    S1 的第 2n-1、2n 两项之和也是如此，因此三者的精确部分和相同。这里用
+    各项都为正、项数最少的 S3 计算。
+    """
+    return split_sum(s3_term, 1, N + 1)
+
+
+def _is_even(x):
+    return struct.unpack("<q", struct.pack("<d", x))[0] % 2 == 0
+
+
+def round_to_float(P, Q):
+    """把精确有理数 P/Q（Q > 0）正确舍入为 float64（round-half-even）
+
+    先用 40 位十进制除法得到候选值，再把 P 与候选值两侧的中点乘以 Q 精确比较，
+    必要时移到相邻的 float，保证结果与 P/Q 最接近。
+    """
+    P, Q = Decimal(P), Decimal(Q)
+    x = float(Context(prec=40).divide(P, Q))
+    while True:
+        below = math.nextafter(x, -math.inf)
+        above = math.nextafter(x, math.inf)
+        lower = EXACT.multiply(EXACT.divide(EXACT.add(Decimal(x), Decimal(below)), 2), Q)
+        upper = EXACT.multiply(EXACT.divide(EXACT.add(Decimal(x), Decimal(above)), 2), Q)
+        if P < lower:
+            x = below
+        elif P > upper:
+            x = above
+        elif P == lower:
+            return x if _is_even(x) else below
+        elif P == upper:
+            return x if _is_even(x) else above
+        else:
+            return x
+
+
+def double_double(P, Q):
+    """P/Q 的双双精度表示 (hi, lo)：hi 为正确舍入的值，lo 约为剩余部分 P/Q - hi"""
+    P, Q = Decimal(P), Decimal(Q)
+    hi = round_to_float(P, Q)
+    residual = EXACT.subtract(P, EXACT.multiply(Decimal(hi), Q))
+    lo = float(Context(prec=40).divide(residual, Q))
+    return hi, lo
+
+
+@cached
+def harmonic_reference(N):
+    """H_N 的双双精度参考值 (hi, lo)，结果缓存在磁盘上"""
+    return double_double(*harmonic_exact(N))
+
+
+@cached
+def series_reference(N):
+    """实验五级数 S_N 的双双精度参考值 (hi, lo)，结果缓存在磁盘上"""
+    return double_double(*series_exact(N))
+
+
+def true_relative_error(value, reference):
+    """浮点结果相对于双双精度参考值的真实相对误差
+
+    value 与 hi 很接近时 value - hi 没有舍入误差，因此低于 1 ulp 的误差也能分辨。
+    """
+    hi, lo = reference
+    return abs((value - hi) - lo) / abs(hi)
@@ -0,0 +1,148 @@
+"""
+数值方法的函数求值计数
+
+比较不同方法时，除了精度还要看代价：同样的误差，函数求值次数少的方法更好。
+rectangle_method、trapezoid_method、forward_diff、central_diff 等方法都以被积
+（被求导）函数 f 为第一个参数，用 ``@instrumented`` 装饰后，在 ``count_evaluations()``
+上下文中调用时会把 f 换成计数的包装，按方法记录：
+
+    method_calls   方法被调用的次数
+    calls          f 被调用的次数（scalar_calls / array_calls 分别为标量和数组参数）
+    points         f 实际求值的点数（数组参数按元素个数计，多元函数按行计）
+    eval_time      f 的累计耗时（秒）
+    total_time     方法的累计耗时（秒）
+
+不在 count_evaluations() 中时，被装饰的方法只多一次全局变量判断，直接调用原函数。
+
+用法::
+
+    with count_evaluations() as log:
+        trapezoid_method(f, -1, 1, 100)
+    print(log["trapezoid_method"].points)   # 200
+
+    result, stats = measure(trapezoid_method, f, -1, 1, 100)
+"""
+
+import time
+import functools
+import contextlib
+import numpy as np
+
+# 当前的记录（方法名 -> MethodStats），为 None 时不计数
+_log = None
+
+
+class MethodStats:
+    """一个方法的求值统计"""
+
+    __slots__ = ("method_calls", "calls", "scalar_calls", "array_calls", "points",
+                 "eval_time", "total_time")
+
+    def __init__(self):
+        self.method_calls = 0
+        self.calls = 0
+        self.scalar_calls = 0
+        self.array_calls = 0
+        self.points = 0
+        self.eval_time = 0.0
+        self.total_time = 0.0
+
+    def error_per_evaluation(self, error):
+        """误差除以求值点数；没有求值时返回 nan"""
+        return error / self.points if self.points else float("nan")
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"MethodStats({fields})"
+
+
+class CountingFunction:
+    """记录调用次数、求值点数和耗时的函数包装
+
+    point_dim 为每个点的坐标维数（数组的最后 point_dim 个轴），多元函数取 1。
+    """
+
+    def __init__(self, func, stats, point_dim=0):
+        self.func = func
+        self.stats = stats
+        self.point_dim = point_dim
+
+    def __call__(self, x, *args, **kwargs):
+        stats = self.stats
+        start = time.perf_counter()
+        result = self.func(x, *args, **kwargs)
+        stats.eval_time += time.perf_counter() - start
+        stats.calls += 1
+        if np.ndim(x) <= self.point_dim:
+            stats.scalar_calls += 1
+            stats.points += 1
+        else:
+            stats.array_calls += 1
+            stats.points += int(np.prod(np.shape(x)[:np.ndim(x) - self.point_dim]))
+        return result
+
+
+def instrumented(method=None, *, point_dim=0):
+    """让以 f 为第一个参数的数值方法可以在 count_evaluations() 中计数
+
+    f 为多元函数、以形状 (点数, 维数) 的数组求值时用 ``@instrumented(point_dim=1)``。
+    """
+    if method is None:
+        return functools.partial(instrumented, point_dim=point_dim)
+    if getattr(method, "__instrumented__", False):
+        return method
+
+    @functools.wraps(method)
+    def wrapper(f, *args, **kwargs):
+        log = _log
+        if log is None:
+            return method(f, *args, **kwargs)
+        stats = log.get(method.__name__)
+        if stats is None:
+            stats = log[method.__name__] = MethodStats()
+        start = time.perf_counter()
+        try:
+            return method(CountingFunction(f, stats, point_dim), *args, **kwargs)
+        finally:
+            stats.total_time += time.perf_counter() - start
+            stats.method_calls += 1
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+@contextlib.contextmanager
+def count_evaluations():
+    """在上下文中为被装饰的方法计数，返回记录（方法名 -> MethodStats）
+
+    可以嵌套，内层上下文只记录其中的调用。
+    """
+    global _log
+    previous, log = _log, {}
+    _log = log
+    try:
+        yield log
+    finally:
+        _log = previous
+
+
+def measure(method, *args, **kwargs):
+    """调用 method 一次并返回 (结果, MethodStats)，method 不必事先装饰"""
+    method = instrumented(method)
+    with count_evaluations() as log:
+        result = method(*args, **kwargs)
+    return result, log.get(method.__name__, MethodStats())
+
+
+def format_stats(log):
+    """把记录整理成文字表格"""
+    lines = ["方法\t\t\t调用\tf调用\t标量\t数组\t求值点数\tf耗时(秒)\t总耗时(秒)",
+             "-" * 100]
+    for name, stats in log.items():
+        lines.append(f"{name:<20}\t{stats.method_calls}\t{stats.calls}\t{stats.scalar_calls}\t"
+                     f"{stats.array_calls}\t{stats.points}\t\t{stats.eval_time:.6f}\t"
+                     f"{stats.total_time:.6f}")
+    return "\n".join(lines)
@@ -0,0 +1,56 @@
+"""
+各实验共用的绘图入口
+
+实验代码通过 ``from plotting import plt`` 使用 matplotlib.pyplot。这里的 plt 是一个
+代理对象，第一次访问其属性（如 ``plt.figure``）时才真正导入 matplotlib，因此只导入
+数值计算函数（测试和自动评分都是如此）时不会加载 matplotlib。
+
+在没有显示器的 Linux 环境（未设置 DISPLAY 和 WAYLAND_DISPLAY）中，若没有用
+MPLBACKEND 指定后端，则自动使用非交互的 Agg 后端；此时 ``plt.show()`` 直接返回，
+不会阻塞，图像请用 ``plt.savefig`` 保存。
+"""
+
+import os
+import sys
+import importlib
+
+# matplotlib 的非交互后端，这些后端下 show() 没有意义
+NON_INTERACTIVE_BACKENDS = {"agg", "cairo", "pdf", "pgf", "ps", "svg", "template"}
+
+
+def headless():
+    """当前环境是否没有可用的显示器"""
+    if sys.platform.startswith("linux"):
+        return not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    return False
+
+
+def load_pyplot():
+    """导入 matplotlib.pyplot，无显示器且未指定后端时先切换到 Agg"""
+    if "matplotlib.pyplot" not in sys.modules and headless() and not os.environ.get("MPLBACKEND"):
+        import matplotlib
+        matplotlib.use("Agg")
+    return importlib.import_module("matplotlib.pyplot")
+
+
+def show(*args, **kwargs):
+    """显示所有图像；非交互后端下直接返回"""
+    pyplot = load_pyplot()
+    if pyplot.get_backend().lower() in NON_INTERACTIVE_BACKENDS:
+        return
+    pyplot.show(*args, **kwargs)
+
+
+class LazyPyplot:
+    """matplotlib.pyplot 的延迟导入代理"""
+
+    def __getattr__(self, name):
+        if name == "show":
+            return show
+        return getattr(load_pyplot(), name)
+
+    def __dir__(self):
+        return dir(load_pyplot())
+
+
+plt = LazyPyplot()
@@ -0,0 +1,325 @@
+"""
+实验结果的磁盘缓存
+
+以“函数所在模块及其导入的本仓库模块的源码 + 函数名 + 参数 + numpy 版本”的哈希为键，把计算结果保存为
+.npz 文件：结果中的数组（以及纯数值列表）作为 .npz 的成员保存，其余结构以 JSON
+形式保存在同一文件中。代码和参数都没有变化时直接读取文件，不再重新计算。
+
+键里用的是整个模块的源码而不只是函数本身的源码，这样被调用的同模块函数
+（例如 calculate_errors 调用的 forward_diff）改动后缓存也会失效；模块（传递地）
+导入的本仓库模块（例如 instrumentation.py）也计入，见 module_sources。
+作为参数传入的函数按其字节码、常量、默认参数和闭包变量的值计入，因此同一模块中
+不同的 lambda 或闭包不会共用缓存。
+
+缓存目录的总大小超过上限时，按最近使用时间淘汰最旧的文件（LRU）。
+命中和未命中次数记录在 ResultCache.hits / misses 中，summary() 返回统计文字。
+
+用法::
+
+    from result_cache import cached
+
+    @cached
+    def calculate_errors(a, b, exact_value):
+        ...
+
+环境变量:
+    RESULT_CACHE_DIR       缓存目录（默认为当前目录下的 .result_cache）
+    RESULT_CACHE_MAX_MB    缓存目录的大小上限（MB，默认 256）
+    RESULT_CACHE_DISABLE   设为 1 时不使用缓存
+"""
+
+import os
+import ast
+import json
+import types
+import hashlib
+import inspect
+import platform
+import functools
+import numpy as np
+
+# 仓库根目录：module_sources 在此查找被导入的共用模块
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_CACHE_DIR = ".result_cache"
+DEFAULT_MAX_MB = 256
+
+_MISSING = object()
+
+
+def _update(h, value, seen=None):
+    """把参数按类型规范地写入哈希"""
+    if isinstance(value, np.ndarray):
+        h.update(f"ndarray:{value.dtype.str}:{value.shape}:".encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}:{len(value)}:".encode())
+        for item in value:
+            _update(h, item, seen)
+    elif isinstance(value, dict):
+        h.update(f"dict:{len(value)}:".encode())
+        for key in sorted(value, key=repr):
+            _update(h, key, seen)
+            _update(h, value[key], seen)
+    elif callable(value):
+        _update_callable(h, value, set() if seen is None else seen)
+    else:
+        h.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+def _update_code(h, code):
+    """把代码对象的字节码、名字和常量（包括嵌套的代码对象）写入哈希"""
+    h.update(code.co_code)
+    h.update(repr((code.co_names, code.co_varnames, code.co_freevars)).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code(h, const)
+        else:
+            _update(h, const)
+
+
+def _update_callable(h, func, seen):
+    """把函数写入哈希
+
+    Python 函数计入名字、所在模块及其导入模块的源码、自身的字节码和常量、默认
+    参数和闭包变量的值，同一模块中不同的 lambda 或闭包因此得到不同的键；
+    functools.partial 和绑定方法分别计入被包装的函数及其参数或对象。其余可调用
+    对象（内置函数、ufunc、类）按模块名和限定名区分。递归引用自身的闭包只计入
+    一次。
+    """
+    if id(func) in seen:
+        h.update(b"callable:recursive;")
+        return
+    seen.add(id(func))
+    if isinstance(func, functools.partial):
+        h.update(b"partial:")
+        _update(h, (func.func, func.args, func.keywords or {}), seen)
+        return
+    if isinstance(func, types.MethodType):
+        h.update(b"method:")
+        _update(h, (func.__func__, func.__self__), seen)
+        return
+    name = getattr(func, "__qualname__", type(func).__name__)
+    h.update(f"callable:{getattr(func, '__module__', '')}.{name}:".encode())
+    func = inspect.unwrap(func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return
+    _update(h, _source_files(func))
+    _update_code(h, code)
+    _update(h, (func.__defaults__, func.__kwdefaults__ or {}), seen)
+    cells = []
+    for cell in func.__closure__ or ():
+        try:
+            cells.append(cell.cell_contents)
+        except ValueError:  # 尚未赋值的闭包变量
+            cells.append(None)
+    _update(h, cells, seen)
+
+
+_parsed_sources = {}
+
+
+def _read_module(path):
+    """读取源文件并找出其中 import 的模块名（按修改时间缓存解析结果）"""
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    entry = _parsed_sources.get(path)
+    if entry is None or entry[0] != stamp:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        names = []
+        for node in ast.walk(ast.parse(source)):
+            if isinstance(node, ast.Import):
+                names += [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names += [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        entry = _parsed_sources[path] = (stamp, source, names)
+    return entry[1], entry[2]
+
+
+def module_sources(path):
+    """path 及其（传递地）导入的本仓库模块的源码，按相对 ROOT 的路径排序
+
+    用 ast 找出 import 语句，在模块所在目录、其上一级目录和 ROOT 中查找对应的
+    .py 文件（与各模块 sys.path.append 的目录相同），不执行模块代码。
+    第三方库和标准库不在这些目录中，不计入。
+
+    Returns:
+        list: [(相对路径, 源码), ...]
+    """
+    sources = {}
+    pending = [os.path.abspath(path)]
+    while pending:
+        path = pending.pop()
+        if path in sources:
+            continue
+        sources[path], names = _read_module(path)
+        directory = os.path.dirname(path)
+        search = (directory, os.path.dirname(directory), ROOT)
+        for name in names:
+            for base in search:
+                candidate = os.path.join(base, *name.split(".")) + ".py"
+                if os.path.isfile(candidate):
+                    pending.append(os.path.abspath(candidate))
+                    break
+    return sorted((os.path.relpath(path, ROOT), source) for path, source in sources.items())
+
+
+def _source_files(func):
+    """函数所在源文件及其导入的本仓库模块的源码；取不到时退回函数本身的源码"""
+    func = inspect.unwrap(func)
+    try:
+        return module_sources(func.__code__.co_filename)
+    except (AttributeError, OSError, SyntaxError, UnicodeDecodeError):
+        try:
+            return inspect.getsource(func)
+        except (TypeError, OSError):
+            return ""
+
+
+def make_key(*parts):
+    """由若干部分（字符串、数值、数组、嵌套的列表和字典、函数）生成缓存键"""
+    h = hashlib.sha256()
+    _update(h, (np.__version__, platform.python_version()))
+    for part in parts:
+        _update(h, part)
+    return h.hexdigest()[:32]
+
+
+def _is_numeric_list(value):
+    return (isinstance(value, list) and value
+            and all(isinstance(item, (int, float, np.number)) and not isinstance(item, bool)
+                    for item in value))
+
+
+def _pack(value, arrays):
+    """把结果拆成 JSON 骨架和数组，数组放入 arrays 并在骨架中记录其名称"""
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        name = f"a{len(arrays)}"
+        arrays[name] = value
+        return {"__array__": name}
+    if _is_numeric_list(value):
+        name = f"a{len(arrays)}"
+        arrays[name] = np.asarray(value)
+        return {"__list__": name}
+    if isinstance(value, tuple):
+        return {"__tuple__": [_pack(item, arrays) for item in value]}
+    if isinstance(value, list):
+        return [_pack(item, arrays) for item in value]
+    if isinstance(value, dict):
+        return {"__dict__": [[key, _pack(item, arrays)] for key, item in value.items()]}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _unpack(skeleton, arrays):
+    if isinstance(skeleton, list):
+        return [_unpack(item, arrays) for item in skeleton]
+    if isinstance(skeleton, dict):
+        if "__array__" in skeleton:
+            return arrays[skeleton["__array__"]]
+        if "__list__" in skeleton:
+            return arrays[skeleton["__list__"]].tolist()
+        if "__tuple__" in skeleton:
+            return tuple(_unpack(item, arrays) for item in skeleton["__tuple__"])
+        return {key: _unpack(item, arrays) for key, item in skeleton["__dict__"]}
+    return skeleton
+
+
+class ResultCache:
+    """以 .npz 文件保存结果、按 LRU 淘汰的磁盘缓存"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_MB * 2**20):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def get(self, key, default=None):
+        """读取缓存的结果；不存在或文件损坏时返回 default"""
+        path = self.path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files if name != "__skeleton__"}
+                skeleton = json.loads(str(data["__skeleton__"]))
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return default
+        # 用修改时间记录最近一次使用，供 LRU 淘汰
+        os.utime(path)
+        self.hits += 1
+        return _unpack(skeleton, arrays)
+
+    def put(self, key, value):
+        """保存结果，随后按大小上限淘汰最久未用的文件"""
+        arrays = {}
+        skeleton = json.dumps(_pack(value, arrays))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, __skeleton__=np.array(skeleton), **arrays)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """删除最久未用的缓存文件，直到总大小不超过上限"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".npz") and ".tmp" not in name:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        if os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".npz"):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def summary(self):
+        return f"结果缓存: 命中 {self.hits} 次，未命中 {self.misses} 次（{self.cache_dir}）"
+
+
+_default_cache = None
+
+
+def default_cache():
+    """由环境变量配置的全局缓存"""
+    global _default_cache
+    if _default_cache is None:
+        max_mb = float(os.environ.get("RESULT_CACHE_MAX_MB", DEFAULT_MAX_MB))
+        _default_cache = ResultCache(os.environ.get("RESULT_CACHE_DIR", DEFAULT_CACHE_DIR),
+                                     int(max_mb * 2**20))
+    return _default_cache
+
+
+def cached(func):
+    """缓存函数结果的装饰器（键见模块说明），被装饰函数的 .uncached 为原函数"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if os.environ.get("RESULT_CACHE_DISABLE") == "1":
+            return func(*args, **kwargs)
+        cache = default_cache()
+        key = make_key(f"{func.__module__}.{func.__qualname__}", _source_files(func),
+                       args, kwargs)
+        result = cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = func(*args, **kwargs)
+            cache.put(key, result)
+        return result
+
+    wrapper.uncached = func
+    return wrapper
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+统一运行各实验并输出 JSON 结果
+
+示例:
+    python run_experiments.py                       # 运行全部实验（参考解），结果打印到标准输出
+    python run_experiments.py exp2 exp6 -o out.json # 只运行实验二和实验六
+    python run_experiments.py exp3 -p exp3.N=10,100,1000,100000
+    python run_experiments.py exp2 -p exp2.deltas=logspace:-16:-1:31 --plot --output-dir figures
+    python run_experiments.py --impl student        # 运行学生代码而不是参考解
+
+参数值的写法:
+    1.5 / 10            单个数值
+    10,100,1000         逗号分隔的列表
+    logspace:-14:-2:13  numpy.logspace(-14, -2, 13)
+    linspace:0.1:10:5   numpy.linspace(0.1, 10, 5)
+    1,2,1;1,1e5,1       分号分隔的多组（实验一的方程系数）
+
+各实验相互独立，在进程池中并行运行，总耗时取决于最慢的实验。
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from result_cache import ResultCache, make_key, module_sources, default_cache, DEFAULT_CACHE_DIR
+from instrumentation import measure
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# 实验名 -> (目录, 学生模块, 参考解模块)
+MODULES = {
+    "exp1": ("Exp1_QuadraticRoots", "quadratic_solver", "quadratic_solver_solution"),
+    "exp2": ("Exp2_NumericalDifferentiation", "differentiation", "differentiation_solution"),
+    "exp3": ("Exp3_NumericalIntegration", "integration", "integration_solution"),
+    "exp4": ("Exp4_HarmonicSum", "harmonic_sum", "harmonic_sum_solution"),
+    "exp5": ("Exp5_SeriesComparison", "series_sum", "series_sum_solution"),
+    "exp6": ("Exp6_BesselRecursion", "bessel_recursion", "bessel_recursion_solution"),
+}
+
+# 各实验的默认参数（与各自 main() 中的取值相同）
+DEFAULT_PARAMS = {
+    "exp1": {"cases": [[1, 2, 1], [1, 1e5, 1], [0.001, 1000, 0.001]]},
+    "exp2": {"x": 1.0, "deltas": np.logspace(-14, -2, 13).tolist()},
+    "exp3": {"a": -1.0, "b": 1.0, "N": [10, 100, 1000, 10000]},
+    "exp4": {"N": [10, 100, 1000, 10000]},
+    "exp5": {"N": [10, 100, 1000, 10000]},
+    "exp6": {"x": [0.1, 1.0, 10.0], "lmax": 25},
+}
+
+
+def module_path(name, impl="solution"):
+    """某个实验的学生代码或参考解的文件路径"""
+    directory, student, solution = MODULES[name]
+    if impl == "solution":
+        return os.path.join(ROOT, directory, "solution", f"{solution}.py")
+    return os.path.join(ROOT, directory, f"{student}.py")
+
+
+def load_module(name, impl="solution"):
+    """按文件路径加载某个实验的学生代码或参考解
+
+    按路径加载并使用带前缀的模块名，学生代码和参考解可以在同一进程中共存。
+    """
+    path = module_path(name, impl)
+    spec = importlib.util.spec_from_file_location(f"{impl}_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def parse_value(text):
+    """解析命令行中的参数值（写法见模块说明）"""
+    if ";" in text:
+        return [parse_value(part) for part in text.split(";")]
+    for prefix, func in (("logspace:", np.logspace), ("linspace:", np.linspace)):
+        if text.startswith(prefix):
+            start, stop, num = text[len(prefix):].split(":")
+            return func(float(start), float(stop), int(num)).tolist()
+    if "," in text:
+        return [parse_value(part) for part in text.split(",")]
+    number = float(text)
+    return int(number) if number.is_integer() and "." not in text and "e" not in text.lower() else number
+
+
+def parse_params(assignments, names):
+    """把 "exp3.N=10,100" 形式的覆盖项合并到默认参数中
+
+    Returns:
+        dict, 实验名 -> 参数字典
+    """
+    params = {name: dict(DEFAULT_PARAMS[name]) for name in names}
+    for assignment in assignments:
+        key, _, value = assignment.partition("=")
+        name, _, param = key.partition(".")
+        if name not in DEFAULT_PARAMS or param not in DEFAULT_PARAMS[name]:
+            raise ValueError(f"未知的参数: {key}")
+        if name in params:
+            params[name][param] = parse_value(value)
+    return params
+
+
+def as_list(value):
+    return value if isinstance(value, list) else [value]
+
+
+def relative_error(value, exact):
+    return abs((value - exact) / exact)
+
+
+def measure_results(method, f, cases):
+    """对每组参数调用 method(f, *case)，返回结果列表和对应的函数求值点数列表"""
+    results, evaluations = [], []
+    for case in cases:
+        result, stats = measure(method, f, *case)
+        results.append(result)
+        evaluations.append(stats.points)
+    return results, evaluations
+
+
+def measure_errors(method, f, exact, cases):
+    """同 measure_results，但返回相对误差列表和求值点数列表"""
+    results, evaluations = measure_results(method, f, cases)
+    return [relative_error(value, exact) for value in results], evaluations
+
+
+def per_evaluation(errors, evaluations):
+    """每次函数求值对应的误差"""
+    return [error / count if count else float("nan") for error, count in zip(errors, evaluations)]
+
+
+def run_exp1(module, params):
+    """实验一：三种公式求根"""
+    results = []
+    for a, b, c in params["cases"]:
+        results.append({
+            "coefficients": [a, b, c],
+            "standard": module.standard_formula(a, b, c),
+            "alternative": module.alternative_formula(a, b, c),
+            "stable": module.stable_formula(a, b, c),
+        })
+    return {"cases": results}
+
+
+def run_exp2(module, params):
+    """实验二：前向差分和中心差分的误差随步长的变化"""
+    x = float(params["x"])
+    deltas = np.asarray(as_list(params["deltas"]), dtype=float)
+    exact = module.analytical_derivative(x)
+    forward, forward_evals = measure_errors(module.forward_diff, module.f, exact,
+                                            [(x, d) for d in deltas])
+    central, central_evals = measure_errors(module.central_diff, module.f, exact,
+                                            [(x, d) for d in deltas])
+    return {
+        "deltas": deltas,
+        "exact": exact,
+        "forward_errors": forward,
+        "central_errors": central,
+        "forward_evaluations": forward_evals,
+        "central_evaluations": central_evals,
+        "forward_error_per_evaluation": per_evaluation(forward, forward_evals),
+        "central_error_per_evaluation": per_evaluation(central, central_evals),
+        "forward_best_delta": deltas[int(np.argmin(forward))],
+        "central_best_delta": deltas[int(np.argmin(central))],
+    }
+
+
+# 实验三的其他求积公式（复合 Newton-Cotes、Clenshaw-Curtis）: 名称 -> N 须为其倍数
+EXTRA_RULES = {"simpson": 2, "simpson38": 3, "boole": 4, "clenshaw_curtis": 1}
+
+
+def run_exp3(module, params):
+    """实验三：矩形法、梯形法（及其他求积公式）的误差与收敛阶"""
+    a, b = params["a"], params["b"]
+    N_values = [int(N) for N in as_list(params["N"])]
+    exact = 0.5 * np.pi
+    h_values = [(b - a) / N for N in N_values]
+    cases = [(a, b, N) for N in N_values]
+    rect, rect_evals = measure_results(module.rectangle_method, module.f, cases)
+    trap, trap_evals = measure_results(module.trapezoid_method, module.f, cases)
+    rect_errors = [relative_error(value, exact) for value in rect]
+    trap_errors = [relative_error(value, exact) for value in trap]
+    results = {
+        "N": N_values,
+        "h": h_values,
+        "exact": exact,
+        "rectangle": rect,
+        "trapezoid": trap,
+        "rectangle_errors": rect_errors,
+        "trapezoid_errors": trap_errors,
+        "rectangle_evaluations": rect_evals,
+        "trapezoid_evaluations": trap_evals,
+        "rectangle_error_per_evaluation": per_evaluation(rect_errors, rect_evals),
+        "trapezoid_error_per_evaluation": per_evaluation(trap_errors, trap_evals),
+        "rectangle_rate": module.calculate_convergence_rate(h_values, rect_errors),
+        "trapezoid_rate": module.calculate_convergence_rate(h_values, trap_errors),
+    }
+    # 实现了其他求积公式时一并比较（N 取不小于给定值的合法值）
+    for name, multiple in EXTRA_RULES.items():
+        method = getattr(module, f"{name}_method", None)
+        if method is None:
+            continue
+        used_N = [-(-N // multiple) * multiple for N in N_values]
+        used_h = [(b - a) / N for N in used_N]
+        values, evals = measure_results(method, module.f, [(a, b, N) for N in used_N])
+        errors = [relative_error(value, exact) for value in values]
+        results.update({
+            f"{name}_N": used_N,
+            name: values,
+            f"{name}_errors": errors,
+            f"{name}_evaluations": evals,
+            f"{name}_error_per_evaluation": per_evaluation(errors, evals),
+            f"{name}_rate": module.calculate_convergence_rate(used_h, errors),
+        })
+    return results
+
+
+def run_exp4(module, params):
+    """实验四：两种求和顺序的调和级数"""
+    N_values = [int(N) for N in as_list(params["N"])]
+    up = [module.sum_up(N) for N in N_values]
+    down = [module.sum_down(N) for N in N_values]
+    return {
+        "N": N_values,
+        "sum_up": up,
+        "sum_down": down,
+        "relative_difference": [abs(u - d) / abs((u + d) / 2.0) for u, d in zip(up, down)],
+    }
+
+
+def run_exp5(module, params):
+    """实验五：三种形式的级数"""
+    N_values = [int(N) for N in as_list(params["N"])]
+    s1 = [module.sum_S1(N) for N in N_values]
+    s2 = [module.sum_S2(N) for N in N_values]
+    s3 = [module.sum_S3(N) for N in N_values]
+    err1 = [relative_error(x, ref) for x, ref in zip(s1, s3)]
+    err2 = [relative_error(x, ref) for x, ref in zip(s2, s3)]
+    return {"N": N_values, "S1": s1, "S2": s2, "S3": s3, "S1_errors": err1, "S2_errors": err2}
+
+
+def run_exp6(module, params):
+    """实验六：向上和向下递推与 scipy 的比较"""
+    from scipy.special import spherical_jn
+    lmax = int(params["lmax"])
+    l = np.arange(lmax + 1)
+    results = []
+    for x in map(float, as_list(params["x"])):
+        with np.errstate(all="ignore"):
+            up = module.bessel_up(x, lmax)
+            down = module.bessel_down(x, lmax)
+            ref = spherical_jn(l, x)
+            results.append({"x": x, "up": up, "down": down, "scipy": ref,
+                            "up_errors": np.abs((up - ref) / ref),
+                            "down_errors": np.abs((down - ref) / ref)})
+    return {"lmax": lmax, "results": results}
+
+
+# 绘图函数使用（可能来自缓存的）JSON 结果，调用各实验自己的绘图函数
+
+def plot_exp2(module, params, results):
+    module.plot_errors(results["deltas"], results["forward_errors"], results["central_errors"])
+
+
+def plot_exp3(module, params, results):
+    module.plot_errors(results["h"], results["rectangle_errors"], results["trapezoid_errors"])
+
+
+def plot_exp4(module, params, results):
+    # 参考解的 plot_differences 自带 N 的取值范围
+    module.plot_differences()
+
+
+def plot_exp5(module, params, results):
+    module.plot_errors(results["N"], results["S1_errors"], results["S2_errors"])
+
+
+def plot_exp6(module, params, results):
+    for entry in results["results"]:
+        module.plot_comparison(entry["x"], results["lmax"])
+
+
+RUNNERS = {
+    "exp1": run_exp1,
+    "exp2": run_exp2,
+    "exp3": run_exp3,
+    "exp4": run_exp4,
+    "exp5": run_exp5,
+    "exp6": run_exp6,
+}
+
+PLOTTERS = {
+    "exp2": plot_exp2,
+    "exp3": plot_exp3,
+    "exp4": plot_exp4,
+    "exp5": plot_exp5,
+    "exp6": plot_exp6,
+}
+
+
+def to_json(value):
+    """把结果转换为可写入 JSON 的类型，非有限浮点数记为 null"""
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [to_json(item) for item in value]
+    if isinstance(value, (np.integer, np.bool_)):
+        return value.item()
+    if isinstance(value, (float, np.floating)):
+        return float(value) if np.isfinite(value) else None
+    return value
+
+
+def experiment_key(name, params, impl):
+    """实验结果的缓存键：实验代码及其导入的本仓库模块和本脚本的源码、参数、numpy 版本"""
+    return make_key(name, impl, params, module_sources(module_path(name, impl)), RUNNERS[name])
+
+
+def run_experiment(name, params, impl="solution", plot=False, output_dir=".",
+                   cache_dir=DEFAULT_CACHE_DIR):
+    """运行一个实验（在进程池的工作进程中调用）
+
+    cache_dir 不为 None 时先查结果缓存，命中则不再计算（也不加载实验模块，
+    除非需要绘图）。图像由各实验自己的绘图函数保存在当前目录，因此绘图前
+    先切换到 output_dir。
+
+    Returns:
+        dict, 包含实验名、参数、结果（或错误信息）、缓存是否命中和耗时
+    """
+    start = time.perf_counter()
+    record = {"experiment": name, "impl": impl, "params": params}
+    cwd = os.getcwd()
+    try:
+        results = None
+        if cache_dir is not None:
+            cache = ResultCache(cache_dir, default_cache().max_bytes)
+            key = experiment_key(name, params, impl)
+            results = cache.get(key)
+            record["cache"] = "miss" if results is None else "hit"
+        module = load_module(name, impl) if results is None or plot else None
+        if results is None:
+            results = to_json(RUNNERS[name](module, params))
+            if cache_dir is not None:
+                cache.put(key, results)
+        record["results"] = results
+        if plot and name in PLOTTERS:
+            os.makedirs(output_dir, exist_ok=True)
+            os.chdir(output_dir)
+            PLOTTERS[name](module, params, results)
+    except Exception as exc:
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    finally:
+        os.chdir(cwd)
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def run_experiments(names, params, impl="solution", plot=False, output_dir=".", workers=None,
+                    cache_dir=DEFAULT_CACHE_DIR):
+    """在进程池中并行运行多个实验
+
+    Returns:
+        list, 与 names 顺序相同的结果
+    """
+    output_dir = os.path.abspath(output_dir)
+    if cache_dir is not None:
+        cache_dir = os.path.abspath(cache_dir)
+    workers = workers or min(len(names), os.cpu_count() or 1)
+    if workers == 1:
+        return [run_experiment(name, params[name], impl, plot, output_dir, cache_dir)
+                for name in names]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_experiment, name, params[name], impl, plot, output_dir,
+                               cache_dir)
+                   for name in names]
+        return [future.result() for future in futures]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("experiments", nargs="*", metavar="EXP",
+                        help=f"要运行的实验，可选 {', '.join(RUNNERS)}（默认全部）")
+    parser.add_argument("-p", "--param", action="append", default=[], metavar="EXP.NAME=VALUE",
+                        help="覆盖参数，如 exp3.N=10,100,1000 或 exp2.deltas=logspace:-14:-2:13")
+    parser.add_argument("--impl", choices=["solution", "student"], default="solution",
+                        help="运行参考解还是学生代码")
+    parser.add_argument("--plot", action="store_true", help="同时生成各实验的图像")
+    parser.add_argument("--output-dir", default=".", help="图像的保存目录")
+    parser.add_argument("-o", "--output", default=None, help="JSON 结果文件（默认打印到标准输出）")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="并行进程数")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="结果缓存目录")
+    parser.add_argument("--no-cache", action="store_true", help="不读写结果缓存，全部重新计算")
+    parser.add_argument("--list", action="store_true", help="列出各实验的默认参数")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print(json.dumps(DEFAULT_PARAMS, indent=2))
+        return 0
+
+    names = args.experiments or list(RUNNERS)
+    unknown = sorted(set(names) - set(RUNNERS))
+    if unknown:
+        parser.error(f"未知的实验: {', '.join(unknown)}")
+    try:
+        params = parse_params(args.param, names)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    # 参考解中用 @cached 装饰的函数（如实验六的 compare_methods）使用同一缓存目录
+    if args.no_cache:
+        os.environ["RESULT_CACHE_DISABLE"] = "1"
+    else:
+        os.environ["RESULT_CACHE_DIR"] = os.path.abspath(args.cache_dir)
+
+    records = run_experiments(names, params, args.impl, args.plot, args.output_dir, args.workers,
+                              None if args.no_cache else args.cache_dir)
+    text = json.dumps(records, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if not args.no_cache:
+        hits = [record["experiment"] for record in records if record.get("cache") == "hit"]
+        misses = [record["experiment"] for record in records if record.get("cache") == "miss"]
+        print(f"结果缓存: 命中 {len(hits)} 个实验 {hits}，未命中 {len(misses)} 个 {misses}",
+              file=sys.stderr)
+    for record in records:
+        if "error" in record:
+            print(f"{record['experiment']} 出错: {record['error']}", file=sys.stderr)
+    return 1 if any("error" in record for record in records) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
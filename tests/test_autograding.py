@@ -0,0 +1,181 @@
+import sys
+import os
+import json
+import multiprocessing
+import pytest
+
+# 添加评分脚本所在目录到路径，以便导入评分模块
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             ".github", "classroom"))
+import autograding
+from autograding import (parse_requirements, install_dependencies, read_results,
+                         score_file, reset_worker, grade_batch, run_tests)
+
+# 虚构的实验，测试文件中有 4 个测试
+EXPERIMENT = {"name": "实验", "file": "exp/tests/test_exp.py", "points": 10,
+              "perf": "exp/tests/test_exp_performance.py"}
+
+# 虚构实验的测试：一个通过、一个失败、一个超时，最后一个检查导入的学生模块
+EXPERIMENT_TESTS = """
+import time
+import helper
+
+def test_passes():
+    assert True
+
+def test_fails():
+    assert False
+
+def test_sleeps():
+    time.sleep(10)
+
+def test_helper():
+    assert helper.VALUE == 1
+"""
+
+def make_submission(root, value):
+    """在 root 下生成一份虚构作业，helper.VALUE 为 value（为 1 时 test_helper 通过）"""
+    tests = root / "exp" / "tests"
+    tests.mkdir(parents=True)
+    (root / "pytest.ini").write_text("")
+    (tests / "test_exp.py").write_text(EXPERIMENT_TESTS)
+    (tests / "helper.py").write_text(f"VALUE = {value}\n")
+    return root
+
+def test_parse_requirements(tmp_path):
+    """测试不借助 packaging 解析包名和版本约束"""
+    path = tmp_path / "requirements.txt"
+    path.write_text("numpy>=1.20,<3  # 注释\n-r other.txt\n\nscipy\npytest[testing] == 8.0\n"
+                    "matplotlib; python_version > '3.8'\n")
+    assert parse_requirements(path) == [("numpy", ">=1.20,<3"), ("scipy", ""),
+                                         ("pytest", "== 8.0"), ("matplotlib", "")]
+
+def test_install_skipped_when_stamp_matches(tmp_path, monkeypatch):
+    """测试依赖已满足时不调用 pip，且第二次运行由记录文件直接跳过"""
+    calls = []
+    monkeypatch.setattr(autograding.subprocess, "run", lambda *args, **kwargs: calls.append(args))
+    requirements, stamp = tmp_path / "requirements.txt", tmp_path / "stamp.json"
+    requirements.write_text("pytest\n")
+    assert not install_dependencies(requirements, stamp), "依赖已满足时不应安装"
+    assert json.loads(stamp.read_text())["installed"]["pytest"] == pytest.__version__
+    assert not install_dependencies(requirements, stamp)
+    assert calls == [], "依赖已满足时不应调用 pip"
+
+def test_install_runs_pip_when_missing(tmp_path, monkeypatch):
+    """测试缺少依赖时调用 pip，且不写入记录文件（下次仍会检查）"""
+    calls = []
+    monkeypatch.setattr(autograding.subprocess, "run", lambda *args, **kwargs: calls.append(args))
+    requirements, stamp = tmp_path / "requirements.txt", tmp_path / "stamp.json"
+    requirements.write_text("pytest\nno-such-package-for-grading\n")
+    assert install_dependencies(requirements, stamp), "缺少依赖时应安装"
+    assert len(calls) == 1 and "pip" in calls[0][0], f"应调用一次 pip，但调用为 {calls}"
+    assert not stamp.exists(), "安装后仍不满足时不应写入记录文件"
+
+def test_read_results(tmp_path):
+    """测试同一测试多个阶段取最严重的结果，并忽略不完整的最后一行"""
+    path = tmp_path / "results.jsonl"
+    records = [{"event": "collected", "nodeid": "a::t1"},
+               {"event": "collected", "nodeid": "a::t2"},
+               {"event": "collect_error", "nodeid": "b"},
+               {"event": "report", "nodeid": "a::t1", "outcome": "passed"},
+               {"event": "report", "nodeid": "a::t1", "outcome": "failed"},
+               {"event": "report", "nodeid": "a::t2", "outcome": "timeout"},
+               {"event": "report", "nodeid": "a::t2", "outcome": "failed"}]
+    path.write_text("".join(json.dumps(record) + "\n" for record in records) + '{"event": "rep')
+    collected, outcomes, collect_errors = read_results(path)
+    assert collected == ["a::t1", "a::t2"]
+    assert outcomes == {"a::t1": "failed", "a::t2": "timeout"}, f"应保留最严重的结果，但为 {outcomes}"
+    assert collect_errors == ["b"]
+    assert read_results(tmp_path / "missing.jsonl") == ([], {}, [])
+
+def outcomes_of(*results, perf=()):
+    """构造虚构实验的收集结果和测试结果"""
+    collected = [f"{EXPERIMENT['file']}::test_{k}" for k in range(len(results))]
+    collected += [f"{EXPERIMENT['perf']}::test_{k}" for k in range(len(perf))]
+    return collected, dict(zip(collected, results + tuple(perf)))
+
+@pytest.mark.parametrize("results,status,points", [
+    (("passed",) * 4, "通过", 10),
+    (("passed", "skipped", "failed", "failed"), "部分通过", 5),
+    (("passed", "timeout", "failed", "failed"), "超时", 2.5),
+    (("failed",) * 4, "失败", 0),
+])
+def test_score_file(results, status, points):
+    """测试按通过的测试函数给部分分"""
+    collected, outcomes = outcomes_of(*results)
+    result = score_file(EXPERIMENT, collected, outcomes, [])
+    assert (result["status"], result["points"]) == (status, points), \
+        f"结果为 {results} 时应为 {status} {points} 分，但为 {result}"
+    assert result["total_tests"] == 4
+
+def test_score_file_errors_and_perf():
+    """测试收集失败和会话超时得 0 分，性能不达标时按比例扣分"""
+    collected, outcomes = outcomes_of("passed", "passed")
+    assert score_file(EXPERIMENT, collected, outcomes, [EXPERIMENT["file"]])["points"] == 0
+    assert score_file(EXPERIMENT, [], {}, [], timed_out=True)["status"] == "超时"
+    assert score_file(EXPERIMENT, [], {}, [])["status"] == "失败"
+
+    collected, outcomes = outcomes_of("passed", "passed", perf=("passed", "failed"))
+    result = score_file(EXPERIMENT, collected, outcomes, [], perf_penalty=0.2)
+    assert result["perf_failed_tests"] == 1
+    assert result["points"] == 8, f"性能不达标时应扣除 20%，但得分为 {result['points']}"
+    assert score_file(EXPERIMENT, collected, outcomes, [])["points"] == 10, "默认不应扣分"
+
+def test_reset_worker(tmp_path, monkeypatch):
+    """测试评完一份作业后删除它导入的模块并恢复搜索路径"""
+    monkeypatch.setattr(autograding, "_baseline_modules", set(sys.modules))
+    monkeypatch.setattr(autograding, "_baseline_path", list(sys.path))
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    (tmp_path / "student_module.py").write_text("VALUE = 1\n")
+    sys.path.insert(0, str(tmp_path))
+    import student_module
+    reset_worker()
+    assert "student_module" not in sys.modules, "作业导入的模块应被删除"
+    assert str(tmp_path) not in sys.path, "作业加入的搜索路径应被恢复"
+    assert "pytest" in sys.modules, "预热时已导入的模块应保留"
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="虚构的实验列表需要通过 fork 传给工作进程")
+def test_grade_batch(tmp_path, monkeypatch):
+    """测试同一个预热进程依次评两份作业，同名学生模块互不影响，并写出汇总表"""
+    monkeypatch.setattr(autograding, "TESTS", [EXPERIMENT])
+    make_submission(tmp_path / "submissions" / "alice", 1)
+    make_submission(tmp_path / "submissions" / "bob", 2)
+    prefix = tmp_path / "batch"
+    records = grade_batch(tmp_path / "submissions", workers=1, test_timeout=0.5,
+                          output_prefix=prefix)
+    assert [record["student"] for record in records] == ["alice", "bob"]
+    alice, bob = (record["tests"][0] for record in records)
+    assert (alice["status"], alice["points"], alice["timeout_tests"]) == ("超时", 5, 1), \
+        f"alice 应通过 2 个、超时 1 个测试，但结果为 {alice}"
+    assert bob["points"] == 2.5, f"bob 不应用到 alice 的 helper 模块，但结果为 {bob}"
+    score = json.loads((tmp_path / "submissions" / "bob" / "score.json").read_text())
+    assert score["score"] == 2.5
+    assert (tmp_path / "batch.csv").read_text().splitlines()[1:] == \
+        ["alice,5.0,5.0,10", "bob,2.5,2.5,10"]
+
+@pytest.mark.parametrize("experiment_timeout,passed,timeouts", [(300, 2, 1), (0.3, 1, 2)])
+def test_single_mode_timeouts(tmp_path, monkeypatch, experiment_timeout, passed, timeouts):
+    """测试单份评分时超时的测试被 SIGALRM 中断，超出实验预算后其余测试记为超时"""
+    monkeypatch.chdir(make_submission(tmp_path, 1))
+    collected, outcomes, collect_errors, timed_out = run_tests(
+        [EXPERIMENT["file"]], test_timeout=0.5, experiment_timeout=experiment_timeout)
+    assert not timed_out, "单个测试超时不应导致整个会话超时"
+    result = score_file(EXPERIMENT, collected, outcomes, collect_errors)
+    assert (result["passed_tests"], result["timeout_tests"]) == (passed, timeouts), \
+        f"实验预算为 {experiment_timeout} 秒时应通过 {passed} 个、超时 {timeouts} 个测试，但结果为 {result}"
+    assert (result["status"], result["points"]) == ("超时", 10 * passed / 4)
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="虚构的实验列表需要通过 fork 传给工作进程")
+def test_batch_mode_experiment_budget(tmp_path, monkeypatch):
+    """测试批量评分时实验预算同样生效，且不影响下一份作业"""
+    monkeypatch.setattr(autograding, "TESTS", [EXPERIMENT])
+    make_submission(tmp_path / "submissions" / "alice", 1)
+    make_submission(tmp_path / "submissions" / "carol", 1)
+    records = grade_batch(tmp_path / "submissions", workers=1, test_timeout=0.5,
+                          experiment_timeout=0.3, output_prefix=tmp_path / "batch")
+    for record in records:
+        result = record["tests"][0]
+        assert (result["passed_tests"], result["timeout_tests"], result["points"]) == (1, 2, 2.5), \
+            f"{record['student']} 超出实验预算后其余测试应记为超时，但结果为 {result}"
@@ -0,0 +1,51 @@
+import sys
+import os
+from fractions import Fraction
+import pytest
+
+# 添加仓库根目录到路径，以便导入精确求和模块
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import result_cache
+import exact_sums
+from exact_sums import (split_sum, harmonic_exact, series_exact, s1_term, round_to_float,
+                        double_double, harmonic_reference, true_relative_error)
+
+def as_fraction(PQ):
+    P, Q = PQ
+    return Fraction(int(P), int(Q))
+
+@pytest.mark.parametrize("N", [1, 2, 17, 300, 2000])
+def test_exact_sums_match_fraction(N):
+    """测试二分拆分的结果与逐项累加 Fraction 相同（包括跨过 Python 整数/Decimal 分界的区间）"""
+    assert as_fraction(harmonic_exact(N)) == sum(Fraction(1, n) for n in range(1, N + 1))
+    S3 = sum(Fraction(1, 2 * n * (2 * n + 1)) for n in range(1, N + 1))
+    assert as_fraction(series_exact(N)) == S3
+    # S1 的 2N 项之和与 S3 精确相等
+    assert as_fraction(split_sum(s1_term, 1, 2 * N + 1)) == S3
+
+def test_correct_rounding():
+    """测试舍入结果与 Fraction 的正确舍入一致，恰在中点时取偶数尾数"""
+    for N in (3, 10, 1000):
+        value = as_fraction(harmonic_exact(N))
+        assert round_to_float(value.numerator, value.denominator) == float(value)
+    assert round_to_float(1, 3) == 1 / 3
+    assert round_to_float(2**53 + 1, 2**53) == 1.0
+    assert round_to_float(2**53 + 3, 2**53) == 1 + 2**-51
+
+def test_double_double():
+    """测试 hi + lo 比 hi 更接近精确值，真实误差可以分辨低于 1 ulp 的差别"""
+    P, Q = harmonic_exact(1000)
+    hi, lo = double_double(P, Q)
+    exact = Fraction(int(P), int(Q))
+    assert abs(exact - Fraction(hi) - Fraction(lo)) < abs(exact - Fraction(hi)) * 1e-10
+    assert true_relative_error(hi, (hi, lo)) == abs(lo) / hi
+
+def test_reference_is_persisted(tmp_path, monkeypatch):
+    """测试参考值保存在缓存中，再次调用时不重新计算"""
+    monkeypatch.setenv("RESULT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(result_cache, "_default_cache", None)
+    expected = harmonic_reference.uncached(500)
+    assert harmonic_reference(500) == expected
+    monkeypatch.setattr(exact_sums, "double_double", None)
+    assert harmonic_reference(500) == expected
+    assert result_cache.default_cache().hits == 1
@@ -0,0 +1,66 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# 添加仓库根目录到路径，以便导入计数模块
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import instrumentation
+from instrumentation import instrumented, count_evaluations, measure
+
+@instrumented
+def left_sum(f, a, b, N):
+    h = (b - a) / N
+    return sum(f(a + h * k) for k in range(N)) * h
+
+@instrumented
+def vector_sum(f, a, b, N):
+    x = np.linspace(a, b, N)
+    return np.sum(f(x)) * (b - a) / N
+
+def test_counts_scalar_and_array_calls():
+    """测试分别记录标量、数组调用和求值点数"""
+    with count_evaluations() as log:
+        left_sum(np.sin, 0, 1, 10)
+        left_sum(np.sin, 0, 1, 5)
+        vector_sum(np.sin, 0, 1, 100)
+    stats = log["left_sum"]
+    assert (stats.method_calls, stats.calls, stats.scalar_calls, stats.points) == (2, 15, 15, 15)
+    stats = log["vector_sum"]
+    assert (stats.calls, stats.array_calls, stats.points) == (1, 1, 100)
+    assert stats.total_time >= stats.eval_time > 0
+
+def test_disabled_outside_context():
+    """测试不在上下文中时不计数，结果不变"""
+    assert instrumentation._log is None
+    assert left_sum(lambda x: x, 0, 1, 4) == pytest.approx(0.375)
+    with count_evaluations() as log:
+        pass
+    assert log == {}
+
+def test_nested_contexts():
+    """测试嵌套的上下文各自记录，退出后恢复外层"""
+    with count_evaluations() as outer:
+        left_sum(np.cos, 0, 1, 3)
+        with count_evaluations() as inner:
+            left_sum(np.cos, 0, 1, 4)
+        left_sum(np.cos, 0, 1, 5)
+    assert inner["left_sum"].points == 4
+    assert outer["left_sum"].points == 8
+
+def test_measure_undecorated_method():
+    """测试 measure 可以直接用于未装饰的方法（例如学生代码），出错时也恢复状态"""
+    def central(f, x, h):
+        return (f(x + h) - f(x - h)) / (2 * h)
+
+    value, stats = measure(central, np.exp, 0.0, 1e-5)
+    assert value == pytest.approx(1.0)
+    assert stats.points == 2
+    assert stats.error_per_evaluation(0.5) == 0.25
+
+    def broken(f, x):
+        raise ValueError("broken")
+
+    with pytest.raises(ValueError):
+        measure(broken, np.exp, 0.0)
+    assert instrumentation._log is None
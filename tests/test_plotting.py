@@ -0,0 +1,44 @@
+import sys
+import os
+import subprocess
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 各实验中提供数值函数的模块（学生模板和参考解）
+MODULES = [
+    "Exp2_NumericalDifferentiation/differentiation.py",
+    "Exp3_NumericalIntegration/integration.py",
+    "Exp4_HarmonicSum/harmonic_sum.py",
+    "Exp5_SeriesComparison/series_sum.py",
+    "Exp6_BesselRecursion/bessel_recursion.py",
+    "Exp2_NumericalDifferentiation/solution/differentiation_solution.py",
+    "Exp3_NumericalIntegration/solution/integration_solution.py",
+    "Exp4_HarmonicSum/solution/harmonic_sum_solution.py",
+    "Exp5_SeriesComparison/solution/series_sum_solution.py",
+    "Exp6_BesselRecursion/solution/bessel_recursion_solution.py",
+    "Exp6_BesselRecursion/solution/bessel_benchmark.py",
+]
+
+def run_headless(code):
+    """在没有显示器的环境中运行一段代码，返回其标准输出"""
+    env = {k: v for k, v in os.environ.items()
+           if k not in ("DISPLAY", "WAYLAND_DISPLAY", "MPLBACKEND")}
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_does_not_load_matplotlib(module):
+    """测试只导入数值函数时不加载matplotlib"""
+    directory, name = os.path.split(module)
+    code = (f"import sys; sys.path.insert(0, {directory!r}); import {name[:-3]}; "
+            "print('matplotlib' in sys.modules)")
+    assert run_headless(code) == "False", f"导入{module}时不应加载matplotlib"
+
+def test_headless_uses_agg_and_show_returns():
+    """测试无显示器时使用Agg后端，且plt.show()不阻塞"""
+    code = ("from plotting import plt; plt.figure(); plt.plot([0, 1]); plt.show(); "
+            "print(plt.get_backend().lower())")
+    assert run_headless(code) == "agg", "无显示器时应使用Agg后端"
@@ -0,0 +1,128 @@
+import sys
+import os
+import time
+import numpy as np
+
+# 添加仓库根目录到路径，以便导入缓存模块
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import result_cache
+from result_cache import ResultCache, make_key, cached
+from run_experiments import parse_params, run_experiments, module_path
+from result_cache import module_sources
+
+def test_round_trip(tmp_path):
+    """测试嵌套结构（数组、数值列表、元组、字典、None）保存后原样读出"""
+    cache = ResultCache(tmp_path)
+    value = (np.linspace(0, 1, 5), [1.0, 2.5], {"name": "x", "roots": None, "n": [1, 2]}, 3.0)
+    cache.put("k", value)
+    loaded = cache.get("k")
+    assert isinstance(loaded, tuple)
+    assert np.array_equal(loaded[0], value[0])
+    assert loaded[1:] == value[1:]
+    assert cache.get("missing") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_key_depends_on_arguments():
+    """测试缓存键随参数变化"""
+    assert make_key("f", [1, 2]) == make_key("f", [1, 2])
+    assert make_key("f", [1, 2]) != make_key("f", [1, 3])
+    assert make_key("f", np.arange(3)) != make_key("f", np.arange(3.0))
+
+def test_lru_eviction(tmp_path):
+    """测试超过大小上限时淘汰最久未用的结果"""
+    cache = ResultCache(tmp_path, max_bytes=10**9)
+    for key in ("a", "b", "c"):
+        cache.put(key, np.zeros(1000))
+    now = time.time()
+    for age, key in enumerate(("b", "a", "c")):
+        os.utime(cache.path(key), (now - 100 * (3 - age),) * 2)
+    cache.get("b")  # 读取会刷新使用时间，b 变为最近使用
+    cache.max_bytes = 2 * os.path.getsize(cache.path("a"))
+    cache.evict()
+    assert sorted(os.listdir(tmp_path)) == ["b.npz", "c.npz"], "应淘汰最久未用的a"
+
+def test_key_distinguishes_callables():
+    """测试同一模块中不同的lambda、闭包和默认参数得到不同的缓存键"""
+    assert make_key(lambda t: t + 1) != make_key(lambda t: t * 100), "不同的lambda应得到不同的键"
+
+    def scaled(c):
+        return lambda t: c * t
+    assert make_key(scaled(2.0)) == make_key(scaled(2.0)), "相同闭包变量应得到相同的键"
+    assert make_key(scaled(2.0)) != make_key(scaled(3.0)), "闭包变量不同时键应不同"
+
+    def power(t, p=2):
+        return t ** p
+    def cube(t, p=3):
+        return t ** p
+    assert make_key(power) != make_key(cube), "默认参数不同时键应不同"
+    assert make_key(np.sin) != make_key(np.cos), "不同的ufunc应得到不同的键"
+
+def test_cached_callable_arguments(tmp_path, monkeypatch):
+    """测试以函数为参数时不同的lambda不会读到彼此的缓存结果"""
+    monkeypatch.setenv("RESULT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(result_cache, "_default_cache", None)
+
+    @cached
+    def apply(f, x):
+        return f(x)
+
+    assert apply(lambda t: t + 1, 1.0) == 2.0
+    assert apply(lambda t: t * 100, 1.0) == 100.0, "不同的lambda不应命中同一缓存"
+
+def test_cached_decorator(tmp_path, monkeypatch):
+    """测试装饰器在参数不变时直接返回缓存结果"""
+    monkeypatch.setenv("RESULT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(result_cache, "_default_cache", None)
+    calls = []
+
+    @cached
+    def sweep(n):
+        calls.append(n)
+        return np.arange(n), [0.5] * n
+
+    first = sweep(4)
+    second = sweep(4)
+    sweep(5)
+    assert calls == [4, 5], "相同参数只应计算一次"
+    assert np.array_equal(first[0], second[0]) and first[1] == second[1]
+    cache = result_cache.default_cache()
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_runner_uses_cache(tmp_path):
+    """测试统一运行脚本第二次运行时命中缓存且结果相同"""
+    names = ["exp4", "exp5"]
+    params = parse_params(["exp4.N=10,100", "exp5.N=10"], names)
+    first = run_experiments(names, params, workers=1, cache_dir=tmp_path)
+    second = run_experiments(names, params, workers=1, cache_dir=tmp_path)
+    assert [record["cache"] for record in first] == ["miss", "miss"]
+    assert [record["cache"] for record in second] == ["hit", "hit"]
+    assert [record["results"] for record in first] == [record["results"] for record in second]
+
+def test_key_covers_imported_modules(tmp_path):
+    """测试缓存键覆盖实验代码导入的本仓库模块（包括间接导入的）"""
+    files = dict(module_sources(module_path("exp2")))
+    assert "instrumentation.py" in files and "result_cache.py" in files
+    (tmp_path / "main.py").write_text("import numpy as np\nfrom helper import g\n")
+    (tmp_path / "helper.py").write_text("import inner\n")
+    (tmp_path / "inner.py").write_text("x = 1\n")
+    before = make_key(module_sources(tmp_path / "main.py"))
+    (tmp_path / "inner.py").write_text("x = 2\n")
+    assert make_key(module_sources(tmp_path / "main.py")) != before, "间接导入的模块改动后缓存键应改变"
+
+def test_decorator_key_covers_imported_modules(tmp_path, monkeypatch):
+    """测试装饰器的缓存键在被导入的模块改动后改变"""
+    monkeypatch.setenv("RESULT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(result_cache, "_default_cache", None)
+    (tmp_path / "experiment.py").write_text(
+        "from result_cache import cached\nfrom helper import g\n\n"
+        "@cached\ndef run(x):\n    return g(x)\n")
+    (tmp_path / "helper.py").write_text("def g(x):\n    return x\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import experiment
+    experiment.run(1.0)
+    experiment.run(1.0)
+    cache = result_cache.default_cache()
+    assert (cache.hits, cache.misses) == (1, 1), "源码不变时第二次调用应命中缓存"
+    (tmp_path / "helper.py").write_text("def g(x):\n    return 2 * x\n")
+    experiment.run(1.0)
+    assert cache.misses == 2, "被导入的模块改动后缓存应失效"
@@ -0,0 +1,48 @@
+import sys
+import os
+import json
+import numpy as np
+import pytest
+
+# 添加仓库根目录到路径，以便导入运行脚本
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from run_experiments import parse_value, parse_params, run_experiments, main, DEFAULT_PARAMS
+
+def test_parse_value():
+    """测试命令行参数值的解析"""
+    assert parse_value("10") == 10
+    assert parse_value("1e5") == 1e5
+    assert parse_value("10,100,1000") == [10, 100, 1000]
+    assert np.allclose(parse_value("logspace:-14:-2:13"), np.logspace(-14, -2, 13))
+    assert parse_value("1,2,1;1,1e5,1") == [[1, 2, 1], [1, 1e5, 1]]
+
+def test_parse_params_overrides_defaults():
+    """测试参数覆盖只影响指定的实验，未知参数报错"""
+    params = parse_params(["exp4.N=10,20"], ["exp4", "exp5"])
+    assert params["exp4"]["N"] == [10, 20]
+    assert params["exp5"] == DEFAULT_PARAMS["exp5"]
+    with pytest.raises(ValueError):
+        parse_params(["exp4.M=10"], ["exp4"])
+
+def test_run_experiments_in_pool():
+    """测试在进程池中运行多个实验，结果顺序与请求一致"""
+    names = ["exp5", "exp4", "exp6"]
+    params = parse_params(["exp4.N=10,1000", "exp5.N=10", "exp6.x=1.0", "exp6.lmax=5"], names)
+    records = run_experiments(names, params, workers=2, cache_dir=None)
+    assert [record["experiment"] for record in records] == names
+    assert all("error" not in record for record in records)
+    assert records[1]["results"]["sum_up"][0] == pytest.approx(2.9289682539682538)
+    assert len(records[2]["results"]["results"][0]["up"]) == 6
+
+def test_main_writes_json_and_plots(tmp_path, monkeypatch):
+    """测试命令行入口输出JSON文件并按需绘图"""
+    monkeypatch.setenv("MPLBACKEND", "Agg")
+    # main() 会设置 RESULT_CACHE_DIR，先交给 monkeypatch 以便测试后恢复
+    monkeypatch.setenv("RESULT_CACHE_DIR", str(tmp_path / "cache"))
+    output = tmp_path / "results.json"
+    status = main(["exp2", "-p", "exp2.deltas=1e-6,1e-3", "--plot", "--cache-dir", str(tmp_path / "cache"),
+                   "--output-dir", str(tmp_path), "-o", str(output), "-j", "1"])
+    assert status == 0
+    records = json.loads(output.read_text(encoding="utf-8"))
+    assert records[0]["results"]["deltas"] == [1e-6, 1e-3]
+    assert (tmp_path / "error_vs_stepsize.png").exists(), "应在输出目录中生成图像"